@@ -0,0 +1,75 @@
+"""
+Benchmark near-duplicate detection against applicant count.
+
+Plants renamed copies of synthetic applications (benchmarks/synthetic.py)
+with 10% of the words of their long text replaced, then times signature hashing and
+clustering (which should grow roughly linearly) and reports how many
+planted pairs were clustered together and how many other rows were.
+
+Run with: python benchmarks/bench_dedup.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from data_loading import merge_application_fields  # noqa: E402
+from dedup import compute_signatures, find_clusters  # noqa: E402
+from synthetic import DOMAIN_WORDS, make_applications, make_evaluations  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+DUPLICATE_SHARE = 0.02
+EDIT_SHARE = 0.1
+EDITED_FIELDS = ['Science_Inputs', 'Bold_Characteristics', 'Problem_Addressed']
+
+
+def _edited(text, rng):
+    """text with EDIT_SHARE of its words replaced by random domain words."""
+    words = np.array(text.split(), dtype=object)
+    edits = rng.choice(len(words), int(len(words) * EDIT_SHARE), replace=False)
+    words[edits] = rng.choice(DOMAIN_WORDS, len(edits))
+    return ' '.join(words)
+
+
+def make_duplicates(n, seed=0):
+    """The n synthetic applicants with an application, plus planted near-duplicates; returns (frame, pairs)."""
+    rng = np.random.default_rng(seed)
+    evaluations = make_evaluations(n, seed)
+    frame = merge_application_fields(evaluations, make_applications(evaluations, seed))
+    # Applicants without an application differ only in their generated name and email
+    frame = frame[frame['Science_Inputs'].fillna('').str.len() > 0].reset_index(drop=True)
+    originals = rng.choice(len(frame), int(n * DUPLICATE_SHARE), replace=False)
+    copies = frame.iloc[originals].copy()
+    copies['Venture_Name'] = [f'Renamed venture {k}' for k in range(len(copies))]
+    for field in EDITED_FIELDS:
+        copies[field] = [_edited(text, rng) if text else text for text in copies[field]]
+    pairs = np.column_stack([originals, np.arange(len(frame), len(frame) + len(copies))])
+    return pd.concat([frame, copies], ignore_index=True), pairs
+
+
+def main():
+    print('Applicants   signatures   clustering   pairs found   other rows flagged')
+    for n in SIZES:
+        frame, pairs = make_duplicates(n)
+        start = time.perf_counter()
+        signatures = compute_signatures(frame)
+        hashed = time.perf_counter()
+        cluster, _ = find_clusters(signatures)
+        clustered = time.perf_counter()
+
+        found = np.mean((cluster[pairs[:, 0]] >= 0) & (cluster[pairs[:, 0]] == cluster[pairs[:, 1]]))
+        planted = np.zeros(len(frame), dtype=bool)
+        planted[pairs.ravel()] = True
+        others = int(np.count_nonzero((cluster >= 0) & ~planted))
+        print(f'{len(frame):>10,}   {hashed - start:9.2f}s   {clustered - hashed:9.2f}s   '
+              f'{found:10.1%}   {others:>18}')
+
+
+if __name__ == '__main__':
+    main()
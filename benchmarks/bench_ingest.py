@@ -0,0 +1,63 @@
+"""
+Benchmark incremental ingest of new applications.
+
+Appends 50 evaluations (and their applications) to synthetic datasets of
+growing size and times LiveDataset.refresh(), which should stay roughly
+flat as the base grows.
+
+Run with: python benchmarks/bench_ingest.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ingest import LiveDataset  # noqa: E402
+from synthetic import make_applications, make_evaluations  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+DELTA = 50
+ROUNDS = 3
+
+
+def append_csv(path, rows):
+    with open(path, 'a', encoding='utf-8') as f:
+        rows.to_csv(f, header=False, index=False)
+
+
+def time_refresh(n, workdir):
+    workdir = Path(workdir)
+    eval_path, app_path = workdir / f'eval_{n}.csv', workdir / f'apps_{n}.csv'
+    total = n + DELTA * ROUNDS
+    evaluations = make_evaluations(total)
+    apps = make_applications(evaluations)
+
+    # Start from the first n rows, then feed the rest in batches
+    evaluations.iloc[:n].to_csv(eval_path, index=False)
+    apps.iloc[:n].to_csv(app_path, index=False)
+    dataset = LiveDataset(str(eval_path), str(app_path), cache_dir=workdir / 'cache')
+    dataset.refresh()
+
+    timings = []
+    for start in range(n, total, DELTA):
+        append_csv(eval_path, evaluations.iloc[start:start + DELTA])
+        append_csv(app_path, apps.iloc[start:start + DELTA])
+        began = time.perf_counter()
+        dataset.refresh()
+        timings.append(time.perf_counter() - began)
+    return min(timings)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        print(f'Base rows   refresh (+{DELTA} applicants)')
+        for n in SIZES:
+            print(f'{n:>9,}   {time_refresh(n, workdir) * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark resident memory of the loaded dataset.
+
+Compares the legacy representation (object text columns, float64 scores,
+long application text inside the frame) with the compact one LiveDataset
+holds (categoricals, float32 scores, long text in a memory-mapped
+TextStore) and the lazy one (no long text at all: it is read from the
+application export by byte offset), each with its FilterIndex. Each measurement runs in a fresh
+process against a warm cache, as a restarted server would, and reports the
+frame's own size plus the growth of VmRSS over the imports alone, split
+into anonymous memory and file-backed (mmap) pages the OS can reclaim.
+
+The dataset is a cache_resource shared by every Streamlit session, so this
+is also the per-session cost of the applicant data.
+
+Run with: python benchmarks/bench_memory.py
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+from synthetic import write_dataset  # noqa: E402
+
+SIZES = [10_000, 100_000]
+MODES = ['legacy', 'compact', 'lazy']
+
+
+def rss():
+    """Resident memory of this process in MB: (total, anonymous, file-backed)."""
+    fields = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if key in ('VmRSS', 'RssAnon', 'RssFile'):
+                fields[key] = int(value.split()[0]) / 1024
+    return fields['VmRSS'], fields['RssAnon'], fields['RssFile']
+
+
+def load(mode, eval_path, app_path, cache_dir):
+    """Build the dataset as mode would hold it; runs in the child process."""
+    import pandas as pd
+
+    from data_loading import load_compact, load_merged
+    from filters import FilterIndex
+    from ingest import _patchable
+
+    before = rss()
+    if mode == 'legacy':
+        frame, texts = load_merged(eval_path, app_path, cache_dir), None
+        frame = frame.astype({column: object if isinstance(dtype, pd.CategoricalDtype) else 'float64'
+                              for column, dtype in frame.dtypes.items()
+                              if isinstance(dtype, pd.CategoricalDtype) or dtype == 'float32'})
+    else:
+        frame, texts = load_compact(eval_path, app_path, cache_dir, lazy=mode == 'lazy')
+    frame = _patchable(frame)
+    # As LiveDataset: in lazy mode the search index covers the frame's columns only
+    filter_index = FilterIndex(frame, texts=None if mode == 'lazy' else texts)
+    after = rss()
+    assert filter_index.counts
+    return [frame.memory_usage(deep=True).sum() / 2**20] + [a - b for a, b in zip(after, before)]
+
+
+def measure(mode, eval_path, app_path, cache_dir):
+    code = (
+        'import json, sys; sys.path[:0] = {path!r}; import bench_memory; '
+        'print(json.dumps(bench_memory.load({args})))'
+    ).format(path=[str(BENCH_DIR), str(BENCH_DIR.parent)], args=', '.join(repr(str(a)) for a in (mode, eval_path, app_path, cache_dir)))
+    out = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        print('Applicants   mode     frame MB   RSS MB   anon MB   mmap MB')
+        for n in SIZES:
+            eval_path, app_path = write_dataset(n, workdir)
+            cache_dir = workdir / f'cache_{n}'
+            # Warm the Parquet and text caches
+            measure('compact', eval_path, app_path, cache_dir)
+            measure('lazy', eval_path, app_path, cache_dir)
+            for mode in MODES:
+                size, total, anon, mapped = measure(mode, eval_path, app_path, cache_dir)
+                print(f'{n:>10,}   {mode:<8} {size:8.1f} {total:8.1f}  {anon:8.1f}  {mapped:8.1f}')
+
+
+if __name__ == '__main__':
+    main()
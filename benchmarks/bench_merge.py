@@ -0,0 +1,83 @@
+"""
+Benchmark the evaluation/application merge in load_data().
+
+Compares the vectorized merge against the original per-row Email lookup
+and shows that the merge scales linearly up to 100k applicants.
+
+Run with: python benchmarks/bench_merge.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from data_loading import merge_application_fields, normalize_email  # noqa: E402
+from synthetic import make_applications, make_evaluations  # noqa: E402
+
+MERGE_SIZES = [1_000, 10_000, 100_000]
+LEGACY_SIZES = [250, 500, 1_000, 2_000]
+
+
+def make_frames(n, seed=0):
+    """Synthetic evaluation and application frames with n applicants."""
+    eval_df = make_evaluations(n, seed)
+    return eval_df, make_applications(eval_df, seed)
+
+
+def legacy_merge(eval_df, orig_df):
+    """The original per-row loop from load_data(), kept as a reference.
+
+    It matched emails exactly; the export's emails are normalized first so
+    that it pairs the same rows as the vectorized merge.
+    """
+    eval_df = eval_df.copy()
+    orig_df = orig_df.assign(Email=normalize_email(orig_df['Email']))
+    for idx, row in eval_df.iterrows():
+        email = row['Email']
+        orig_match = orig_df[orig_df['Email'] == email]
+        if len(orig_match) > 0:
+            orig = orig_match.iloc[0]
+            eval_df.loc[idx, 'Science_Inputs'] = str(orig.get('Science Inputs', ''))[:1000] if pd.notna(orig.get('Science Inputs', '')) else ''
+            eval_df.loc[idx, 'Bold_Characteristics'] = str(orig.get('Bold Characteristics', ''))[:600] if pd.notna(orig.get('Bold Characteristics', '')) else ''
+            eval_df.loc[idx, 'Problem_Addressed'] = str(orig.get('Problem Addressed', ''))[:500] if pd.notna(orig.get('Problem Addressed', '')) else ''
+            eval_df.loc[idx, 'Beneficiaries'] = str(orig.get('Beneficiaries', ''))[:400] if pd.notna(orig.get('Beneficiaries', '')) else ''
+            eval_df.loc[idx, 'Team_Info'] = str(orig.get('Team', ''))[:600] if pd.notna(orig.get('Team', '')) else ''
+            eval_df.loc[idx, 'LinkedIn'] = str(orig.get('LinkedIn', '')) if pd.notna(orig.get('LinkedIn', '')) else ''
+            eval_df.loc[idx, 'Website'] = str(orig.get('Website / app link', '')) if pd.notna(orig.get('Website / app link', '')) else ''
+    return eval_df
+
+
+def as_comparable(df):
+    """Render every cell as text so dtype differences don't matter."""
+    return df.astype(object).where(df.notna(), '<NA>').astype(str)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print('Legacy loop vs vectorized merge')
+    for n in LEGACY_SIZES:
+        eval_df, orig_df = make_frames(n)
+        expected, legacy_s = timed(legacy_merge, eval_df, orig_df)
+        actual, merge_s = timed(merge_application_fields, eval_df, orig_df)
+        pd.testing.assert_frame_equal(as_comparable(actual), as_comparable(expected[actual.columns]))
+        print(f'  n={n:>7,}  legacy {legacy_s:8.3f}s  merge {merge_s:8.4f}s  identical output')
+
+    print('Vectorized merge scaling')
+    for n in MERGE_SIZES:
+        eval_df, orig_df = make_frames(n)
+        _, merge_s = timed(merge_application_fields, eval_df, orig_df)
+        print(f'  n={n:>7,}  {merge_s:8.4f}s  {merge_s / n * 1e6:6.2f} µs/row')
+
+
+if __name__ == '__main__':
+    main()
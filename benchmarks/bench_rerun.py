@@ -0,0 +1,60 @@
+"""
+Benchmark dashboard rerun time against applicant count.
+
+Builds synthetic evaluation files with benchmarks/synthetic.py and drives the app headlessly with Streamlit's AppTest, timing the first
+run and a filter-change rerun.
+
+Run with: python benchmarks/bench_rerun.py
+"""
+
+import importlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+sys.path.insert(0, str(ROOT))
+
+from synthetic import make_evaluations  # noqa: E402
+
+SIZES = [100, 1_000, 5_000, 20_000]
+
+
+def time_reruns(n, workdir):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    import data_loading
+
+    path = Path(workdir) / f'eval_{n}.csv'
+    make_evaluations(n).to_csv(path, index=False)
+    os.environ['TCCF_EVAL_CSV'] = str(path)
+    os.environ['TCCF_CACHE_DIR'] = str(Path(workdir) / 'cache')
+    importlib.reload(data_loading)
+    st.cache_resource.clear()
+
+    at = AppTest.from_file(str(ROOT / 'streamlit_app.py'), default_timeout=600)
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+
+    stage = next(s for s in at.selectbox if s.label == 'Stage')
+    start = time.perf_counter()
+    stage.set_value(stage.options[1]).run()
+    rerun = time.perf_counter() - start
+    return first, rerun
+
+
+def main():
+    with tempfile.TemporaryDirectory() as workdir:
+        print('Applicants   first run   filter rerun')
+        for n in SIZES:
+            first, rerun = time_reruns(n, workdir)
+            print(f'{n:>10,}   {first:8.3f}s   {rerun:11.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Benchmark the shared dataset across many dashboard sessions.
+
+1. Simulated reviewers open the dashboard with Streamlit's AppTest, change
+   a filter and stay connected. Every session shares the one cached
+   LiveDataset, so resident memory should stay flat as sessions are added
+   rather than growing by a frame per reviewer: the run fails when a
+   session adds more than MAX_MB_PER_SESSION. (AppTest drives one session
+   at a time; it cannot run several in parallel.)
+2. Reader threads filter, sort and render from dataset.snapshot() while
+   new applications are appended and refreshed in, checking that every
+   snapshot they see is internally consistent.
+
+Run with: python benchmarks/bench_sessions.py [applicants]
+(tests/test_sessions.py runs it on a small dataset.)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(ROOT))
+
+from bench_ingest import append_csv  # noqa: E402
+from bench_memory import rss  # noqa: E402
+from synthetic import make_evaluations  # noqa: E402
+
+APPLICANTS = 10_000
+CHECKPOINTS = [1, 10, 40]
+# Growth allowed per session: widgets, session state and cached positions, not a frame copy
+MAX_MB_PER_SESSION = 2.0
+READERS = 16
+DELTA = 50
+REFRESHES = 10
+
+
+def open_session(stage_index):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / 'streamlit_app.py'), default_timeout=600)
+    at.run()
+    stage = next(s for s in at.selectbox if s.label == 'Stage')
+    stage.set_value(stage.options[stage_index % len(stage.options)]).run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return at
+
+
+def session_memory():
+    """RSS in MB after each checkpoint number of sessions has connected."""
+    sessions, usage = [], []
+    while len(sessions) < CHECKPOINTS[-1]:
+        sessions.append(open_session(len(sessions)))
+        if len(sessions) in CHECKPOINTS:
+            usage.append((len(sessions), rss()[0]))
+    return usage
+
+
+def check_session_memory(usage):
+    """MB of RSS added per session after the first; fails past MAX_MB_PER_SESSION."""
+    (first, baseline), (last, total) = usage[0], usage[-1]
+    per_session = (total - baseline) / (last - first)
+    if per_session > MAX_MB_PER_SESSION:
+        raise AssertionError(f'memory grows by {per_session:.2f} MB per session (limit {MAX_MB_PER_SESSION} MB)')
+    return per_session
+
+
+def read_loop(dataset, stop, errors, reads):
+    from filters import sort_rows
+
+    filters = [('All', 'All', 'All', '', False), ('SHORTLIST', 'All', 'All', '', False),
+               ('All', 'All', 'All', 'plastic', True)]
+    try:
+        while not stop.is_set():
+            for recommendation, level, stage, search, science_only in filters:
+                df, filter_index, version, renders, texts, *_ = dataset.snapshot()
+                assert len(df) == filter_index.n_rows == len(renders) == len(texts), version
+                positions = filter_index.filter(recommendation, level, stage, search, science_only)
+                rows = sort_rows(df.iloc[positions], 'Relevance' if search else 'WEIGHTED_SCORE')
+                for label in rows.index[:25]:
+                    position = df.index.get_loc(label)
+                    assert renders[position].label
+                    texts.row(position)
+                reads.append(version)
+    except Exception as exc:  # reported by the main thread
+        errors.append(exc)
+        stop.set()
+
+
+def concurrent_reads(eval_path, cache_dir):
+    """Readers on one shared dataset while it refreshes; returns (reads, seconds)."""
+    import pandas as pd
+
+    from ingest import LiveDataset
+
+    evaluations = pd.read_csv(eval_path)
+    base = len(evaluations) - DELTA * REFRESHES
+    evaluations.iloc[:base].to_csv(eval_path, index=False)
+    dataset = LiveDataset(str(eval_path), cache_dir=cache_dir)
+
+    stop, errors, reads = threading.Event(), [], []
+    threads = [threading.Thread(target=read_loop, args=(dataset, stop, errors, reads)) for _ in range(READERS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for begin in range(base, len(evaluations), DELTA):
+        if stop.is_set():
+            break
+        append_csv(eval_path, evaluations.iloc[begin:begin + DELTA])
+        dataset.refresh()
+    stop.set()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    assert len(dataset.current.frame) == len(evaluations)
+    return len(reads), len(set(reads)), time.perf_counter() - start
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else APPLICANTS
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        eval_path = workdir / f'eval_{n}.csv'
+        make_evaluations(n + DELTA * REFRESHES).to_csv(eval_path, index=False)
+        os.environ['TCCF_EVAL_CSV'] = str(eval_path)
+        os.environ['TCCF_CACHE_DIR'] = str(workdir / 'cache')
+
+        reads, versions, seconds = concurrent_reads(eval_path, workdir / 'cache')
+        print(f'{READERS} readers, {REFRESHES} refreshes: {reads} consistent reads '
+              f'across {versions} versions in {seconds:.1f}s')
+
+        print(f'\n{n + DELTA * REFRESHES:,} applicants')
+        print('Sessions   RSS MB')
+        usage = session_memory()
+        for sessions, total in usage:
+            print(f'{sessions:>8}   {total:6.1f}')
+        try:
+            per_session = check_session_memory(usage)
+        except AssertionError as error:
+            sys.exit(str(error))
+        print(f'{per_session:.2f} MB per additional session')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark the similar-ventures index against applicant count.
+
+Times building the TF-IDF vectors and postings, a single detail-view
+lookup (median and 95th percentile over random rows), and the batched
+top-k for every row.
+
+Run with: python benchmarks/bench_similar.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_dedup import make_duplicates  # noqa: E402
+from similar import SimilarityIndex  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+LOOKUPS = 200
+# Rows for the all-rows batch timing, extrapolated to the whole set
+BATCH_SAMPLE = 2_000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print('Applicants   build    lookup p50   lookup p95   top-k all rows')
+    for n in SIZES:
+        frame, _ = make_duplicates(n)
+        start = time.perf_counter()
+        index = SimilarityIndex(frame)
+        index.prepare()
+        build = time.perf_counter() - start
+
+        timings = []
+        for position in rng.choice(len(frame), LOOKUPS, replace=False):
+            start = time.perf_counter()
+            index.similar(int(position))
+            timings.append(time.perf_counter() - start)
+        p50, p95 = np.percentile(timings, [50, 95]) * 1000
+
+        sample = np.arange(min(BATCH_SAMPLE, len(frame)))
+        start = time.perf_counter()
+        index.top_k(sample)
+        all_rows = (time.perf_counter() - start) * len(frame) / len(sample)
+        print(f'{len(frame):>10,}   {build:5.1f}s   {p50:8.2f}ms   {p95:8.2f}ms   {all_rows:12.1f}s')
+
+
+if __name__ == '__main__':
+    main()
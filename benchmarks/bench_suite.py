@@ -0,0 +1,221 @@
+"""
+Benchmark suite over synthetic datasets, with a JSON history.
+
+For each size, generates evaluation and application CSVs (synthetic.py)
+and measures the hot paths of the dashboard:
+
+    load_data_cold   LiveDataset from the CSVs with an empty cache, including
+                     the index builds it finishes in the background
+    load_data_warm   the same from the columnar, text, search and signature caches
+    filter_index     FilterIndex build (bitmaps, search and country indexes)
+    filter           the sidebar filter combinations, uncached
+    search           BM25 queries
+    sort             sort_rows over every sort column
+    summaries        eval_summaries for every applicant
+    render           RenderCache (labels, summaries and detail markup)
+
+Time is the best of a few repeats. Peak memory is the tracemalloc peak of
+one further run, i.e. what the operation allocates on top of what is
+already loaded. Each run is appended to history.json, which stays local
+(it is not committed). Cases are compared with the latest run on the same
+machine type, Python version and CPU count that was recorded with --pin
+(the baseline), or with the previous such run when none is pinned, so a
+slow drift can't pass one small step at a time. With --check the script exits non-zero, without recording the
+run, when a case got slower or bigger than that by more than the
+tolerances below.
+
+Run with: python benchmarks/bench_suite.py [--sizes 1000 10000] [--check] [--pin]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(ROOT))
+
+from synthetic import SIZES, write_dataset  # noqa: E402
+
+HISTORY = BENCH_DIR / 'history.json'
+# Runs are only compared with runs that agree on these
+ENVIRONMENT_KEYS = ['machine', 'python', 'cpus']
+REPEATS = 5
+# Stop repeating a case once its runs add up to this
+REPEAT_SECONDS = 2.0
+# --check fails when a case is this many times slower or bigger than last time
+TIME_TOLERANCE = 1.5
+MEMORY_TOLERANCE = 1.25
+# Below these, differences are mostly noise and are not checked
+MIN_CHECKED_SECONDS = 0.01
+MIN_CHECKED_MB = 1.0
+SEARCH_QUERIES = ['plastic', 'bioplastic film', 'pyrolysis fuel bricks', 'cassava starch packaging',
+                  'women collectors income']
+
+
+def _wait_for_background():
+    """Join the index builds LiveDataset leaves running, so they don't overlap the next case."""
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread() and thread.daemon:
+            thread.join()
+
+
+def measure(func):
+    """(best seconds, peak traced MB) of func()."""
+    timings = []
+    while len(timings) < REPEATS and sum(timings) < REPEAT_SECONDS:
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak / 2**20
+
+
+def cases(eval_path, app_path, workdir):
+    """(name, function) pairs for one dataset, in run order."""
+    from filters import SORT_COLUMNS, FilterIndex, sort_rows
+    from ingest import LiveDataset
+    from rendering import RenderCache, eval_summaries
+
+    warm_cache = workdir / 'cache'
+
+    def load_data_cold():
+        LiveDataset(str(eval_path), str(app_path), Path(tempfile.mkdtemp(dir=workdir)))
+        _wait_for_background()
+
+    def load_data_warm():
+        LiveDataset(str(eval_path), str(app_path), warm_cache)
+        _wait_for_background()
+
+    yield 'load_data_cold', load_data_cold
+    load_data_warm()
+    yield 'load_data_warm', load_data_warm
+
+    dataset = LiveDataset(str(eval_path), str(app_path), warm_cache)
+    _wait_for_background()
+    df, filter_index, _, _, texts, *_ = dataset.snapshot()
+    level, stage = filter_index.options('SCIENCE_LEVEL')[0], filter_index.options('Stage')[0]
+    country = next(iter(filter_index.geo.counts))
+    filter_states = [
+        ('SHORTLIST', 'All', 'All', '', False, 'All'),
+        ('All', level, 'All', '', True, 'All'),
+        ('All', 'All', stage, '', False, country),
+        ('CONSIDER', level, stage, '', True, country),
+        ('All', 'All', 'All', 'plastic', False, 'All'),
+    ]
+
+    yield 'filter_index', lambda: FilterIndex(df, texts=texts)
+    yield 'filter', lambda: [filter_index._filter(*state) for state in filter_states]
+    yield 'search', lambda: [filter_index.search_index.search(query) for query in SEARCH_QUERIES]
+    yield 'sort', lambda: [sort_rows(df, column) for column in SORT_COLUMNS]
+    yield 'summaries', lambda: eval_summaries(df)
+    yield 'render', lambda: RenderCache(df)
+
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _previous(history, size, case, current):
+    """The result to compare a size and case with: the latest pinned one, else the latest one, or None.
+
+    Only runs recorded in the same environment as the current run count.
+    """
+    latest = None
+    for run in reversed(history):
+        if any(run.get(key) != current[key] for key in ENVIRONMENT_KEYS):
+            continue
+        result = run['results'].get(str(size), {}).get(case)
+        if result is not None:
+            if run.get('baseline'):
+                return result
+            latest = latest or result
+    return latest
+
+
+def _regressions(result, previous):
+    """Descriptions of how result exceeds the tolerances against previous."""
+    found = []
+    if previous is None:
+        return found
+    if result['seconds'] >= MIN_CHECKED_SECONDS and result['seconds'] > previous['seconds'] * TIME_TOLERANCE:
+        found.append(f"{previous['seconds']:.3f}s -> {result['seconds']:.3f}s")
+    if result['peak_mb'] >= MIN_CHECKED_MB and result['peak_mb'] > previous['peak_mb'] * MEMORY_TOLERANCE:
+        found.append(f"{previous['peak_mb']:.1f} MB -> {result['peak_mb']:.1f} MB")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the dashboard hot paths on synthetic data.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--history', type=Path, default=HISTORY)
+    parser.add_argument('--data-dir', type=Path, help='keep the generated CSVs here and reuse them')
+    parser.add_argument('--no-record', action='store_true', help="don't append this run to the history")
+    parser.add_argument('--check', action='store_true',
+                        help="exit 1 on a regression against the history, and don't record the run")
+    parser.add_argument('--pin', action='store_true', help='record this run as the baseline later runs are compared with')
+    args = parser.parse_args(argv)
+
+    history = json.loads(args.history.read_text()) if args.history.exists() else []
+    run = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'commit': _commit(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'baseline': args.pin,
+        'results': {},
+    }
+    regressions = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in args.sizes:
+            data_dir = args.data_dir or Path(workdir)
+            eval_path, app_path = data_dir / f'eval_{n}.csv', data_dir / f'apps_{n}.csv'
+            if not (eval_path.exists() and app_path.exists()):
+                write_dataset(n, data_dir)
+            size_dir = Path(workdir) / f'run_{n}'
+            size_dir.mkdir()
+
+            print(f'\n{n:,} applicants')
+            print('case               seconds    peak MB    vs ref')
+            results = run['results'][str(n)] = {}
+            for case, func in cases(eval_path, app_path, size_dir):
+                seconds, peak = measure(func)
+                result = results[case] = {'seconds': round(seconds, 6), 'peak_mb': round(peak, 3)}
+                previous = _previous(history, n, case, run)
+                change = f"{seconds / previous['seconds']:7.2f}x" if previous and previous['seconds'] else ''
+                print(f'{case:<16} {seconds:9.3f} {peak:10.1f}   {change}')
+                regressions.extend(f'{n:,} {case}: {text}' for text in _regressions(result, previous))
+
+    if regressions:
+        print('\nRegressions against the baseline:\n  ' + '\n  '.join(regressions))
+    if args.check and regressions:
+        print(f'Not recorded in {args.history}')
+        sys.exit(1)
+    if not args.no_record:
+        history.append(run)
+        args.history.write_text(json.dumps(history, indent=1) + '\n')
+        print(f'\nRecorded in {args.history}')
+
+
+if __name__ == '__main__':
+    main()
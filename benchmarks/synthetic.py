@@ -0,0 +1,164 @@
+"""
+Synthetic TCCF Bold Ideas datasets for benchmarking.
+
+Writes an evaluation CSV with the columns of TCCF_Bold_Ideas_FINAL.csv and
+an application CSV with the Bold_Ideas_Database_*_all.csv columns, at any
+size. Categorical columns follow the real file's value frequencies;
+Target_Countries combines real country names with the spacing quirks of
+the form; scores are drawn per sub-score and the weighted score and tier
+are computed by the scoring module, so every filter and tier is populated
+as in a real round. Application text is drawn from a Zipf-weighted
+vocabulary at the real field lengths. About 90% of applicants have an
+application row, some twice, with emails differing in case and spacing.
+
+Run with: python benchmarks/synthetic.py data/ --sizes 1000 10000 100000
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from geo import COUNTRY_CODES  # noqa: E402
+from scoring import SCORE_COLUMNS, recommendations, weighted_scores  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+SAMPLED_COLUMNS = ['Location', 'Stage', 'Legal_Status', 'WHAT_THEY_DO', 'SCIENCE_LEVEL']
+# Share of applicants found in the application export, and of those exported twice
+APPLICATION_SHARE = 0.9
+DUPLICATE_SHARE = 0.02
+MISSING_TEXT_SHARE = 0.05
+# (application column, mean words, spread) matching the real export
+TEXT_FIELDS = [
+    ('Science Inputs', 85, 30),
+    ('Bold Characteristics', 62, 15),
+    ('Problem Addressed', 53, 12),
+    ('Beneficiaries', 31, 10),
+    ('Team', 45, 20),
+]
+DOMAIN_WORDS = """
+    plastic waste recycling collection bioplastic packaging compost circular economy community
+    women youth fishermen coastal ocean marine river pollution microplastics sorting pellets
+    polymer polyethylene pet hdpe ldpe polypropylene pyrolysis fuel bricks pavers tiles furniture
+    cassava starch seaweed algae fibre banana enzyme fermentation biodegradable film bags bottles
+    sachets households schools markets municipalities informal sector collectors aggregators
+    jobs income livelihoods training technology laboratory research university patent prototype
+    machine shredder extruder mould solar digital app platform mobile payment traceability data
+    sensor mapping partnership government policy scale revenue customers tonnes diverted landfill
+    emissions carbon energy water sanitation health soil agriculture farmers fertiliser team
+    engineer chemist founder experience years masters degree scientist manager operations
+""".split()
+FIRST_NAMES = ['Amina', 'Kwame', 'Fatou', 'Tendai', 'Chinedu', 'Zanele', 'Moussa', 'Wanjiru', 'Kofi', 'Aisha']
+LAST_NAMES = ['Mensah', 'Okafor', 'Diallo', 'Kamau', 'Ndlovu', 'Traore', 'Abebe', 'Banda', 'Osei', 'Toure']
+
+
+def _sample(values, n, rng):
+    """n draws from values with their observed frequencies."""
+    counts = values.value_counts(dropna=False)
+    return rng.choice(counts.index.to_numpy(dtype=object), n, p=(counts / counts.sum()).to_numpy())
+
+
+def _countries(n, rng):
+    """Target_Countries strings: 1-6 countries, with the form's stray spaces."""
+    names = np.array(sorted(COUNTRY_CODES), dtype=object)
+    weights = rng.zipf(1.6, len(names)).astype(float)
+    weights /= weights.sum()
+    values = []
+    for k in rng.integers(1, 7, n):
+        picked = sorted(rng.choice(names, k, replace=False, p=weights))
+        values.append(', '.join(name + ' ' if rng.random() < 0.15 else name for name in picked))
+    return values
+
+
+def make_evaluations(n, seed=0):
+    """Evaluation frame with n applicants, shaped like TCCF_Bold_Ideas_FINAL.csv."""
+    rng = np.random.default_rng(seed)
+    base = pd.read_csv(ROOT / 'TCCF_Bold_Ideas_FINAL.csv')
+    first = rng.choice(FIRST_NAMES, n)
+    last = rng.choice(LAST_NAMES, n)
+    ids = np.arange(1, n + 1)
+    df = pd.DataFrame({
+        'ID': ids,
+        'Venture_Name': [f'{word.title()} {suffix} {i}' for word, suffix, i in zip(
+            rng.choice(DOMAIN_WORDS, n), rng.choice(['Solutions', 'Ventures', 'Labs', 'Africa', 'Cycle'], n), ids)],
+        'Contact': [f'{a} {b}' for a, b in zip(first, last)],
+        'Email': [f'{a.lower()}.{b.lower()}{i}@example.org' for a, b, i in zip(first, last, ids)],
+    })
+    for column in SAMPLED_COLUMNS:
+        df[column] = _sample(base[column], n, rng)
+    df['Target_Countries'] = _countries(n, rng)
+    df['Plastic_Tonnes'] = np.round(rng.lognormal(5, 2.5, n), 1)
+    df['Livelihoods'] = np.ceil(rng.lognormal(4.5, 1.8, n)).astype(np.int64)
+    for column in SCORE_COLUMNS:
+        df[column] = np.round(np.clip(rng.normal(3.0, 0.7, n), 1, 5), 1)
+    df['WEIGHTED_SCORE'] = weighted_scores(df)
+    df['RECOMMENDATION'] = np.asarray(recommendations(
+        df['WEIGHTED_SCORE'].to_numpy(), df['Score_Innovation_30%'].to_numpy(), df['SCIENCE_LEVEL']), dtype=object)
+    # The evaluation file lists applicants best first
+    return df.sort_values('WEIGHTED_SCORE', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def _texts(n, mean, spread, vocab, p, rng):
+    lengths = np.clip(rng.normal(mean, spread, n).astype(np.int64), 5, None)
+    words = rng.choice(vocab, lengths.sum(), p=p)
+    ends = np.cumsum(lengths)
+    texts = np.array([' '.join(words[end - length:end]) + '.' for end, length in zip(ends, lengths)], dtype=object)
+    texts[rng.random(n) < MISSING_TEXT_SHARE] = None
+    return texts
+
+
+def make_applications(evaluations, seed=0):
+    """Application export frame for an evaluation frame, shaped like Bold_Ideas_Database_*_all.csv."""
+    rng = np.random.default_rng(seed + 1)
+    emails = evaluations['Email'].to_numpy(dtype=object)
+    order = rng.permutation(len(emails))[:int(len(emails) * APPLICATION_SHARE)]
+    order = np.concatenate([order, rng.choice(order, int(len(order) * DUPLICATE_SHARE), replace=False)])
+    exported = emails[order].copy()
+    # The export keeps whatever the applicant typed
+    varied = rng.random(len(exported)) < 0.05
+    exported[varied] = [' ' + email.upper() for email in exported[varied]]
+
+    # Domain words in random frequency order, then a long tail of rarer terms (Zipf-weighted)
+    vocab = np.array(list(rng.permutation(DOMAIN_WORDS)) + [f'{word}{k}' for word in DOMAIN_WORDS for k in range(40)],
+                     dtype=object)
+    p = 1 / np.arange(1, len(vocab) + 1) ** 1.05
+    p /= p.sum()
+
+    m = len(exported)
+    df = pd.DataFrame({'Email': exported})
+    for column, mean, spread in TEXT_FIELDS:
+        df[column] = _texts(m, mean, spread, vocab, p, rng)
+    df['LinkedIn'] = np.where(rng.random(m) < 0.6, 'https://linkedin.com/in/applicant', None)
+    df['Website / app link'] = np.where(rng.random(m) < 0.4, 'https://example.org', None)
+    return df
+
+
+def write_dataset(n, directory, seed=0):
+    """Write eval_{n}.csv and apps_{n}.csv to directory; returns their paths."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    eval_path, app_path = directory / f'eval_{n}.csv', directory / f'apps_{n}.csv'
+    evaluations = make_evaluations(n, seed)
+    evaluations.to_csv(eval_path, index=False)
+    make_applications(evaluations, seed).to_csv(app_path, index=False)
+    return eval_path, app_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write synthetic TCCF Bold Ideas evaluation and application CSVs.')
+    parser.add_argument('output_dir', type=Path)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    for n in args.sizes:
+        eval_path, app_path = write_dataset(n, args.output_dir, args.seed)
+        print(f'{n:>10,} applicants: {eval_path}, {app_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+TCCF Bold Ideas - static dashboard builder
+
+Renders dashboard.html from the same merged data the Streamlit app loads.
+The data is embedded as compressed columnar JSON: repetitive text columns
+are dictionary-encoded, and the long application fields go into separate
+chunks that the page only inflates when a card is opened, so the offline
+dashboard stays quick to open at 10k+ applicants. Searching the science
+text first looks the query up in a word -> chunks index and then inflates
+only the chunks that can contain it.
+
+Run with: python build_dashboard.py [-o dashboard.html]
+"""
+
+import argparse
+import base64
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_loading import APPLICATION_PATHS, EVAL_PATHS, LONG_TEXT_FIELDS, as_float64, find_data_file, load_merged
+
+TEMPLATE_PATH = Path(__file__).with_name('dashboard_template.html')
+PAYLOAD_MARKER = '/*__PAYLOAD__*/'
+
+# LONG_TEXT_FIELDS are shown only in the expanded card, so shipped in lazily decoded chunks
+TEXT_CHUNK_ROWS = 256
+
+# Long fields the page's search matches against
+SEARCH_TEXT_FIELDS = ['Science_Inputs']
+
+# Text columns with at most this share of distinct values are dictionary-encoded
+DICTIONARY_MAX_RATIO = 0.5
+
+
+def _is_text(series):
+    return not (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series))
+
+
+def _values(series):
+    """JSON-ready values: text NaN becomes '', numeric NaN becomes null."""
+    if _is_text(series):
+        return series.astype(object).where(series.notna(), '').astype(str).tolist()
+    if pd.api.types.is_float_dtype(series):
+        series = pd.Series(as_float64(series), index=series.index)
+    values = series.to_numpy(dtype=object)
+    values[pd.isna(values)] = None
+    return [value.item() if isinstance(value, np.generic) else value for value in values]
+
+
+def encode_column(series):
+    """A plain value list, or {"values", "codes"} for repetitive text."""
+    values = _values(series)
+    if _is_text(series) and len(values):
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+        if len(uniques) <= DICTIONARY_MAX_RATIO * len(values):
+            return {'values': uniques.tolist(), 'codes': codes.tolist()}
+    return values
+
+
+def _pack(obj):
+    """gzip-compressed, base64-encoded compact JSON."""
+    raw = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.b64encode(gzip.compress(raw, compresslevel=9, mtime=0)).decode('ascii')
+
+
+def search_index(df, fields, chunk_rows):
+    """Every lower-cased, whitespace-separated word of fields, with the text chunks it occurs in.
+
+    A query the page finds with includes() has each of its own words inside
+    one word of the text, so chunks holding no word containing every query
+    word can be skipped without inflating them.
+    """
+    chunks_of = {}
+    for chunk, start in enumerate(range(0, len(df), chunk_rows)):
+        words = set()
+        for field in fields:
+            for text in df[field].iloc[start:start + chunk_rows]:
+                if isinstance(text, str):
+                    words.update(text.lower().split())
+        for word in words:
+            chunks_of.setdefault(word, []).append(chunk)
+    words = sorted(chunks_of)
+    return {'words': words, 'chunks': [chunks_of[word] for word in words]}
+
+
+def build_payload(df, chunk_rows=TEXT_CHUNK_ROWS):
+    """Encode df as the dashboard payload (main table plus long-text chunks)."""
+    long_fields = [field for field in LONG_TEXT_FIELDS if field in df.columns]
+    main = {
+        'length': len(df),
+        'columns': {str(column): encode_column(df[column]) for column in df.columns if column not in long_fields},
+    }
+    text = [
+        _pack({field: _values(df[field].iloc[start:start + chunk_rows]) for field in long_fields})
+        for start in range(0, len(df), chunk_rows)
+    ]
+    search_fields = [field for field in SEARCH_TEXT_FIELDS if field in long_fields]
+    return {'main': _pack(main), 'text': text, 'chunkRows': chunk_rows,
+            'search': _pack(search_index(df, search_fields, chunk_rows))}
+
+
+def render(df, template_path=TEMPLATE_PATH):
+    """Return the dashboard HTML for df."""
+    template = Path(template_path).read_text(encoding='utf-8')
+    payload = json.dumps(build_payload(df), separators=(',', ':'))
+    return template.replace(PAYLOAD_MARKER, payload, 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the static TCCF Bold Ideas dashboard.')
+    parser.add_argument('-o', '--output', type=Path, default=Path('dashboard.html'))
+    parser.add_argument('--eval', dest='eval_path', help='evaluation CSV (default: auto-detect)')
+    parser.add_argument('--applications', dest='orig_path', help='application CSV (default: auto-detect)')
+    args = parser.parse_args(argv)
+
+    eval_path = args.eval_path or find_data_file(EVAL_PATHS)
+    if eval_path is None:
+        parser.error('evaluation data file not found; pass --eval')
+    orig_path = args.orig_path or find_data_file(APPLICATION_PATHS)
+
+    df = load_merged(eval_path, orig_path)
+    args.output.write_text(render(df), encoding='utf-8')
+    print(f'Wrote {len(df)} applicants to {args.output} ({args.output.stat().st_size / 1024:.0f} KB)', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,330 @@
+"""
+TCCF Bold Ideas - data loading helpers
+
+Source discovery, the evaluation/application merge and the on-disk
+columnar cache. Kept free of Streamlit imports so it can be reused and
+benchmarked outside the dashboard.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from text_store import NA_TEXT, LazyTextStore, TextStore, csv_records
+
+# Explicit paths from the environment take precedence over the defaults
+EVAL_PATHS = [path for path in [os.environ.get('TCCF_EVAL_CSV')] if path] + [
+    'TCCF_Bold_Ideas_FINAL.csv',
+    '/mnt/user-data/outputs/TCCF_Bold_Ideas_FINAL.csv',
+    './TCCF_Bold_Ideas_FINAL.csv'
+]
+
+APPLICATION_PATHS = [path for path in [os.environ.get('TCCF_APPLICATIONS_CSV')] if path] + [
+    'Bold_Ideas_Database_2e27323557b980b0bd23d3d58431f8c5_all.csv',
+    '/mnt/user-data/uploads/Bold_Ideas_Database_2e27323557b980b0bd23d3d58431f8c5_all.csv'
+]
+
+# Columnar cache of the merged frame, rebuilt when a source file changes
+CACHE_DIR = Path(os.environ.get('TCCF_CACHE_DIR', '.cache'))
+CACHE_FORMAT = 3
+
+# Compact in-memory types: the few-valued columns as categoricals, scores as float32.
+# Location and WHAT_THEY_DO (free-form, 110 and 36 values in 138 rows) stay plain text.
+CATEGORICAL_COLUMNS = ['RECOMMENDATION', 'SCIENCE_LEVEL', 'Stage', 'Legal_Status']
+FLOAT32_COLUMNS = [
+    'Score_Innovation_30%', 'Score_Impact_25%', 'Score_Social_20%',
+    'Score_Commercial_15%', 'Score_Team_10%', 'WEIGHTED_SCORE',
+]
+# float32 keeps about seven significant digits; scores are rounded back to this
+FLOAT32_DECIMALS = 6
+
+# (dashboard column, application export column, max characters or None)
+APPLICATION_FIELDS = [
+    ('Science_Inputs', 'Science Inputs', 1000),
+    ('Bold_Characteristics', 'Bold Characteristics', 600),
+    ('Problem_Addressed', 'Problem Addressed', 500),
+    ('Beneficiaries', 'Beneficiaries', 400),
+    ('Team_Info', 'Team', 600),
+    ('LinkedIn', 'LinkedIn', None),
+    ('Website', 'Website / app link', None),
+]
+# Merged fields kept out of the frame, in a TextStore read on demand
+LONG_TEXT_FIELDS = ['Science_Inputs', 'Bold_Characteristics', 'Problem_Addressed', 'Beneficiaries', 'Team_Info']
+# The only application export columns ever read; the export has dozens more
+APPLICATION_COLUMNS = ['Email'] + [source for _, source, _ in APPLICATION_FIELDS]
+# Application export rows parsed at a time
+CHUNK_ROWS = 10_000
+
+# Lazy mode: the long fields stay in the application export and are read
+# from there, by byte offset, when a row needs them
+LAZY_APPLICATIONS = bool(os.environ.get('TCCF_LAZY_APPLICATIONS'))
+OFFSET_COLUMN = 'Application_Offset'
+
+
+def normalize_email(emails):
+    """Normalize an Email column into a join key (stripped and case-folded)."""
+    keys = emails.astype('string').str.strip().str.casefold()
+    return keys.mask(keys == '')
+
+
+def as_float64(values):
+    """float64 copy of a (float32) score column without the float32 noise (3.71, not 3.7100000381)."""
+    return np.round(np.asarray(values, dtype=np.float64), FLOAT32_DECIMALS)
+
+
+def row_hashes(df):
+    """Hash every row of df from its text rendering (dtype independent)."""
+    text = pd.DataFrame({
+        # Floats print at their own precision, so a float32 3.71 matches a parsed 3.71
+        column: df[column].astype(str) if pd.api.types.is_float_dtype(df[column]) else df[column].astype(object)
+        for column in df.columns
+    }, index=df.index)
+    text = text.where(text.notna(), None).astype(str)
+    return pd.util.hash_pandas_object(text, index=False).to_numpy()
+
+
+def merge_application_fields(eval_df, orig_df):
+    """Attach the truncated long-form application fields to the evaluation data.
+
+    Rows are joined on the normalized Email; when an email appears several
+    times in the application export the first row wins. Evaluation rows
+    without a matching application keep NaN in the merged columns.
+    """
+    orig_keys = normalize_email(orig_df['Email'])
+    first = (orig_keys.notna() & ~orig_keys.duplicated()).to_numpy()
+    lookup = pd.Index(orig_keys[first])
+
+    positions = lookup.get_indexer(normalize_email(eval_df['Email']))
+    matched = positions >= 0
+    matched_positions = positions[matched]
+
+    merged = {}
+    for column, source, max_len in APPLICATION_FIELDS:
+        values = np.full(len(eval_df), np.nan, dtype=object)
+        if source in orig_df.columns:
+            picked = orig_df[source][first].take(matched_positions)
+            text = picked.where(picked.notna(), '').astype(str)
+            if max_len is not None:
+                text = text.str.slice(0, max_len)
+            values[matched] = text.to_numpy(dtype=object)
+        else:
+            values[matched] = ''
+        merged[column] = values
+
+    if OFFSET_COLUMN in orig_df.columns:
+        # From scan_applications(): where each matched application starts in the export
+        offsets = np.full(len(eval_df), -1, dtype=np.int64)
+        offsets[matched] = orig_df[OFFSET_COLUMN][first].to_numpy()[matched_positions]
+        merged[OFFSET_COLUMN] = offsets
+
+    return eval_df.assign(**merged)
+
+
+def find_data_file(paths):
+    """Return the first existing path from a list of candidates, or None."""
+    for path in paths:
+        if Path(path).is_file():
+            return str(path)
+    return None
+
+
+def _truncated(rows):
+    """rows with each merged field cut to its display length (as the merge would)."""
+    for _, source, max_len in APPLICATION_FIELDS:
+        if max_len is not None and source in rows.columns:
+            rows[source] = rows[source].map(lambda value: value[:max_len] if isinstance(value, str) else value)
+    return rows
+
+
+def read_applications(orig_path):
+    """The merged columns of the application export, parsed in chunks.
+
+    Other columns are skipped by the parser and the long fields are
+    truncated chunk by chunk, so memory does not grow with the export's
+    width or the length of its free text.
+    """
+    options = dict(encoding='utf-8-sig', usecols=lambda column: column in APPLICATION_COLUMNS)
+    chunks = [_truncated(chunk) for chunk in pd.read_csv(orig_path, chunksize=CHUNK_ROWS, **options)]
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.read_csv(orig_path, nrows=0, **options)
+
+
+def scan_applications(orig_path, columns=('Email', 'LinkedIn', 'Website / app link')):
+    """One streaming pass over the application export for lazy mode.
+
+    Returns the given columns plus OFFSET_COLUMN, the byte offset of each
+    record, so its long fields can be read later with LazyTextStore. Only
+    those columns are kept: memory is independent of the export's width.
+    """
+    with open(orig_path, 'rb') as f:
+        records = csv_records(f)
+        _, header = next(records, (0, []))
+        indexes = [header.index(column) if column in header else None for column in columns]
+        offsets, values = [], [[] for _ in columns]
+        for offset, fields in records:
+            if not any(fields):
+                continue
+            offsets.append(offset)
+            for column_values, i in zip(values, indexes):
+                value = fields[i] if i is not None and i < len(fields) else ''
+                column_values.append(None if value in NA_TEXT else value)
+    rows = pd.DataFrame(dict(zip(columns, values)), columns=list(columns))
+    rows[OFFSET_COLUMN] = np.array(offsets, dtype=np.int64)
+    return rows
+
+
+def read_sources(eval_path, orig_path=None, lazy=False):
+    """Parse the source CSVs and build the merged, categorized frame.
+
+    In lazy mode only the short application fields are merged, and
+    OFFSET_COLUMN locates each row's application in the export.
+    """
+    eval_df = pd.read_csv(eval_path)
+    if orig_path is not None:
+        if lazy:
+            eval_df = merge_application_fields(eval_df, scan_applications(orig_path)).drop(columns=LONG_TEXT_FIELDS)
+        else:
+            eval_df = merge_application_fields(eval_df, read_applications(orig_path))
+
+    return compact_types(eval_df)
+
+
+def compact_types(df):
+    """Store repetitive text as categoricals and scores as float32."""
+    types = {column: 'category' for column in CATEGORICAL_COLUMNS if column in df.columns}
+    types.update({column: np.float32 for column in FLOAT32_COLUMNS if column in df.columns})
+    return df.astype(types)
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_signature(path, known=None):
+    """Return size, mtime and content hash for a file.
+
+    The hash from a previously recorded signature is reused when size and
+    mtime are unchanged, so warm starts never read the source files.
+    """
+    stat = os.stat(path)
+    signature = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if known and all(known.get(k) == v for k, v in signature.items()):
+        signature['sha256'] = known['sha256']
+    else:
+        signature['sha256'] = _hash_file(path)
+    return signature
+
+
+def _read_manifest(cache_dir):
+    try:
+        with open(cache_dir / 'manifest.json') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path, write):
+    tmp = path.with_name(path.name + f'.{os.getpid()}.tmp')
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def load_merged(eval_path, orig_path=None, cache_dir=CACHE_DIR, exclude=(), lazy=False):
+    """Load the merged evaluation frame through the on-disk Parquet cache.
+
+    The cache key is the content hash of every source file, so the frame is
+    only re-parsed and re-merged when a source changes. The key is exposed
+    as ``df.attrs['version']``. Columns in exclude are not read from the
+    cache, and lazy selects read_sources' lazy mode (cached under its own
+    key). Any cache failure (read-only disk, pyarrow missing) falls back to
+    parsing the CSVs directly.
+    """
+    cache_dir = Path(cache_dir)
+    sources = [str(Path(p).resolve()) for p in (eval_path, orig_path) if p is not None]
+    manifest = _read_manifest(cache_dir)
+    known = manifest.get('sources', {})
+    signatures = {path: file_signature(path, known.get(path)) for path in sources}
+
+    key = hashlib.sha256(json.dumps(
+        [CACHE_FORMAT] + (['lazy'] if lazy and orig_path is not None else [])
+        + [signatures[path]['sha256'] for path in sources]
+    ).encode()).hexdigest()[:16]
+    cache_file = cache_dir / f'merged-{key}.parquet'
+
+    df = None
+    if cache_file.exists():
+        try:
+            columns = None
+            if exclude:
+                import pyarrow.parquet as pq
+                columns = [c for c in pq.read_schema(cache_file).names if c not in exclude]
+            df = pd.read_parquet(cache_file, columns=columns)
+        except Exception:
+            df = None
+
+    if df is None:
+        df = read_sources(eval_path, orig_path, lazy)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(cache_file, lambda tmp: df.to_parquet(tmp, index=False))
+            for stale in cache_dir.glob('merged-*.parquet'):
+                if stale != cache_file:
+                    stale.unlink()
+        except Exception:
+            pass
+
+    if signatures != known or manifest.get('key') != key:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps({'key': key, 'sources': signatures}, indent=2)
+            _write_atomic(cache_dir / 'manifest.json', lambda tmp: tmp.write_text(payload))
+        except OSError:
+            pass
+
+    df = df.drop(columns=[column for column in exclude if column in df.columns])
+    df.attrs['version'] = key
+    return df
+
+
+def load_compact(eval_path, orig_path=None, cache_dir=CACHE_DIR, lazy=False):
+    """Load the merged frame without its long text, plus a TextStore holding it.
+
+    The store is a memory-mapped blob cached next to the Parquet file under
+    the same key; without a usable cache directory it is kept in memory.
+    In lazy mode it is a LazyTextStore reading the application export.
+    """
+    cache_dir = Path(cache_dir)
+    if lazy and orig_path is not None:
+        frame = load_merged(eval_path, orig_path, cache_dir, exclude=LONG_TEXT_FIELDS, lazy=True)
+        offsets = frame.pop(OFFSET_COLUMN).to_numpy(dtype=np.int64)
+        sources = {column: (source, max_len) for column, source, max_len in APPLICATION_FIELDS
+                   if column in LONG_TEXT_FIELDS}
+        keys = normalize_email(frame['Email']).to_numpy(dtype=object)
+        return frame, LazyTextStore(orig_path, offsets, keys, sources)
+    frame = load_merged(eval_path, orig_path, cache_dir, exclude=LONG_TEXT_FIELDS)
+    store_path = cache_dir / f"text-{frame.attrs['version']}"
+    try:
+        return frame, TextStore.open(store_path)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    texts = load_merged(eval_path, orig_path, cache_dir).reindex(columns=LONG_TEXT_FIELDS)
+    try:
+        store = TextStore.build(texts, LONG_TEXT_FIELDS, store_path)
+        for stale in cache_dir.glob('text-*'):
+            if not stale.name.startswith(store_path.name + '.'):
+                stale.unlink()
+    except OSError:
+        store = TextStore.from_frame(texts, LONG_TEXT_FIELDS)
+    return frame, store
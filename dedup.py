@@ -0,0 +1,229 @@
+"""
+TCCF Bold Ideas - near-duplicate detection
+
+Flags applications that are likely the same venture submitted more than
+once, possibly under another name. Each row gets a MinHash signature over
+the word bigrams of its name, contact details and application text (the shared
+activity categories and locations would make unrelated ventures look
+alike); locality-sensitive hashing buckets rows whose signatures agree on a
+whole band. Only candidate pairs whose estimated similarity reaches the
+threshold count, and each row joins the earliest row it matches that heads
+a cluster, so every member is similar to its cluster's first row and weak
+links never chain unrelated ventures together. Roughly linear in the
+number of rows, with no all-pairs comparison.
+
+Signatures are cached on disk keyed by a hash of each row's text, so a
+restart or an incremental update only hashes new or changed rows.
+"""
+
+import functools
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEDUP_FIELDS = ['Venture_Name', 'Contact', 'Email', 'Science_Inputs', 'Bold_Characteristics', 'Problem_Addressed']
+NUM_HASHES = 64
+# 21 bands of 3 hashes: a pair at 50% Jaccard similarity shares a band with
+# probability 1 - (1 - 0.5**3)**21 = 94% (99% at 60%)
+BANDS = 21
+BAND_WIDTH = 3
+SIMILARITY_THRESHOLD = 0.5
+# Bucket members paired with each other; in larger buckets (a common text) each
+# row is only paired with its neighbours in the bucket
+MAX_BUCKET_PAIRS = 32
+# Rows hashed per batch (bounds the shingles x hashes working array)
+BATCH_ROWS = 1000
+SIGNATURE_CACHE = 'dedup-signatures.npz'
+
+EMPTY = np.iinfo(np.uint32).max
+_rng = np.random.default_rng(20260215)
+_MULTIPLIERS = _rng.integers(1, 2**63, NUM_HASHES, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_OFFSETS = _rng.integers(0, 2**63, NUM_HASHES, dtype=np.uint64)
+_START = np.uint64(0x9E3779B97F4A7C15)
+_MIX = np.uint64(0xBF58476D1CE4E5B9)
+
+
+def _documents(df, texts, positions):
+    """The dedup text of the rows at positions, one string per row."""
+    rows = df.iloc[positions]
+    parts = []
+    for field in DEDUP_FIELDS:
+        if field in rows.columns:
+            values = rows[field].to_numpy(dtype=object)
+        elif texts is not None and field in texts.fields:
+            values = [texts.get(position, field) for position in positions.tolist()]
+        else:
+            continue
+        parts.append(pd.Series(values, dtype=object).fillna('').astype(str))
+    if not parts:
+        return pd.Series([''] * len(positions), dtype=object)
+    return parts[0].str.cat(parts[1:], sep=' ')
+
+
+def _minhash(documents):
+    """MinHash signatures (uint32, one row per document) over word bigrams."""
+    tokens = documents.str.casefold().str.findall(r'\w+')
+    counts = tokens.str.len().to_numpy()
+    signatures = np.full((len(documents), NUM_HASHES), EMPTY, dtype=np.uint32)
+    if counts.sum() == 0:
+        return signatures
+
+    words = pd.util.hash_array(tokens.explode().dropna().to_numpy(dtype=object))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    nonempty = counts > 0
+    # Each word paired with the one before it (a start marker for the first)
+    previous = np.roll(words, 1)
+    previous[starts[nonempty]] = _START
+    shingles = previous * _MIX + words
+    hashed = np.multiply(shingles[:, None], _MULTIPLIERS)
+    hashed += _OFFSETS
+    hashed >>= np.uint64(32)
+    signatures[nonempty] = np.minimum.reduceat(hashed.astype(np.uint32), starts[nonempty], axis=0)
+    return signatures
+
+
+def compute_signatures(df, texts=None, positions=None):
+    """MinHash signatures for the rows of df at positions (default: all)."""
+    positions = np.arange(len(df)) if positions is None else np.asarray(positions, dtype=np.int64)
+    signatures = np.empty((len(positions), NUM_HASHES), dtype=np.uint32)
+    for start in range(0, len(positions), BATCH_ROWS):
+        batch = positions[start:start + BATCH_ROWS]
+        signatures[start:start + len(batch)] = _minhash(_documents(df, texts, batch))
+    return signatures
+
+
+def document_keys(df, texts=None):
+    """A hash of every row's dedup text, for looking up cached signatures."""
+    keys = np.empty(len(df), dtype=np.uint64)
+    for start in range(0, len(df), BATCH_ROWS):
+        batch = np.arange(start, min(start + BATCH_ROWS, len(df)))
+        keys[batch] = pd.util.hash_array(_documents(df, texts, batch).to_numpy(dtype=object))
+    return keys
+
+
+def _candidate_pairs(signatures):
+    """Unique (a, b) position pairs, a < b, that share a whole band of their signatures."""
+    hashed = np.flatnonzero(signatures[:, 0] != EMPTY)
+    pairs = []
+    for band in range(BANDS):
+        block = np.ascontiguousarray(signatures[hashed, band * BAND_WIDTH:(band + 1) * BAND_WIDTH])
+        keys = pd.util.hash_array(block.view(f'V{block.itemsize * BAND_WIDTH}').ravel())
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        for offset in range(1, MAX_BUCKET_PAIRS):
+            same = np.flatnonzero(keys[offset:] == keys[:-offset])
+            if not len(same):
+                break
+            pairs.append(hashed[np.sort(np.stack([order[same], order[same + offset]]), axis=0)])
+    if not pairs:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    a, b = np.unique(np.concatenate(pairs, axis=1), axis=1)
+    return a, b
+
+
+def find_clusters(signatures, threshold=SIMILARITY_THRESHOLD):
+    """Cluster rows by LSH banding; returns (cluster, similarity) arrays.
+
+    cluster holds the position of the first row of each row's cluster, or
+    -1 when the row has no likely duplicate; similarity is the estimated
+    Jaccard similarity of the row to that first row, never below threshold.
+    """
+    n_rows = len(signatures)
+    cluster = np.full(n_rows, -1, dtype=np.int64)
+    similarity = np.zeros(n_rows)
+    if not n_rows:
+        return cluster, similarity
+    a, b = _candidate_pairs(signatures)
+    estimates = (signatures[a] == signatures[b]).mean(axis=1)
+    keep = estimates >= threshold
+    a, b, estimates = a[keep], b[keep], estimates[keep]
+
+    # Rows in order, each joining the earliest matching row that is unassigned or a head;
+    # a row's own matches with earlier rows are all settled before it can become a head
+    order = np.lexsort((a, b))
+    for head, row, estimate in zip(a[order].tolist(), b[order].tolist(), estimates[order].tolist()):
+        if cluster[row] < 0 and cluster[head] in (-1, head):
+            cluster[head] = head
+            similarity[head] = 1.0
+            cluster[row] = head
+            similarity[row] = estimate
+    return cluster, similarity
+
+
+class DuplicateIndex:
+    """MinHash signatures and near-duplicate clusters for one dataset version.
+
+    Clusters are computed on first use. ``updated()`` hashes only the given
+    rows and returns a new index; this one stays valid for its readers.
+    """
+
+    def __init__(self, df, texts=None, signatures=None):
+        self.signatures = compute_signatures(df, texts) if signatures is None else signatures
+
+    @classmethod
+    def cached(cls, df, texts, cache_dir):
+        """Index for df, hashing only rows whose text has no signature in cache_dir.
+
+        The cache file keeps the signatures of df's rows only, so it never
+        outgrows the dataset; give every dataset its own cache_dir.
+        """
+        path = Path(cache_dir) / SIGNATURE_CACHE
+        keys = document_keys(df, texts)
+        try:
+            with np.load(path) as cache:
+                cached_keys, cached_signatures = cache['keys'], cache['signatures']
+        except (OSError, ValueError, KeyError):
+            cached_keys = np.empty(0, dtype=np.uint64)
+            cached_signatures = np.empty((0, NUM_HASHES), dtype=np.uint32)
+
+        found = pd.Index(cached_keys).get_indexer(keys)
+        missing = np.flatnonzero(found < 0)
+        signatures = np.empty((len(df), NUM_HASHES), dtype=np.uint32)
+        signatures[found >= 0] = cached_signatures[found[found >= 0]]
+        signatures[missing] = compute_signatures(df, texts, missing)
+        unique_keys, first = np.unique(keys, return_index=True)
+        if len(missing) or len(cached_keys) != len(unique_keys):
+            tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+            try:
+                with open(tmp, 'wb') as f:
+                    np.savez(f, keys=unique_keys, signatures=signatures[first])
+                os.replace(tmp, path)
+            except OSError:
+                pass
+            finally:
+                if tmp.exists():
+                    tmp.unlink()
+        return cls(df, signatures=signatures)
+
+    def updated(self, df, positions, texts=None):
+        """Return an index over df where only the rows at positions changed."""
+        positions = np.asarray(positions, dtype=np.int64)
+        signatures = np.empty((len(df), NUM_HASHES), dtype=np.uint32)
+        signatures[:len(self.signatures)] = self.signatures
+        signatures[positions] = compute_signatures(df, texts, positions)
+        return DuplicateIndex(df, signatures=signatures)
+
+    @functools.cached_property
+    def _clusters(self):
+        return find_clusters(self.signatures)
+
+    @property
+    def cluster(self):
+        """Per-row position of the cluster's first row, or -1."""
+        return self._clusters[0]
+
+    @property
+    def similarity(self):
+        """Per-row estimated similarity to the cluster's first row."""
+        return self._clusters[1]
+
+    @functools.cached_property
+    def members(self):
+        """Positions of all rows in a cluster, grouped by cluster."""
+        return np.flatnonzero(self.cluster >= 0)[np.argsort(self.cluster[self.cluster >= 0], kind='stable')]
+
+    @property
+    def n_clusters(self):
+        return len(np.unique(self.cluster[self.members]))
@@ -0,0 +1,160 @@
+"""
+TCCF Bold Ideas - shortlist export
+
+Writes the filtered, sorted applicant list (with the merged application
+fields) to CSV or XLSX. Rows are streamed in batches, with the long text
+fields read from the TextStore one batch at a time, and the workbook is
+built in openpyxl's write-only mode, so exporting a 100k-row round never
+holds a second copy of the frame or the whole workbook in memory.
+
+Run with: python export.py shortlist.xlsx --recommendation SHORTLIST
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_loading import (APPLICATION_PATHS, EVAL_PATHS, LAZY_APPLICATIONS, as_float64, find_data_file,
+                          load_compact)
+from filters import SORT_COLUMNS, FilterIndex, sort_rows
+from search_index import SearchIndex
+
+BATCH_SIZE = 5000
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+# Keep temporary export files in memory up to this size, then spill to disk
+SPOOL_BYTES = 16 * 1024 * 1024
+
+
+def with_long_text(rows, texts):
+    """rows with the long text fields from texts put back before LinkedIn.
+
+    rows must be indexed by position in the frame texts belongs to; frames
+    without the merged application fields are returned unchanged.
+    """
+    if texts is None or 'LinkedIn' not in rows.columns:
+        return rows
+    long_text = texts.frame(rows.index).set_axis(rows.index)
+    at = rows.columns.get_loc('LinkedIn')
+    return pd.concat([rows.iloc[:, :at], long_text, rows.iloc[:, at:]], axis=1)
+
+
+def iter_batches(df, batch_size=BATCH_SIZE, texts=None):
+    """Yield consecutive row slices of df, with long text joined when texts is given."""
+    for start in range(0, len(df), batch_size):
+        yield with_long_text(df.iloc[start:start + batch_size], texts)
+
+
+@contextlib.contextmanager
+def _open_text(target):
+    """Text-mode handle on a path or a binary file object (left open)."""
+    if isinstance(target, (str, Path)):
+        with open(target, 'w', encoding='utf-8', newline='') as f:
+            yield f
+    else:
+        f = io.TextIOWrapper(target, encoding='utf-8', newline='', write_through=True)
+        yield f
+        f.flush()
+        f.detach()
+
+
+def write_csv(df, target, batch_size=BATCH_SIZE, texts=None):
+    """Write df to a CSV path or binary file object, one batch at a time."""
+    with _open_text(target) as f:
+        if df.empty:
+            with_long_text(df, texts).to_csv(f, index=False)
+        for i, batch in enumerate(iter_batches(df, batch_size, texts)):
+            batch.to_csv(f, header=(i == 0), index=False)
+
+
+def _xlsx_rows(df, batch_size, texts):
+    # Imported lazily so CSV-only callers don't pay for openpyxl
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+    for batch in iter_batches(df, batch_size, texts):
+        # float32 scores widen to 3.7100000381 as Python floats; round them back
+        batch = batch.apply(lambda column: as_float64(column) if column.dtype == np.float32 else column)
+        values = batch.to_numpy(dtype=object)
+        values[pd.isna(values)] = None
+        for row in values:
+            yield [
+                ILLEGAL_CHARACTERS_RE.sub('', value) if isinstance(value, str)
+                else value.item() if isinstance(value, np.generic)
+                else value
+                for value in row
+            ]
+
+
+def write_xlsx(df, target, batch_size=BATCH_SIZE, texts=None):
+    """Write df to an XLSX path or binary file object in write-only mode."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Applicants')
+    sheet.append([str(column) for column in with_long_text(df.iloc[:0], texts).columns])
+    for row in _xlsx_rows(df, batch_size, texts):
+        sheet.append(row)
+    workbook.save(target)
+
+
+WRITERS = {'csv': write_csv, 'xlsx': write_xlsx}
+
+
+def export_file(df, fmt, texts=None, batch_size=BATCH_SIZE):
+    """Export df to a rewound temporary file (for st.download_button)."""
+    f = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+    WRITERS[fmt](df, f, batch_size, texts)
+    f.seek(0)
+    return f
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export the TCCF Bold Ideas shortlist to CSV or XLSX.')
+    parser.add_argument('output', type=Path, help='destination file (.csv or .xlsx)')
+    parser.add_argument('--format', choices=sorted(WRITERS), help='defaults to the output suffix')
+    parser.add_argument('--eval', dest='eval_path', help='evaluation CSV (default: auto-detect)')
+    parser.add_argument('--applications', dest='orig_path', help='application CSV (default: auto-detect)')
+    parser.add_argument('--recommendation', default='All')
+    parser.add_argument('--science-level', default='All')
+    parser.add_argument('--stage', default='All')
+    parser.add_argument('--country', default='All', help='target country')
+    parser.add_argument('--search', default='')
+    parser.add_argument('--science-only', action='store_true', help='strong science (★★★ or ★★☆) only')
+    parser.add_argument('--sort', default=None, choices=['Relevance'] + SORT_COLUMNS,
+                        help='default: WEIGHTED_SCORE, or Relevance when searching')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or args.output.suffix.lstrip('.').lower()
+    if fmt not in WRITERS:
+        parser.error(f'cannot infer the format from {args.output.name!r}; pass --format')
+
+    eval_path = args.eval_path or find_data_file(EVAL_PATHS)
+    if eval_path is None:
+        parser.error('evaluation data file not found; pass --eval')
+    orig_path = args.orig_path or find_data_file(APPLICATION_PATHS)
+
+    df, texts = load_compact(eval_path, orig_path, lazy=LAZY_APPLICATIONS)
+    # The BM25 index is most of FilterIndex's build time and only serves a search;
+    # in lazy mode it covers the short fields, as in the app
+    search_index = None if args.search.strip() else SearchIndex(df.iloc[:0])
+    filter_index = FilterIndex(df, search_index=search_index, texts=None if LAZY_APPLICATIONS else texts)
+    positions = filter_index.filter(
+        args.recommendation, args.science_level, args.stage, args.search, args.science_only, args.country)
+    sort_col = args.sort or ('Relevance' if args.search.strip() else 'WEIGHTED_SCORE')
+    rows = sort_rows(df.iloc[positions], sort_col)
+
+    WRITERS[fmt](rows, args.output, args.batch_size, texts)
+    print(f'Exported {len(rows)} applicants to {args.output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
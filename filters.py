@@ -0,0 +1,169 @@
+"""
+TCCF Bold Ideas - sidebar filter engine
+
+Precomputes per-category row bitmaps (and the applicant-country bridge)
+once per dataset so that every widget interaction only combines a few
+boolean arrays instead of re-scanning and copying the frame.
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+
+from data_loading import as_float64
+from geo import GeoIndex
+from search_index import SearchIndex
+
+FILTER_COLUMNS = ['RECOMMENDATION', 'SCIENCE_LEVEL', 'Stage']
+SORT_COLUMNS = ['WEIGHTED_SCORE', 'Score_Innovation_30%', 'Score_Impact_25%', 'Venture_Name']
+STRONG_SCIENCE_MARK = '★★'
+HISTOGRAM_BINS = 20
+
+
+def _strong_science(levels):
+    return levels.astype('string').str.contains(
+        STRONG_SCIENCE_MARK, regex=False).fillna(False).to_numpy(dtype=bool)
+
+
+def _resized(mask, n_rows):
+    grown = np.zeros(n_rows, dtype=bool)
+    grown[:len(mask)] = mask
+    return grown
+
+
+def sort_rows(df, sort_col):
+    """Order filtered rows like the applicant list ('Relevance' keeps search order)."""
+    if sort_col == 'Relevance':
+        return df
+    return df.sort_values(sort_col, ascending=(sort_col == 'Venture_Name'))
+
+
+class FilterIndex:
+    """Row bitmaps and a memoized filter pipeline for one dataset version.
+
+    ``filter()`` returns the matching row positions (for ``df.iloc``) and is
+    cached on the filter tuple, so repeated reruns with unchanged filters
+    cost a dictionary lookup. With a search query the positions are in
+    relevance order.
+    """
+
+    def __init__(self, df, cache_size=128, search_index=None, texts=None, geo_index=None):
+        # Pass search_index/geo_index to reuse ones built over the same rows, e.g. after
+        # rescoring; texts is the TextStore holding the long fields left out of df
+        self.n_rows = len(df)
+        self.bitmaps = {}
+        for column in FILTER_COLUMNS:
+            codes, values = pd.factorize(df[column])
+            self.bitmaps[column] = {value: codes == i for i, value in enumerate(values)}
+        self.science_only = _strong_science(df['SCIENCE_LEVEL'])
+        self.scores = as_float64(df['WEIGHTED_SCORE'])
+        self.search_index = search_index if search_index is not None else SearchIndex(df, texts=texts)
+        self.geo = geo_index if geo_index is not None else GeoIndex(df)
+        self._finish(cache_size)
+
+    def _finish(self, cache_size):
+        self.counts = {
+            column: {value: int(mask.sum()) for value, mask in bitmaps.items()}
+            for column, bitmaps in self.bitmaps.items()
+        }
+        self.cache_size = cache_size
+        self.filter = functools.lru_cache(maxsize=cache_size)(self._filter)
+        self.distributions = functools.lru_cache(maxsize=cache_size)(self._distributions)
+        self.country_totals = functools.lru_cache(maxsize=cache_size)(self._country_totals)
+
+    def updated(self, df, positions, texts=None):
+        """Return a new index over df where only the rows at positions changed.
+
+        Positions past the previous end of the frame are appended rows; texts
+        is the matching TextStore version.
+        Bitmaps are patched rather than rebuilt and the search index gets a
+        new segment; this index stays valid for readers still holding it.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        rows = df.iloc[positions]
+        index = object.__new__(FilterIndex)
+        index.n_rows = len(df)
+        index.bitmaps = {}
+        for column in FILTER_COLUMNS:
+            values = rows[column].to_numpy(dtype=object)
+            bitmaps = {}
+            for value, mask in self.bitmaps[column].items():
+                bitmaps[value] = _resized(mask, index.n_rows)
+                bitmaps[value][positions] = False
+            for value in pd.unique(values[pd.notna(values)]):
+                bitmaps.setdefault(value, np.zeros(index.n_rows, dtype=bool))[positions[values == value]] = True
+            index.bitmaps[column] = {value: mask for value, mask in bitmaps.items() if mask.any()}
+
+        index.science_only = _resized(self.science_only, index.n_rows)
+        index.science_only[positions] = _strong_science(rows['SCIENCE_LEVEL'])
+        index.scores = np.full(index.n_rows, np.nan)
+        index.scores[:self.n_rows] = self.scores
+        index.scores[positions] = as_float64(rows['WEIGHTED_SCORE'])
+        index.search_index = self.search_index.updated(df, positions, texts)
+        index.geo = self.geo.updated(df, positions)
+        index._finish(self.cache_size)
+        return index
+
+    def options(self, column):
+        """Sorted distinct values of a filter column (NaN excluded)."""
+        return sorted(self.bitmaps[column])
+
+    def count_containing(self, column, text):
+        """Number of rows whose value in column contains text."""
+        return sum(count for value, count in self.counts[column].items() if text in str(value))
+
+    def _filter(self, recommendation='All', science_level='All', stage='All', search='', science_only=False,
+                country='All'):
+        mask = np.ones(self.n_rows, dtype=bool)
+        for column, value in zip(FILTER_COLUMNS, (recommendation, science_level, stage)):
+            if value != 'All':
+                selected = self.bitmaps[column].get(value)
+                if selected is None:
+                    mask[:] = False
+                else:
+                    mask &= selected
+
+        if science_only:
+            mask &= self.science_only
+
+        if country != 'All':
+            targeting = np.zeros(self.n_rows, dtype=bool)
+            targeting[self.geo.positions(country)] = True
+            mask &= targeting
+
+        if search.strip():
+            hits, _ = self.search_index.search(search)
+            positions = hits[mask[hits]]
+        else:
+            positions = np.flatnonzero(mask)
+
+        positions.setflags(write=False)
+        return positions
+
+    def _distributions(self, *filters):
+        """Chart aggregates for a filter state, small enough to key a figure cache.
+
+        Returns (science_counts, score_counts, score_edges): (level, count)
+        pairs in descending count order, and a HISTOGRAM_BINS-bin histogram
+        of WEIGHTED_SCORE.
+        """
+        positions = self.filter(*filters)
+        science = [
+            (value, int(np.count_nonzero(mask[positions])))
+            for value, mask in self.bitmaps['SCIENCE_LEVEL'].items()
+        ]
+        science = tuple(sorted((item for item in science if item[1] > 0), key=lambda item: -item[1]))
+
+        scores = self.scores[positions]
+        scores = scores[~np.isnan(scores)]
+        if len(scores) == 0:
+            return science, (), ()
+        counts, edges = np.histogram(scores, bins=HISTOGRAM_BINS)
+        return science, tuple(counts.tolist()), tuple(np.round(edges, 6).tolist())
+
+    def _country_totals(self, *filters):
+        """Per-country totals (see GeoIndex.totals) for a filter state."""
+        selected = np.zeros(self.n_rows, dtype=bool)
+        selected[self.filter(*filters)] = True
+        return self.geo.totals(selected, self.scores)
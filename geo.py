@@ -0,0 +1,181 @@
+"""
+TCCF Bold Ideas - target country index
+
+Target_Countries is free text ("Kenya, Tanzania , Uganda "). Each distinct
+value is split and normalized once (whitespace, accents, known misspellings
+and alternative names) into an applicant-country bridge: parallel arrays of
+row positions and country ids. Country filters then read a country's row
+positions, and per-country totals are a bincount over the bridge.
+"""
+
+import numpy as np
+import pandas as pd
+
+from search_index import fold
+
+COUNTRY_COLUMN = 'Target_Countries'
+
+# Canonical country names and ISO 3166-1 alpha-3 codes (for the map)
+COUNTRY_CODES = {
+    'Algeria': 'DZA', 'Angola': 'AGO', 'Benin': 'BEN', 'Botswana': 'BWA', 'Burkina Faso': 'BFA',
+    'Burundi': 'BDI', 'Cabo Verde': 'CPV', 'Cameroon': 'CMR', 'Central African Republic': 'CAF',
+    'Chad': 'TCD', 'Comoros': 'COM', "Cote d'Ivoire": 'CIV', 'Democratic Republic of the Congo': 'COD',
+    'Djibouti': 'DJI', 'Egypt': 'EGY', 'Equatorial Guinea': 'GNQ', 'Eritrea': 'ERI', 'Eswatini': 'SWZ',
+    'Ethiopia': 'ETH', 'Gabon': 'GAB', 'Gambia': 'GMB', 'Ghana': 'GHA', 'Guinea': 'GIN',
+    'Guinea-Bissau': 'GNB', 'Kenya': 'KEN', 'Lesotho': 'LSO', 'Liberia': 'LBR', 'Libya': 'LBY',
+    'Madagascar': 'MDG', 'Malawi': 'MWI', 'Mali': 'MLI', 'Mauritania': 'MRT', 'Mauritius': 'MUS',
+    'Morocco': 'MAR', 'Mozambique': 'MOZ', 'Namibia': 'NAM', 'Niger': 'NER', 'Nigeria': 'NGA',
+    'Republic of the Congo': 'COG', 'Rwanda': 'RWA', 'Sao Tome and Principe': 'STP', 'Senegal': 'SEN',
+    'Seychelles': 'SYC', 'Sierra Leone': 'SLE', 'Somalia': 'SOM', 'South Africa': 'ZAF',
+    'South Sudan': 'SSD', 'Sudan': 'SDN', 'Tanzania': 'TZA', 'Togo': 'TGO', 'Tunisia': 'TUN',
+    'Uganda': 'UGA', 'Zambia': 'ZMB', 'Zimbabwe': 'ZWE',
+}
+# Misspellings and alternative names seen in (or likely for) the application form
+COUNTRY_ALIASES = {
+    'rwande': 'Rwanda',
+    'drc': 'Democratic Republic of the Congo',
+    'dr congo': 'Democratic Republic of the Congo',
+    'congo drc': 'Democratic Republic of the Congo',
+    'congo kinshasa': 'Democratic Republic of the Congo',
+    'congo': 'Republic of the Congo',
+    'congo brazzaville': 'Republic of the Congo',
+    'republic of congo': 'Republic of the Congo',
+    'ivory coast': "Cote d'Ivoire",
+    'swaziland': 'Eswatini',
+    'cape verde': 'Cabo Verde',
+    'the gambia': 'Gambia',
+    'united republic of tanzania': 'Tanzania',
+}
+
+
+def _key(name):
+    """Lookup key ignoring accents, case, spacing, hyphens and brackets."""
+    return ' '.join(fold(name).replace('(', ' ').replace(')', ' ').replace('-', ' ').split())
+
+
+_CANONICAL = {_key(name): name for name in COUNTRY_CODES}
+_CANONICAL.update({_key(alias): name for alias, name in COUNTRY_ALIASES.items()})
+
+
+def normalize_country(name):
+    """Canonical country name, or the whitespace-normalized input if unknown."""
+    name = ' '.join(str(name).split())
+    return _CANONICAL.get(_key(name), name)
+
+
+def split_countries(value):
+    """Distinct normalized countries of one Target_Countries value, in order."""
+    if not isinstance(value, str):
+        return []
+    countries = (normalize_country(part) for part in value.split(','))
+    return list(dict.fromkeys(country for country in countries if country))
+
+
+def _numeric(df, column):
+    """A column as float64 (NaN when missing or unparseable)."""
+    if column not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+
+
+class GeoIndex:
+    """Applicant-country bridge for one dataset version.
+
+    ``rows``/``country_ids`` pair each row position with every country it
+    targets; ``positions(country)`` is the row positions targeting it.
+    ``updated()`` re-parses only the given rows and returns a new index.
+    """
+
+    def __init__(self, df):
+        self.n_rows = len(df)
+        self.plastic = _numeric(df, 'Plastic_Tonnes')
+        self.livelihoods = _numeric(df, 'Livelihoods')
+        self.countries = []
+        self._country_no = {}
+        rows, country_ids = self._bridge(df, np.arange(self.n_rows))
+        self._finish(rows, country_ids)
+
+    def _bridge(self, df, positions):
+        """Bridge entries for the rows at positions (each distinct value parsed once)."""
+        if COUNTRY_COLUMN not in df.columns or len(positions) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32)
+        codes, uniques = pd.factorize(df[COUNTRY_COLUMN].iloc[positions])
+        parsed = [
+            [self._country_no.setdefault(country, len(self._country_no)) for country in split_countries(value)]
+            for value in uniques
+        ]
+        self.countries = list(self._country_no)
+        lengths = np.array([len(ids) for ids in parsed], dtype=np.int64)
+        flat = np.array([i for ids in parsed for i in ids], dtype=np.int32)
+        value_starts = np.cumsum(lengths) - lengths
+
+        # Repeat each row once per country of its value; NaN values (code -1) have none
+        valid = codes >= 0
+        codes, positions = codes[valid], positions[valid]
+        counts = lengths[codes]
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.repeat(positions, counts), flat[np.repeat(value_starts[codes], counts) + within]
+
+    def _finish(self, rows, country_ids):
+        order = np.lexsort((rows, country_ids))
+        self.rows, self.country_ids = rows[order], country_ids[order]
+        self._indptr = np.zeros(len(self.countries) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.country_ids, minlength=len(self.countries)), out=self._indptr[1:])
+        # Applicants per country still targeted by some row, by name
+        self.counts = {c: int(n) for c, n in sorted(zip(self.countries, np.diff(self._indptr).tolist())) if n}
+
+    def updated(self, df, positions):
+        """Return a new index over df where only the rows at positions changed."""
+        positions = np.asarray(positions, dtype=np.int64)
+        index = object.__new__(GeoIndex)
+        index.n_rows = len(df)
+        index.countries = list(self.countries)
+        index._country_no = dict(self._country_no)
+        rows = df.iloc[positions]
+        for name, column in (('plastic', 'Plastic_Tonnes'), ('livelihoods', 'Livelihoods')):
+            values = np.full(index.n_rows, np.nan)
+            values[:self.n_rows] = getattr(self, name)
+            values[positions] = _numeric(rows, column)
+            setattr(index, name, values)
+
+        keep = ~np.isin(self.rows, positions)
+        new_rows, new_ids = index._bridge(df, positions)
+        index._finish(np.concatenate([self.rows[keep], new_rows]),
+                      np.concatenate([self.country_ids[keep], new_ids]))
+        return index
+
+    def positions(self, country):
+        """Sorted row positions targeting country (empty if none)."""
+        country_no = self._country_no.get(country)
+        if country_no is None:
+            return np.empty(0, dtype=np.int64)
+        return self.rows[self._indptr[country_no]:self._indptr[country_no + 1]]
+
+    def totals(self, mask, scores):
+        """Per-country totals over the rows selected by mask.
+
+        Returns (country, iso3, applicants, plastic tonnes, livelihoods,
+        mean score) tuples for countries with at least one selected row,
+        most applicants first.
+        """
+        selected = mask[self.rows]
+        rows, ids = self.rows[selected], self.country_ids[selected]
+        n = len(self.countries)
+
+        def sum_and_count(values):
+            values = values[rows]
+            present = ~np.isnan(values)
+            return (np.bincount(ids[present], weights=values[present], minlength=n),
+                    np.bincount(ids[present], minlength=n))
+
+        applicants = np.bincount(ids, minlength=n)
+        plastic, _ = sum_and_count(self.plastic)
+        livelihoods, _ = sum_and_count(self.livelihoods)
+        score_sum, scored = sum_and_count(scores)
+        mean_score = np.divide(score_sum, scored, out=np.full(n, np.nan), where=scored > 0)
+        order = sorted(np.flatnonzero(applicants), key=lambda i: (-applicants[i], self.countries[i]))
+        return tuple(
+            (self.countries[i], COUNTRY_CODES.get(self.countries[i]), int(applicants[i]),
+             float(plastic[i]), float(livelihoods[i]), round(float(mean_score[i]), 2))
+            for i in order
+        )
@@ -0,0 +1,497 @@
+"""
+TCCF Bold Ideas - incremental ingest
+
+Picks up applications added to the evaluation and application CSVs while the
+dashboard is running, without re-reading and re-merging everything. Appended
+rows are parsed from the new bytes only; a rewritten file is re-read and
+diffed by row hash. Either way only the new or changed rows are merged and
+pushed into the filter and search indexes. A rewrite that removes rows is
+the exception: everything is reloaded.
+
+With lazy=True (TCCF_LAZY_APPLICATIONS) the long application fields are
+not loaded at all but read from the export when a row needs them (see
+LazyTextStore). The search and duplicate indexes, built while loading,
+then cover the frame's own columns only; the similarity index, built in
+the background, still reads the long fields from the export.
+"""
+
+import io
+import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_loading import (APPLICATION_COLUMNS, APPLICATION_FIELDS, CACHE_DIR, CATEGORICAL_COLUMNS, CHUNK_ROWS,
+                          FLOAT32_COLUMNS, LAZY_APPLICATIONS, LONG_TEXT_FIELDS, load_compact,
+                          merge_application_fields, normalize_email, row_hashes)
+from dedup import DuplicateIndex
+from filters import FilterIndex
+from metrics import METRICS
+from rendering import RenderCache
+from search_index import SearchIndex
+from similar import SimilarityIndex
+
+# Bytes before the last read position that must be unchanged for an append
+TAIL_FINGERPRINT_BYTES = 4096
+
+# Dashboard column -> application export column
+APPLICATION_SOURCES = {column: source for column, source, _ in APPLICATION_FIELDS}
+
+Snapshot = namedtuple('Snapshot', ['frame', 'filter_index', 'version', 'renders', 'texts', 'duplicates', 'similar'])
+RefreshResult = namedtuple('RefreshResult', ['added', 'updated', 'removed'], defaults=[0])
+
+
+class SourceFile:
+    """Tracks how far a CSV has been read so appended rows can be parsed alone."""
+
+    def __init__(self, path, encoding=None):
+        self.path = path
+        self.encoding = encoding
+        with open(path, 'rb') as f:
+            self.header = f.readline()
+        self.mark(os.path.getsize(path))
+
+    def _tail(self, end):
+        with open(self.path, 'rb') as f:
+            f.seek(max(0, end - TAIL_FINGERPRINT_BYTES))
+            return f.read(end - max(0, end - TAIL_FINGERPRINT_BYTES))
+
+    def mark(self, size):
+        stat = os.stat(self.path)
+        self.size = size
+        self.mtime_ns = stat.st_mtime_ns
+        self.fingerprint = self._tail(size)
+
+    def changed(self):
+        stat = os.stat(self.path)
+        return stat.st_size != self.size or stat.st_mtime_ns != self.mtime_ns
+
+    def rewritten(self):
+        """Whether the bytes read so far changed (as opposed to rows being appended)."""
+        return os.path.getsize(self.path) < self.size or self._tail(self.size) != self.fingerprint
+
+    def read_appended(self):
+        """Rows appended since the last mark, or None if the file was rewritten.
+
+        Only complete lines are consumed, so a writer caught mid-row is
+        picked up on the next refresh.
+        """
+        if self.rewritten():
+            return None
+        size = os.path.getsize(self.path)
+        with open(self.path, 'rb') as f:
+            f.seek(self.size)
+            data = f.read(size - self.size)
+        data = data[:data.rfind(b'\n') + 1]
+        self.mark(self.size + len(data))
+        if not data.strip():
+            return pd.read_csv(io.BytesIO(self.header), encoding=self.encoding)
+        return pd.read_csv(io.BytesIO(self.header + data), encoding=self.encoding)
+
+    def read_all(self, **kwargs):
+        self.mark(os.path.getsize(self.path))
+        return pd.read_csv(self.path, encoding=self.encoding, **kwargs)
+
+
+class _Prefix(io.RawIOBase):
+    """The first size bytes of a binary file, as a readable stream."""
+
+    def __init__(self, f, size):
+        self._f = f
+        self._left = size
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = self._f.readinto(memoryview(buffer)[:self._left])
+        self._left -= n
+        return n
+
+
+def _cached_search_index(frame, texts, cache_dir):
+    """The BM25 index of one dataset version, saved next to its columnar cache."""
+    cache_dir = Path(cache_dir)
+    path = cache_dir / f"search-{frame.attrs['version']}.npz"
+    index = SearchIndex.cached(frame, texts, path)
+    if path.exists():
+        for stale in cache_dir.glob('search-*.npz'):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    return index
+
+
+def build_snapshot(frame, texts, cache_dir=CACHE_DIR, indexed_texts=None):
+    """Index a loaded frame and its text store into a Snapshot.
+
+    The search and duplicate indexes read long fields from indexed_texts
+    (the frame's columns only when None); the similarity index reads them
+    from texts and builds its vectors in the background.
+    """
+    with METRICS.stage('load_data.search_index'):
+        search_index = _cached_search_index(frame, indexed_texts, cache_dir)
+    with METRICS.stage('load_data.filter_index'):
+        filter_index = FilterIndex(frame, search_index=search_index)
+    with METRICS.stage('load_data.renders'):
+        renders = RenderCache(frame)
+    with METRICS.stage('load_data.duplicates'):
+        duplicates = DuplicateIndex.cached(frame, indexed_texts, cache_dir)
+    snapshot = Snapshot(frame, filter_index, frame.attrs['version'], renders, texts, duplicates,
+                        SimilarityIndex(frame, texts))
+    threading.Thread(target=METRICS.timed('load_data.similar')(snapshot.similar.prepare), daemon=True).start()
+    return snapshot
+
+
+class StaticDataset:
+    """A dataset that never changes, such as a past round from the round store.
+
+    Has LiveDataset's interface; ``refresh()`` never finds anything new.
+    """
+
+    def __init__(self, frame, texts, cache_dir=CACHE_DIR):
+        self.current = build_snapshot(_patchable(frame), texts, cache_dir, texts)
+
+    @property
+    def version(self):
+        """Version string of the current snapshot (changes with every update)."""
+        return self.current.version
+
+    def snapshot(self):
+        """The current snapshot with a read-only view of its frame.
+
+        The view is a shallow copy sharing the column data, so callers must
+        treat it as read-only (derive frames with assign() and the like, as
+        rescore() does); refresh() never writes to it either, see
+        _apply_rows().
+        """
+        current = self.current
+        return current._replace(frame=current.frame.copy(deep=False))
+
+    def refresh(self):
+        return RefreshResult(0, 0)
+
+    def invalidate(self):
+        return self.version
+
+
+class LiveDataset(StaticDataset):
+    """The merged dataset plus its indexes, refreshable in place.
+
+    One instance is shared by every session of the process. ``current`` is
+    an immutable Snapshot (frame, filter index, version, render cache, long
+    text store, duplicate index, similarity index); ``refresh()`` builds the next snapshot from the delta and
+    swaps it in, so readers holding an older snapshot are never affected.
+    ``snapshot()`` hands a caller its own view of the current one, and
+    ``invalidate()`` discards it and reloads from the source files.
+    """
+
+    def __init__(self, eval_path, orig_path=None, cache_dir=CACHE_DIR, lazy=LAZY_APPLICATIONS):
+        self._lock = threading.Lock()
+        self._paths = (eval_path, orig_path, cache_dir)
+        self._lazy = lazy
+        self._load()
+
+    def _load(self):
+        eval_path, orig_path, cache_dir = self._paths
+        self._eval_source = SourceFile(eval_path)
+        self._app_source = SourceFile(orig_path, encoding='utf-8-sig') if orig_path else None
+        # Filled in by _prepare() in the background
+        self._application_keys = None
+        self._pending = None
+        self._key_positions = None
+        self._refreshes = 0
+
+        with METRICS.stage('load_data.read'):
+            frame, texts = load_compact(eval_path, orig_path, cache_dir, lazy=self._lazy)
+            frame = _patchable(frame)
+        self._base_version = frame.attrs['version']
+        merged_columns = {column for column, _, _ in APPLICATION_FIELDS}
+        self._eval_columns = [column for column in frame.columns if column not in merged_columns]
+        self.current = build_snapshot(frame, texts, cache_dir, self._indexed(texts))
+
+        # Build the lookup tables for the first refresh in the background
+        threading.Thread(target=self._prepare, daemon=True).start()
+
+    def _indexed(self, texts):
+        """The text store the load-time indexes read long fields from (none in lazy mode)."""
+        return None if self._lazy else texts
+
+    def invalidate(self):
+        """Drop the current snapshot and reload everything from the sources.
+
+        For changes refresh() cannot follow incrementally, such as a source
+        path replaced by a different export. Returns the new version.
+        """
+        with self._lock:
+            self._load()
+        return self.version
+
+    def _sources_changed(self):
+        eval_source, app_source = self._eval_source, self._app_source
+        return eval_source.changed() or (app_source is not None and app_source.changed())
+
+    def _prepare(self):
+        with self._lock:
+            self._index_frame_keys(self.current.frame)
+            if self._app_source is not None:
+                self._load_applications()
+
+    def _index_frame_keys(self, frame):
+        if self._key_positions is None:
+            self._key_positions = {}
+            for position, key in enumerate(normalize_email(frame['Email'])):
+                self._key_positions.setdefault(key, []).append(position)
+
+    def refresh(self):
+        """Merge rows appended to or changed in the sources since the last call.
+
+        Returns a RefreshResult with the number of added, updated and removed
+        rows. Cheap (two stat calls) when nothing changed. A source rewritten
+        without some of the rows already loaded is reloaded in full, and then
+        every row kept counts as updated.
+        """
+        # Checked before taking the lock, which the background scan of the
+        # application export holds for seconds after a load
+        if not self._sources_changed():
+            return RefreshResult(0, 0)
+        with self._lock:
+            eval_changed = self._eval_source.changed()
+            app_changed = self._app_source is not None and self._app_source.changed()
+            if not (eval_changed or app_changed):
+                return RefreshResult(0, 0)
+            frame, texts = self.current.frame, self.current.texts
+            # The lazy text store's record offsets are void after a rewrite
+            if (self._lazy and app_changed and self._app_source.rewritten()) or self._rows_removed(
+                    frame, eval_changed, app_changed):
+                self._load()
+                ids, new_ids = pd.Index(frame['ID']), pd.Index(self.current.frame['ID'])
+                kept = int(ids.isin(new_ids).sum())
+                return RefreshResult(len(new_ids) - kept, kept, len(ids) - kept)
+
+            eval_rows = self._evaluation_delta(frame) if eval_changed else frame.iloc[:0][self._eval_columns]
+            app_rows = self._application_delta() if app_changed else None
+
+            merged = self._merge_delta(frame, texts, eval_rows, app_rows)
+            positions = pd.Index(frame['ID']).get_indexer(merged['ID'])
+            existing = positions >= 0
+            if existing.any():
+                current_rows = _full_rows(frame, texts, positions[existing])
+                unchanged = row_hashes(merged[existing]) == row_hashes(current_rows[merged.columns])
+                keep = ~existing
+                keep[np.flatnonzero(existing)[~unchanged]] = True
+                merged, positions, existing = merged[keep], positions[keep], existing[keep]
+            if merged.empty:
+                return RefreshResult(0, 0)
+
+            long_fields = [column for column in merged.columns if column in LONG_TEXT_FIELDS]
+            new_frame = _apply_rows(frame, merged.drop(columns=long_fields), positions)
+            if self._key_positions is not None:
+                self._index_keys(frame, merged, positions)
+            touched = positions.copy()
+            touched[~existing] = np.arange(len(frame), len(new_frame))
+            new_texts = texts.updated(merged[long_fields], touched, len(new_frame))
+            self._refreshes += 1
+            version = f'{self._base_version}+{self._refreshes}'
+            new_frame.attrs['version'] = version
+            indexed = self._indexed(new_texts)
+            filter_index = self.current.filter_index.updated(new_frame, touched, indexed)
+            renders = self.current.renders.updated(new_frame, touched)
+            duplicates = self.current.duplicates.updated(new_frame, touched, indexed)
+            similar = self.current.similar.updated(new_frame, touched, new_texts)
+            self.current = Snapshot(new_frame, filter_index, version, renders, new_texts, duplicates, similar)
+            # Rebuilds the vectors off the request thread (from scratch if the old ones weren't ready)
+            threading.Thread(target=METRICS.timed('refresh.similar')(similar.prepare), daemon=True).start()
+            return RefreshResult(int((~existing).sum()), int(existing.sum()))
+
+    def _rows_removed(self, frame, eval_changed, app_changed):
+        """Whether a rewritten source lost rows the current snapshot still has.
+
+        An evaluation whose ID is gone, or an application whose email is gone
+        (its fields must be cleared), can't be patched in: the caller reloads.
+        """
+        if eval_changed and self._eval_source.rewritten():
+            ids = pd.read_csv(self._eval_source.path, encoding=self._eval_source.encoding, usecols=['ID'])['ID']
+            if not pd.Index(frame['ID']).isin(ids).all():
+                return True
+        if app_changed and self._app_source.rewritten():
+            # Merged rows have the application columns filled (with '' at least)
+            merged = set(normalize_email(frame['Email'][frame['Website'].notna()]).dropna())
+            emails = pd.read_csv(self._app_source.path, encoding='utf-8-sig', usecols=['Email'])['Email']
+            if not merged <= set(normalize_email(emails).dropna()):
+                return True
+        return False
+
+    def _evaluation_delta(self, frame):
+        """Evaluation rows that are new or changed, by ID."""
+        rows = self._eval_source.read_appended()
+        if rows is None:
+            # Rewritten in place: re-read and keep rows whose hash changed
+            rows = self._eval_source.read_all()
+            columns = [c for c in self._eval_columns if c in rows.columns]
+            positions = pd.Index(frame['ID']).get_indexer(rows['ID'])
+            known = positions >= 0
+            changed = ~known
+            changed[known] = row_hashes(rows.loc[known, columns]) != row_hashes(frame.iloc[positions[known]][columns])
+            rows = rows[changed]
+        # An ID appearing twice in the delta keeps its latest row
+        return rows.drop_duplicates('ID', keep='last')
+
+    def _load_applications(self):
+        """Scan the application export once (in the background or on first use).
+
+        Records every email seen so far and keeps the truncated fields of
+        applications that have no evaluation yet, so their evaluation rows
+        can be merged later without re-reading the export.
+        """
+        if self._application_keys is not None:
+            return
+        self._index_frame_keys(self.current.frame)
+        self._reset_applications()
+        # Only the part already merged (appended bytes are the delta), streamed in chunks
+        with open(self._app_source.path, 'rb') as f:
+            chunks = pd.read_csv(io.BufferedReader(_Prefix(f, self._app_source.size)), encoding='utf-8-sig',
+                                 usecols=lambda column: column in APPLICATION_COLUMNS, chunksize=CHUNK_ROWS)
+            for rows in chunks:
+                self._add_applications(rows)
+
+    def _reset_applications(self):
+        self._application_keys = set()
+        self._pending = _pending_frame(pd.DataFrame(columns=APPLICATION_COLUMNS))
+
+    def _add_applications(self, rows):
+        """Record application rows; return those that are first for their email."""
+        keys = normalize_email(rows['Email'])
+        seen = np.array([key in self._application_keys for key in keys], dtype=bool)
+        first = (keys.notna() & ~keys.duplicated()).to_numpy() & ~seen
+        rows, keys = rows[first], keys[first]
+        self._application_keys.update(keys)
+
+        # Applications without an evaluation wait for their evaluation row
+        waiting = np.array([key not in self._key_positions for key in keys], dtype=bool)
+        if waiting.any():
+            self._pending = pd.concat([self._pending, _pending_frame(rows[waiting])])
+        return rows
+
+    def _application_delta(self):
+        """Application rows that are now the first (winning) row for their email."""
+        self._load_applications()
+        rows = self._app_source.read_appended()
+        if rows is None:
+            # Rewritten in place: start over from the full export
+            rows = self._app_source.read_all(usecols=lambda column: column in APPLICATION_COLUMNS)
+            self._reset_applications()
+        return self._add_applications(rows)
+
+    def _merge_delta(self, frame, texts, eval_rows, app_rows):
+        """Merge application fields into the evaluation rows affected by the delta."""
+        if self._app_source is None:
+            return eval_rows.reset_index(drop=True)
+        self._load_applications()
+
+        targets = eval_rows
+        lookups = []
+        if app_rows is not None and not app_rows.empty:
+            lookups.append(app_rows)
+            # Existing evaluations whose application just arrived or changed
+            delta_ids = set(eval_rows['ID'])
+            affected = [
+                position for key in normalize_email(app_rows['Email'])
+                for position in self._key_positions.get(key, [])
+                if frame['ID'].iat[position] not in delta_ids
+            ]
+            targets = pd.concat([eval_rows, frame.iloc[affected][self._eval_columns]], ignore_index=True)
+
+        if targets.empty:
+            return targets.reset_index(drop=True)
+
+        # Rows already merged keep their application text; truncation is idempotent
+        target_keys = set(normalize_email(targets['Email']).dropna())
+        merged_rows = [
+            position for key in target_keys for position in self._key_positions.get(key, [])
+            if pd.notna(frame['Website'].iat[position])
+        ]
+        lookups.append(_as_applications(_full_rows(frame, texts, merged_rows)))
+
+        found = set()
+        for lookup in lookups:
+            found.update(normalize_email(lookup['Email']).dropna())
+        missing = target_keys - found
+        if missing:
+            lookups.append(_as_applications(self._pending[self._pending.index.isin(list(missing))]))
+
+        lookup = pd.concat(lookups, ignore_index=True)
+        return merge_application_fields(targets.reset_index(drop=True), lookup)
+
+    def _index_keys(self, frame, rows, positions):
+        """Keep the email -> positions map in step with _apply_rows."""
+        old_keys = normalize_email(frame['Email'].iloc[positions[positions >= 0]])
+        for position, key in zip(positions[positions >= 0], old_keys):
+            self._key_positions[key].remove(position)
+        appended = iter(range(len(frame), len(frame) + int((positions < 0).sum())))
+        for position, key in zip(positions, normalize_email(rows['Email'])):
+            self._key_positions.setdefault(key, []).append(position if position >= 0 else next(appended))
+
+
+def _pending_frame(rows):
+    """Truncated application fields, indexed by normalized email."""
+    merged = merge_application_fields(rows[['Email']], rows)
+    merged.index = pd.Index(normalize_email(merged['Email']).to_numpy(dtype=object))
+    return merged
+
+
+def _full_rows(frame, texts, positions):
+    """Rows of frame at positions with their long text fields joined back in."""
+    rows = frame.iloc[positions].reset_index(drop=True)
+    return pd.concat([rows, texts.frame(positions)], axis=1)
+
+
+def _as_applications(merged_rows):
+    """Turn merged dashboard columns back into application export columns."""
+    return merged_rows[['Email'] + list(APPLICATION_SOURCES)].rename(columns=APPLICATION_SOURCES)
+
+
+def _patchable(frame):
+    """Store text columns as object arrays.
+
+    Arrow-backed strings are immutable and become chunked after a concat,
+    which makes every later row lookup copy the whole column; object
+    arrays can be patched and indexed in time proportional to the delta.
+    """
+    text = {column: frame[column].astype(object) for column in frame.columns
+            if isinstance(frame[column].dtype, pd.StringDtype)}
+    return frame.assign(**text)
+
+
+def _apply_rows(frame, rows, positions):
+    """Copy frame with rows written at positions (-1 appends).
+
+    Written columns are copied explicitly rather than relying on pandas
+    copy-on-write (only always on from pandas 3), so the arrays of the frame
+    passed in, which older snapshots and indexes still use, never change.
+    """
+    rows = rows.reindex(columns=frame.columns)
+    columns = {}
+    for column in frame.columns:
+        values = frame[column]
+        if column in CATEGORICAL_COLUMNS and isinstance(values.dtype, pd.CategoricalDtype):
+            missing = set(rows[column].dropna()) - set(values.cat.categories)
+            if missing:
+                values = values.cat.add_categories(sorted(missing))
+            rows[column] = pd.Categorical(rows[column], categories=values.cat.categories)
+        elif column in FLOAT32_COLUMNS:
+            rows[column] = rows[column].astype(values.dtype)
+        columns[column] = values
+
+    existing = positions >= 0
+    if existing.any():
+        for column, values in columns.items():
+            values = values.copy(deep=True)
+            values.iloc[positions[existing]] = rows[column].to_numpy()[existing]
+            columns[column] = values
+    frame = pd.DataFrame(columns, index=frame.index)
+    if (~existing).any():
+        frame = pd.concat([frame, rows[~existing]], ignore_index=True)
+    return frame
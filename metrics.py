@@ -0,0 +1,214 @@
+"""
+TCCF Bold Ideas - performance instrumentation
+
+Stage timers, cache hit/miss counters and rerun counts for the dashboard,
+exported in the Prometheus text format to a file and/or a local HTTP
+endpoint. Everything is off unless TCCF_METRICS, TCCF_METRICS_FILE or
+TCCF_METRICS_PORT is set: a disabled stage is a shared no-op context
+manager and a disabled counter is one attribute check.
+"""
+
+import contextlib
+import functools
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PREFIX = 'tccf'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_DISABLED = contextlib.nullcontext()
+
+
+def _label(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+class Metrics:
+    """Process-wide counters shared by every session.
+
+    ``stages`` maps a stage name to [runs, total, last, max] seconds,
+    ``caches`` a cache name to [lookups, misses] and ``lru`` an lru_cache
+    name to its latest cache_info().
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._server = None
+        self._serve_error = None
+        self.reset()
+
+    def reset(self):
+        self.stages = {}
+        self.caches = {}
+        self.lru = {}
+        self.reruns = 0
+
+    def stage(self, name):
+        """Context manager timing a stage (a no-op when disabled)."""
+        if not self.enabled:
+            return _DISABLED
+        return self._timer(name)
+
+    @contextlib.contextmanager
+    def _timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            with self._lock:
+                stats = self.stages.setdefault(name, [0, 0.0, 0.0, 0.0])
+                stats[0] += 1
+                stats[1] += seconds
+                stats[2] = seconds
+                stats[3] = max(stats[3], seconds)
+
+    def timed(self, name):
+        """Decorator timing every call of a function as a stage."""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self._timer(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def _count(self, name, miss):
+        with self._lock:
+            counts = self.caches.setdefault(name, [0, 0])
+            counts[miss] += 1
+
+    def counted(self, name, cache):
+        """Apply a memoizing decorator (e.g. st.cache_resource) and count its hits and misses.
+
+        Every call is a lookup; a miss is a call that reaches the function.
+        """
+        def decorate(func):
+            @functools.wraps(func)
+            def compute(*args, **kwargs):
+                if self.enabled:
+                    self._count(name, miss=True)
+                return func(*args, **kwargs)
+
+            cached = cache(compute)
+
+            @functools.wraps(func)
+            def lookup(*args, **kwargs):
+                if self.enabled:
+                    self._count(name, miss=False)
+                return cached(*args, **kwargs)
+            return lookup
+        return decorate
+
+    def lru_info(self, name, info):
+        """Record the cache_info() of an lru_cache (e.g. FilterIndex.filter)."""
+        if self.enabled:
+            self.lru[name] = info
+
+    def rerun(self):
+        """Count one script rerun."""
+        if self.enabled:
+            with self._lock:
+                self.reruns += 1
+
+    def prometheus_text(self):
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            stages = {name: list(stats) for name, stats in self.stages.items()}
+            caches = {name: list(counts) for name, counts in self.caches.items()}
+            lru, reruns = dict(self.lru), self.reruns
+
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f'# HELP {PREFIX}_{name} {help_text}')
+            lines.append(f'# TYPE {PREFIX}_{name} {kind}')
+            for suffix, labels, value in samples:
+                label_text = ','.join(f'{key}="{_label(text)}"' for key, text in labels.items())
+                lines.append(f'{PREFIX}_{name}{suffix}{{{label_text}}} {value}' if labels
+                             else f'{PREFIX}_{name}{suffix} {value}')
+
+        metric('reruns_total', 'counter', 'Dashboard script reruns.', [('', {}, reruns)])
+        metric('stage_seconds', 'summary', 'Time spent in each stage.', [
+            sample for name, (runs, total, _, _) in stages.items()
+            for sample in (('_sum', {'stage': name}, f'{total:.6f}'), ('_count', {'stage': name}, runs))
+        ])
+        metric('stage_last_seconds', 'gauge', 'Duration of the latest run of each stage.',
+               [('', {'stage': name}, f'{stats[2]:.6f}') for name, stats in stages.items()])
+        metric('stage_max_seconds', 'gauge', 'Longest run of each stage.',
+               [('', {'stage': name}, f'{stats[3]:.6f}') for name, stats in stages.items()])
+        metric('cache_requests_total', 'counter', 'Cached function calls by result.', [
+            sample for name, (lookups, misses) in caches.items()
+            for sample in (('', {'cache': name, 'result': 'hit'}, lookups - misses),
+                           ('', {'cache': name, 'result': 'miss'}, misses))
+        ])
+        metric('lru_cache_requests', 'gauge', 'Lookups in the current dataset index caches by result.', [
+            sample for name, info in lru.items()
+            for sample in (('', {'cache': name, 'result': 'hit'}, info.hits),
+                           ('', {'cache': name, 'result': 'miss'}, info.misses))
+        ])
+        metric('lru_cache_entries', 'gauge', 'Entries in the current dataset index caches.',
+               [('', {'cache': name}, info.currsize) for name, info in lru.items()])
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """Write prometheus_text() to path atomically (for a textfile collector).
+
+        Safe to call from concurrent sessions: each writer uses its own
+        temporary file.
+        """
+        path = Path(path)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            tmp.write_text(self.prometheus_text(), encoding='utf-8')
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def serve(self, port, host='127.0.0.1'):
+        """Serve prometheus_text() at http://host:port/metrics from a daemon thread (once).
+
+        Returns the server, or None when the port could not be bound; that
+        is reported once and not retried.
+        """
+        with self._lock:
+            if self._server is not None or self._serve_error is not None:
+                return self._server
+            metrics = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split('?')[0] not in ('/', '/metrics'):
+                        self.send_error(404)
+                        return
+                    body = metrics.prometheus_text().encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', CONTENT_TYPE)
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass
+
+            try:
+                self._server = ThreadingHTTPServer((host, port), Handler)
+            except OSError as error:
+                self._serve_error = error
+                print(f'Metrics endpoint disabled: cannot listen on {host}:{port} ({error})', file=sys.stderr)
+                return None
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+            return self._server
+
+
+METRICS_FILE = os.environ.get('TCCF_METRICS_FILE')
+METRICS_PORT = int(os.environ['TCCF_METRICS_PORT']) if os.environ.get('TCCF_METRICS_PORT') else None
+METRICS = Metrics(enabled=bool(os.environ.get('TCCF_METRICS') or METRICS_FILE or METRICS_PORT))
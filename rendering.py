@@ -0,0 +1,259 @@
+"""
+TCCF Bold Ideas - applicant markup
+
+Builds the list label, evaluation summary and detail blocks (score
+breakdown, contact, impact) for every applicant in one batched pass per
+dataset version. Results are cached by (ID, row hash), so reruns only look
+up prebuilt strings and incremental updates re-render just the rows that
+changed. The long application text is formatted when a detail view opens,
+straight from the TextStore.
+"""
+
+import html
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from data_loading import as_float64
+
+Rendered = namedtuple('Rendered', ['label', 'summary', 'scores', 'contact', 'impact'])
+
+SUMMARY_TEMPLATES = {
+    'recommend': (
+        "**{name}** demonstrates **strong scientific innovation** in their approach to plastic waste management. "
+        "Their solution involves *{what}*. "
+        "With a weighted score of **{score}/5.0**, this applicant shows excellent potential for the TCCF Bold Ideas program. "
+        "Their innovation score of **{innovation}/5** reflects genuine science-based differentiation. "
+    ),
+    'shortlist': (
+        "**{name}** presents a **promising science-enabled solution**. "
+        "Core offering: *{what}*. "
+        "Weighted score: **{score}/5.0**. Worth interviewing to assess technical depth and scalability. "
+        "Innovation score ({innovation}/5) suggests meaningful technical differentiation."
+    ),
+    'consider': (
+        "**{name}** shows **some scientific elements** in their approach. "
+        "Service: *{what}*. "
+        "Weighted score: **{score}/5.0**. "
+        "May warrant further review if stronger candidates don't fill cohort. Innovation score: {innovation}/5."
+    ),
+    'maybe': (
+        "**{name}** has **limited scientific differentiation**. "
+        "Offering: *{what}*. "
+        "Weighted score: **{score}/5.0**. "
+        "Innovation score ({innovation}/5) indicates conventional approach. Consider only if science capacity can be demonstrated."
+    ),
+    'other': (
+        "**{name}** does not meet the **science-based innovation threshold** for this program. "
+        "Approach: *{what}*. "
+        "Weighted score: **{score}/5.0**. "
+        "Innovation score ({innovation}/5) reflects generic or conventional methodology. Not recommended for TCCF Bold Ideas."
+    ),
+}
+PLASTIC_SENTENCE = "Projected plastic impact of **{plastic} tonnes** aligns well with program targets."
+
+SCORE_FIELDS = [
+    ('Innovation', '30%', 'Score_Innovation_30%'),
+    ('Impact', '25%', 'Score_Impact_25%'),
+    ('Social', '20%', 'Score_Social_20%'),
+    ('Commercial', '15%', 'Score_Commercial_15%'),
+    ('Team', '10%', 'Score_Team_10%'),
+]
+SCORE_BOX = """
+<div class="score-box">
+    <div class="score-value">{score}</div>
+    <div class="score-label">{label} ({weight})</div>
+    <div style="background: rgba(255,255,255,0.1); height: 4px; border-radius: 2px; margin-top: 0.5rem;">
+        <div style="width: {pct}%; height: 100%; background: #00d4aa; border-radius: 2px;"></div>
+    </div>
+</div>"""
+GRID = '<div style="display: grid; grid-template-columns: repeat({n}, 1fr); gap: 1rem;">{cells}</div>'
+
+# (column, heading, max characters shown)
+CONTENT_FIELDS = [
+    ('Science_Inputs', '**🔬 Science & Technical Inputs:**', 800),
+    ('Bold_Characteristics', '**💡 Bold Characteristics:**', 500),
+    ('Problem_Addressed', '**🎯 Problem Addressed:**', 400),
+    ('Team_Info', '**👥 Team Information:**', 500),
+]
+BENEFICIARIES_CHARS = 200
+
+
+def get_science_emoji(level):
+    """Get emoji for science level."""
+    if '★★★' in str(level):
+        return '🔬'
+    elif '★★☆' in str(level):
+        return '⚗️'
+    elif '★☆☆' in str(level):
+        return '🔧'
+    elif '☆☆☆' in str(level):
+        return '📦'
+    return '❓'
+
+
+def _summary_kind(rec):
+    rec = str(rec)
+    if 'STRONGLY' in rec or rec == '★ RECOMMEND':
+        return 'recommend'
+    if rec == 'SHORTLIST':
+        return 'shortlist'
+    if rec == 'CONSIDER':
+        return 'consider'
+    if 'MAYBE' in rec:
+        return 'maybe'
+    return 'other'
+
+
+def _per_value(series, func):
+    """Apply func once per distinct value of series (a repetitive column)."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    return np.array([func(value) for value in uniques], dtype=object)[codes]
+
+
+def _column(df, column):
+    """Object values of a column, or all-NaN when the column is absent."""
+    if column in df.columns:
+        return df[column].to_numpy(dtype=object)
+    return np.full(len(df), np.nan, dtype=object)
+
+
+def _scores(df, column):
+    """A score column as float64 values that print like the source (3.71)."""
+    return pd.Series(as_float64(df[column]), index=df.index)
+
+
+def _present(values):
+    """Mask of non-missing, non-empty values."""
+    return np.array([bool(pd.notna(value) and value) for value in values], dtype=bool)
+
+
+def eval_summaries(df):
+    """Evaluation summary markdown for every row of df."""
+    kinds = _per_value(df['RECOMMENDATION'], _summary_kind)
+    plastic = _column(df, 'Plastic_Tonnes')
+    big_plastic = (pd.to_numeric(pd.Series(plastic), errors='coerce') > 100).to_numpy()
+    summaries = [
+        SUMMARY_TEMPLATES[kind].format(name=name, what=what, score=score, innovation=innovation)
+        for kind, name, what, score, innovation in zip(
+            kinds, df['Venture_Name'], df['WHAT_THEY_DO'], _scores(df, 'WEIGHTED_SCORE'),
+            _scores(df, 'Score_Innovation_30%'))
+    ]
+    for i in np.flatnonzero(big_plastic & (kinds == 'recommend')):
+        summaries[i] += PLASTIC_SENTENCE.format(plastic=plastic[i])
+    return summaries
+
+
+def _labels(df):
+    emojis = _per_value(df['SCIENCE_LEVEL'], get_science_emoji)
+    return [
+        f"{emoji} **{name}** — Score: {score:.2f} | {rec}"
+        for emoji, name, score, rec in zip(emojis, df['Venture_Name'], _scores(df, 'WEIGHTED_SCORE'), df['RECOMMENDATION'])
+    ]
+
+
+def _score_blocks(df):
+    # Scores take few distinct values, so each box is formatted once per value
+    boxes = [
+        _per_value(_scores(df, column), lambda score, label=label, weight=weight: SCORE_BOX.format(
+            score=score, label=label, weight=weight, pct=float(score) * 20))
+        for label, weight, column in SCORE_FIELDS
+    ]
+    prefix, suffix = GRID.format(n=len(SCORE_FIELDS), cells='\0').split('\0')
+    return [prefix + ''.join(row) + suffix for row in zip(*boxes)]
+
+
+def _link(url, text):
+    return f'<a href="{html.escape(str(url))}" target="_blank">{text}</a>'
+
+
+def _contact_blocks(df):
+    text = {column: _per_value(pd.Series(_column(df, column)), lambda value: html.escape(str(value)))
+            for column in ['Contact', 'Email', 'Location', 'Stage', 'Legal_Status', 'Target_Countries']}
+    linkedin, website = _column(df, 'LinkedIn'), _column(df, 'Website')
+    has_linkedin, has_website = _present(linkedin), _present(website)
+    blocks = []
+    for i in range(len(df)):
+        cells = [
+            f"<div><p><strong>Contact:</strong> {text['Contact'][i]}</p><p><strong>Email:</strong> {text['Email'][i]}</p></div>",
+            f"<div><p><strong>Location:</strong> {text['Location'][i]}</p><p><strong>Stage:</strong> {text['Stage'][i]}</p></div>",
+            f"<div><p><strong>Legal Status:</strong> {text['Legal_Status'][i]}</p>"
+            + (f"<p>{_link(linkedin[i], 'LinkedIn Profile')}</p>" if has_linkedin[i] else '') + "</div>",
+            f"<div><p><strong>Target Countries:</strong> {text['Target_Countries'][i]}</p>"
+            + (f"<p>{_link(website[i], 'Website')}</p>" if has_website[i] else '') + "</div>",
+        ]
+        blocks.append(GRID.format(n=4, cells=''.join(cells)))
+    return blocks
+
+
+def _impact(df):
+    return [
+        (f"{plastic} tonnes", f"{livelihoods} people")
+        for plastic, livelihoods in zip(_column(df, 'Plastic_Tonnes'), _column(df, 'Livelihoods'))
+    ]
+
+
+def long_text_blocks(texts):
+    """Beneficiaries markdown and (heading, text) content blocks for one row.
+
+    texts maps field names to the row's long text (None when missing), as
+    returned by TextStore.row().
+    """
+    beneficiaries = texts.get('Beneficiaries')
+    beneficiaries = f"**Beneficiaries:** {beneficiaries[:BENEFICIARIES_CHARS]}..." if beneficiaries else ''
+    content = tuple(
+        (heading, texts[column][:limit]) for column, heading, limit in CONTENT_FIELDS if texts.get(column)
+    )
+    return beneficiaries, content
+
+
+def render_rows(df):
+    """Rendered markup for every row of df, in row order."""
+    if df.empty:
+        return []
+    return [Rendered(*parts) for parts in zip(
+        _labels(df), eval_summaries(df), _score_blocks(df), _contact_blocks(df), _impact(df))]
+
+
+def _hashes(df):
+    # Hashed by value in the frame's own dtypes; every version shares them
+    return pd.util.hash_pandas_object(df, index=False).tolist()
+
+
+class RenderCache:
+    """Prebuilt markup for one dataset version, keyed by (ID, row hash).
+
+    Index with a row position. ``updated()`` re-renders only the given rows
+    and returns a new cache, evicting the entries they replace; readers
+    holding this cache are unaffected.
+    """
+
+    def __init__(self, df):
+        self._keys = list(zip(df['ID'].tolist(), _hashes(df)))
+        self._entries = dict(zip(self._keys, render_rows(df)))
+
+    def __getitem__(self, position):
+        return self._entries[self._keys[position]]
+
+    def __len__(self):
+        return len(self._keys)
+
+    def updated(self, df, positions):
+        """Return a cache over df where only the rows at positions changed."""
+        positions = np.asarray(positions, dtype=np.int64)
+        rows = df.iloc[positions]
+        keys = list(zip(rows['ID'].tolist(), _hashes(rows)))
+
+        cache = object.__new__(RenderCache)
+        cache._keys = self._keys + [None] * (len(df) - len(self._keys))
+        cache._entries = dict(self._entries)
+        for position in positions[positions < len(self._keys)]:
+            cache._entries.pop(self._keys[position], None)
+        fresh = [key not in cache._entries for key in keys]
+        rendered = iter(render_rows(rows[fresh]))
+        for position, key, is_fresh in zip(positions, keys, fresh):
+            cache._keys[position] = key
+            if is_fresh:
+                cache._entries[key] = next(rendered)
+        return cache
@@ -0,0 +1,204 @@
+"""
+TCCF Bold Ideas - batch report pipeline
+
+Headless version of the dashboard for nightly jobs: load (from the same
+columnar cache), merge, optionally re-score, filter and report. Writes one
+shortlist CSV and one markdown file of applicant summaries per
+recommendation tier, plus a report.md overview. Summaries are rendered in
+a process pool, a few hundred rows per task with at most a few tasks in
+flight, so thousands of applicants stream through in bounded memory.
+
+Only the Streamlit-free modules are imported; neither streamlit nor plotly
+is loaded.
+
+Run with: python report.py reports/ --recommendation SHORTLIST --weight Innovation=40
+"""
+
+import argparse
+import collections
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from data_loading import APPLICATION_PATHS, EVAL_PATHS, as_float64, find_data_file, load_compact
+from export import iter_batches, write_csv
+from filters import SORT_COLUMNS, FilterIndex, sort_rows
+from rendering import SCORE_FIELDS, eval_summaries, get_science_emoji, long_text_blocks
+from scoring import DEFAULT_THRESHOLDS, DEFAULT_WEIGHTS, TIERS, rescore
+from search_index import SearchIndex
+
+# Rows per summary task sent to a worker
+SUMMARY_BATCH = 500
+# Tasks queued per worker, bounding the rows held in memory at once
+TASKS_PER_WORKER = 2
+
+
+def tier_slug(tier):
+    """File name stem for a recommendation tier ('★ STRONGLY RECOMMEND' -> 'strongly-recommend')."""
+    return re.sub(r'[^a-z0-9]+', '-', str(tier).lower()).strip('-')
+
+
+def _text(value):
+    return value if isinstance(value, str) else None
+
+
+def summary_markdown(rows):
+    """Markdown summary section for every row of rows (with long text joined)."""
+    summaries = eval_summaries(rows)
+    sections = []
+    for summary, row in zip(summaries, rows.to_dict('records')):
+        scores = ' · '.join(f"{label} {row[column]:.2f}" for label, _, column in SCORE_FIELDS)
+        details = ' · '.join(
+            row[column] for column in ['SCIENCE_LEVEL', 'Stage', 'Target_Countries'] if _text(row.get(column))
+        )
+        lines = [
+            f"### {get_science_emoji(row['SCIENCE_LEVEL'])} {row['Venture_Name']} — {row['WEIGHTED_SCORE']:.2f}",
+            f"*{details}*" if details else '',
+            summary,
+            f"**Scores:** {scores}",
+        ]
+        if 'Plastic_Tonnes' in row:
+            lines.append(f"**Impact:** {row['Plastic_Tonnes']} tonnes · {row.get('Livelihoods')} people")
+        beneficiaries, content = long_text_blocks({field: _text(value) for field, value in row.items()})
+        if beneficiaries:
+            lines.append(beneficiaries)
+        lines.extend(f"{heading} {text}" for heading, text in content)
+        sections.append('\n\n'.join(line for line in lines if line) + '\n\n')
+    return sections
+
+
+def map_batches(func, batches, executor=None, window=1):
+    """func(batch) for every batch, in order, with at most window batches in flight."""
+    if executor is None:
+        yield from map(func, batches)
+        return
+    pending = collections.deque()
+    for batch in batches:
+        pending.append(executor.submit(func, batch))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def write_summaries(rows, path, title, texts=None, executor=None, window=1, batch_size=SUMMARY_BATCH):
+    """Write the markdown summaries of rows (in order) to path."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"# {title}\n\n{len(rows)} applicants\n\n")
+        for sections in map_batches(summary_markdown, iter_batches(rows, batch_size, texts), executor, window):
+            f.writelines(sections)
+
+
+def parse_weight(text):
+    """'Innovation=40' -> ('Score_Innovation_30%', 40.0)."""
+    name, _, value = text.partition('=')
+    columns = {column.split('_')[1].casefold(): column for column in DEFAULT_WEIGHTS}
+    column = columns.get(name.strip().casefold())
+    if column is None:
+        raise argparse.ArgumentTypeError(f"unknown weight {name!r}; choose from {', '.join(map(str.title, columns))}")
+    try:
+        return column, float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'weight {text!r} is not NAME=NUMBER') from None
+
+
+def parse_threshold(text):
+    """'shortlist=3.1' -> ('shortlist', 3.1)."""
+    name, _, value = text.partition('=')
+    if name not in DEFAULT_THRESHOLDS:
+        raise argparse.ArgumentTypeError(f"unknown threshold {name!r}; choose from {', '.join(DEFAULT_THRESHOLDS)}")
+    try:
+        return name, float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'threshold {text!r} is not NAME=NUMBER') from None
+
+
+def build_report(df, texts, output_dir, tiers, filters=('All', 'All', '', False, 'All'), sort_col='WEIGHTED_SCORE',
+                 top=None, workers=1):
+    """Write per-tier shortlists and summaries for df to output_dir.
+
+    filters are the FilterIndex arguments after the recommendation
+    (science level, stage, search, science only, country). Returns
+    (tier, applicants, mean score, shortlist file, summary file) rows.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # The BM25 index is most of FilterIndex's build time and only serves a search
+    search = filters[2]
+    search_index = None if search.strip() else SearchIndex(df.iloc[:0])
+    filter_index = FilterIndex(df, search_index=search_index, texts=texts)
+    executor = ProcessPoolExecutor(workers) if workers > 1 else None
+    rows_written = []
+    try:
+        for tier in tiers:
+            positions = filter_index.filter(tier, *filters)
+            if len(positions) == 0:
+                continue
+            rows = sort_rows(df.iloc[positions], sort_col)
+            if top is not None:
+                rows = rows.iloc[:top]
+            stem = tier_slug(tier)
+            write_csv(rows, output_dir / f'{stem}.csv', texts=texts)
+            write_summaries(rows, output_dir / f'{stem}.md', tier, texts, executor, workers * TASKS_PER_WORKER)
+            mean = float(np.nanmean(as_float64(rows['WEIGHTED_SCORE'])))
+            rows_written.append((tier, len(rows), mean, f'{stem}.csv', f'{stem}.md'))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    with open(output_dir / 'report.md', 'w', encoding='utf-8') as f:
+        f.write("# TCCF Bold Ideas - applicant report\n\n")
+        f.write(f"{len(df)} applicants evaluated\n\n")
+        f.write("| Recommendation | Applicants | Avg score | Shortlist | Summaries |\n|---|---:|---:|---|---|\n")
+        for tier, count, mean, csv_name, md_name in rows_written:
+            f.write(f"| {tier} | {count} | {mean:.2f} | [{csv_name}]({csv_name}) | [{md_name}]({md_name}) |\n")
+    return rows_written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write TCCF Bold Ideas shortlists and applicant summaries.')
+    parser.add_argument('output_dir', type=Path, help='directory for report.md and the per-tier files')
+    parser.add_argument('--eval', dest='eval_path', help='evaluation CSV (default: auto-detect)')
+    parser.add_argument('--applications', dest='orig_path', help='application CSV (default: auto-detect)')
+    parser.add_argument('--recommendation', action='append', choices=TIERS,
+                        help='tier to report (repeatable; default: every tier)')
+    parser.add_argument('--science-level', default='All')
+    parser.add_argument('--stage', default='All')
+    parser.add_argument('--country', default='All', help='target country')
+    parser.add_argument('--search', default='')
+    parser.add_argument('--science-only', action='store_true', help='strong science (★★★ or ★★☆) only')
+    parser.add_argument('--weight', action='append', type=parse_weight, default=[],
+                        help='re-score with a sub-score weight, e.g. Innovation=40 (repeatable)')
+    parser.add_argument('--threshold', action='append', type=parse_threshold, default=[],
+                        help='re-score with a tier threshold, e.g. shortlist=3.1 (repeatable)')
+    parser.add_argument('--sort', default=None, choices=['Relevance'] + SORT_COLUMNS,
+                        help='default: WEIGHTED_SCORE, or Relevance when searching')
+    parser.add_argument('--top', type=int, help='applicants per tier (default: all)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='summary rendering processes (1 renders in this process)')
+    args = parser.parse_args(argv)
+
+    eval_path = args.eval_path or find_data_file(EVAL_PATHS)
+    if eval_path is None:
+        parser.error('evaluation data file not found; pass --eval')
+    orig_path = args.orig_path or find_data_file(APPLICATION_PATHS)
+
+    start = time.perf_counter()
+    df, texts = load_compact(eval_path, orig_path)
+    if args.weight or args.threshold:
+        df = rescore(df, {**DEFAULT_WEIGHTS, **dict(args.weight)}, {**DEFAULT_THRESHOLDS, **dict(args.threshold)})
+
+    filters = (args.science_level, args.stage, args.search, args.science_only, args.country)
+    sort_col = args.sort or ('Relevance' if args.search.strip() else 'WEIGHTED_SCORE')
+    tiers = args.recommendation or TIERS
+    written = build_report(df, texts, args.output_dir, tiers, filters, sort_col, args.top, max(args.workers, 1))
+    print(f'Reported {sum(row[1] for row in written)} applicants in {len(written)} tiers to {args.output_dir} '
+          f'({time.perf_counter() - start:.1f}s)', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
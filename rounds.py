@@ -0,0 +1,291 @@
+"""
+TCCF Bold Ideas - multi-round store
+
+Every program round (cohort) is imported once into a local SQLite file: the
+merged applicant rows in ``applicants`` and their long text in
+``application_texts``, both keyed and clustered on (round, row), so each
+round is a contiguous partition of the file. Queries push the
+recommendation, science-level, stage and score filters into SQL and a
+narrow covering index answers the per-round aggregates, so cross-round
+views over hundreds of thousands of applications only bring the counts and
+the listed rows into pandas. A single round is loaded back as the usual
+compact frame and TextStore for the full dashboard; its index caches live
+in a directory of their own, never in the live files' cache.
+
+Kept free of Streamlit imports.
+
+Run with: python rounds.py import 2025 --eval TCCF_Bold_Ideas_FINAL.csv --applications export.csv
+          python rounds.py list
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_loading import (APPLICATION_PATHS, CACHE_DIR, EVAL_PATHS, FLOAT32_COLUMNS, LONG_TEXT_FIELDS, as_float64,
+                          compact_types, find_data_file, load_compact)
+from text_store import TextStore
+
+ROUNDS_DB = Path(os.environ.get('TCCF_ROUNDS_DB', 'tccf_rounds.sqlite'))
+# Search and duplicate indexes of stored rounds, one subdirectory per round
+ROUNDS_CACHE_DIR = CACHE_DIR / 'rounds'
+
+# Columns every round has; the filters are pushed down on these
+FILTER_COLUMNS = ['RECOMMENDATION', 'SCIENCE_LEVEL', 'Stage']
+SCORE_COLUMN = 'WEIGHTED_SCORE'
+# Rows inserted per executemany() call
+INSERT_ROWS = 5_000
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS rounds (
+    round TEXT PRIMARY KEY, version TEXT, applicants INTEGER, columns TEXT, imported_at TEXT
+);
+CREATE TABLE IF NOT EXISTS applicants (
+    round TEXT, row INTEGER, RECOMMENDATION TEXT, SCIENCE_LEVEL TEXT, Stage TEXT, {SCORE_COLUMN} REAL,
+    PRIMARY KEY (round, row)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS application_texts (
+    round TEXT, row INTEGER, {', '.join(f'{field} TEXT' for field in LONG_TEXT_FIELDS)},
+    PRIMARY KEY (round, row)
+) WITHOUT ROWID;
+-- Covers every filter, so per-round aggregates never touch the wide rows
+CREATE INDEX IF NOT EXISTS applicants_filters
+    ON applicants (round, RECOMMENDATION, SCIENCE_LEVEL, Stage, {SCORE_COLUMN});
+-- Best-first listings across rounds stop after the first page of matches
+CREATE INDEX IF NOT EXISTS applicants_score ON applicants ({SCORE_COLUMN});
+"""
+
+
+def _quote(column):
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _sql_value(value):
+    """A frame cell as an SQLite value (NaN -> NULL, numpy scalars -> Python)."""
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _rows(df):
+    """The rows of df as tuples of SQLite values (float32 scores stored as the decimals they were)."""
+    columns = [as_float64(df[column]).astype(object) if column in FLOAT32_COLUMNS
+               else df[column].to_numpy(dtype=object) for column in df.columns]
+    for values in zip(*columns):
+        yield tuple(None if value is None or value is pd.NA else _sql_value(value) for value in values)
+
+
+def round_cache_dir(name, cache_dir=ROUNDS_CACHE_DIR):
+    """Cache directory for the indexes of one stored round (created if missing)."""
+    path = Path(cache_dir) / hashlib.sha256(str(name).encode()).hexdigest()[:16]
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+class RoundStore:
+    """Applicant data of every imported round in one SQLite file.
+
+    Filter arguments follow FilterIndex: 'All' (or None) leaves a column
+    unfiltered; ``rounds`` is a list of round names (default: all) and
+    ``score_range`` an inclusive (low, high) weighted-score range. Every
+    method opens its own short-lived connection, so one store can be shared
+    by all sessions.
+    """
+
+    def __init__(self, path=ROUNDS_DB):
+        self.path = Path(path)
+
+    def _connect(self, write=False):
+        if write:
+            connection = sqlite3.connect(self.path)
+            connection.executescript(SCHEMA)
+            return connection
+        return sqlite3.connect(f'file:{self.path}?mode=ro', uri=True)
+
+    def _read(self, sql, params=()):
+        connection = self._connect()
+        try:
+            return pd.read_sql_query(sql, connection, params=params)
+        finally:
+            connection.close()
+
+    def exists(self):
+        return self.path.exists()
+
+    def version(self):
+        """Changes whenever a round is imported or deleted (for cache keys)."""
+        stat = os.stat(self.path)
+        return f'{stat.st_size}-{stat.st_mtime_ns}'
+
+    def rounds(self):
+        """Imported rounds (round, applicants, version, imported_at), in name order."""
+        return self._read('SELECT round, applicants, version, imported_at FROM rounds ORDER BY round')
+
+    def import_round(self, name, frame, texts):
+        """Store a merged frame (without long text) and its TextStore as round name.
+
+        Replaces the round if it was imported before; columns new to the
+        store are added. Returns the number of applicants stored.
+        """
+        name = str(name)
+        columns = [column for column in frame.columns if column not in ('round', 'row')]
+        long_text = texts.frame(np.arange(len(frame)))
+        connection = self._connect(write=True)
+        try:
+            with connection:
+                known = {row[1] for row in connection.execute('PRAGMA table_info(applicants)')}
+                for column in columns:
+                    if column not in known:
+                        kind = 'REAL' if pd.api.types.is_float_dtype(frame[column]) else (
+                            'INTEGER' if pd.api.types.is_integer_dtype(frame[column]) else 'TEXT')
+                        connection.execute(f'ALTER TABLE applicants ADD COLUMN {_quote(column)} {kind}')
+                connection.execute('DELETE FROM applicants WHERE round = ?', (name,))
+                connection.execute('DELETE FROM application_texts WHERE round = ?', (name,))
+
+                prefix = pd.DataFrame({'round': name, 'row': np.arange(len(frame))})
+                for table, rows in (
+                    ('applicants', pd.concat([prefix, frame[columns].reset_index(drop=True)], axis=1)),
+                    ('application_texts', pd.concat([prefix, long_text[LONG_TEXT_FIELDS]], axis=1)),
+                ):
+                    sql = (f"INSERT INTO {table} ({', '.join(map(_quote, rows.columns))}) "
+                           f"VALUES ({', '.join('?' * len(rows.columns))})")
+                    for start in range(0, len(rows), INSERT_ROWS):
+                        connection.executemany(sql, _rows(rows.iloc[start:start + INSERT_ROWS]))
+
+                connection.execute(
+                    'INSERT OR REPLACE INTO rounds VALUES (?, ?, ?, ?, ?)',
+                    (name, f"{name}@{frame.attrs.get('version', '')}", len(frame), json.dumps(columns),
+                     datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')))
+            # Planner statistics, so filters pick the narrowest index
+            connection.execute('ANALYZE')
+        finally:
+            connection.close()
+        return len(frame)
+
+    def delete_round(self, name):
+        connection = self._connect(write=True)
+        try:
+            with connection:
+                for table in ('applicants', 'application_texts', 'rounds'):
+                    connection.execute(f'DELETE FROM {table} WHERE round = ?', (str(name),))
+        finally:
+            connection.close()
+
+    def load_round(self, name):
+        """(frame, TextStore) of one round, as load_compact() returns them for the live files."""
+        info = self._read('SELECT version, columns FROM rounds WHERE round = ?', (str(name),))
+        if info.empty:
+            raise KeyError(name)
+        columns = json.loads(info['columns'].iat[0])
+        frame = self._read(f"SELECT {', '.join(map(_quote, columns))} FROM applicants "
+                           f"WHERE round = ? ORDER BY row", (str(name),))
+        frame = compact_types(frame)
+        frame.attrs['version'] = info['version'].iat[0]
+        long_text = self._read(f"SELECT {', '.join(LONG_TEXT_FIELDS)} FROM application_texts "
+                               f"WHERE round = ? ORDER BY row", (str(name),))
+        return frame, TextStore.from_frame(long_text, LONG_TEXT_FIELDS)
+
+    @staticmethod
+    def _where(rounds=None, recommendation='All', science_level='All', stage='All', score_range=None):
+        """SQL condition and parameters for the filters."""
+        clauses, params = [], []
+        if rounds is not None:
+            rounds = [str(name) for name in rounds]
+            clauses.append(f"round IN ({', '.join('?' * len(rounds))})")
+            params.extend(rounds)
+        for column, value in zip(FILTER_COLUMNS, (recommendation, science_level, stage)):
+            if value is not None and value != 'All':
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if score_range is not None:
+            clauses.append(f'{SCORE_COLUMN} BETWEEN ? AND ?')
+            params.extend(float(bound) for bound in score_range)
+        return ' AND '.join(clauses) or '1', params
+
+    def options(self, column, rounds=None):
+        """Sorted distinct values of a filter column across rounds (NULL excluded)."""
+        if column not in FILTER_COLUMNS:
+            raise ValueError(f'{column!r} is not one of {FILTER_COLUMNS}')
+        where, params = self._where(rounds)
+        values = self._read(f'SELECT DISTINCT {column} AS value FROM applicants '
+                            f'WHERE {where} AND {column} IS NOT NULL', params)
+        return sorted(values['value'])
+
+    def score_range(self, rounds=None):
+        """(lowest, highest) weighted score across rounds, or None when empty."""
+        where, params = self._where(rounds)
+        low, high = self._read(f'SELECT MIN({SCORE_COLUMN}) AS low, MAX({SCORE_COLUMN}) AS high '
+                               f'FROM applicants WHERE {where}', params).iloc[0]
+        return None if pd.isna(low) else (float(low), float(high))
+
+    def counts(self, by='RECOMMENDATION', **filters):
+        """Applicants and mean score per round and value of by, for the filtered rows.
+
+        One row per (round, value) with columns round, <by>, applicants,
+        mean_score; computed in SQL from the covering index.
+        """
+        if by not in FILTER_COLUMNS:
+            raise ValueError(f'{by!r} is not one of {FILTER_COLUMNS}')
+        where, params = self._where(**filters)
+        return self._read(
+            f'SELECT round, {by}, COUNT(*) AS applicants, AVG({SCORE_COLUMN}) AS mean_score '
+            f'FROM applicants WHERE {where} GROUP BY round, {by} ORDER BY round, {by}', params)
+
+    def query(self, columns=None, order_by=SCORE_COLUMN, descending=True, limit=None, **filters):
+        """The filtered applicants across rounds, with a round column.
+
+        columns defaults to every stored column; order_by is any stored
+        column (best score first by default) and limit caps the rows read.
+        """
+        selected = ', '.join(['round'] + [_quote(column) for column in columns if column != 'round']) if columns else '*'
+        where, params = self._where(**filters)
+        sql = (f"SELECT {selected} FROM applicants WHERE {where} "
+               f"ORDER BY {_quote(order_by)} {'DESC' if descending else 'ASC'}, round, row")
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params = params + [int(limit)]
+        rows = self._read(sql, params)
+        return rows.drop(columns=['row'], errors='ignore')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Manage the multi-round TCCF Bold Ideas store.')
+    parser.add_argument('--db', type=Path, default=ROUNDS_DB, help=f'store file (default: {ROUNDS_DB})')
+    commands = parser.add_subparsers(dest='command', required=True)
+    add = commands.add_parser('import', help='import (or replace) a round from its CSVs')
+    add.add_argument('round', help='round name, e.g. 2025')
+    add.add_argument('--eval', dest='eval_path', help='evaluation CSV (default: auto-detect)')
+    add.add_argument('--applications', dest='orig_path', help='application CSV (default: auto-detect)')
+    commands.add_parser('list', help='list the imported rounds')
+    remove = commands.add_parser('delete', help='delete a round')
+    remove.add_argument('round')
+    args = parser.parse_args(argv)
+
+    store = RoundStore(args.db)
+    if args.command == 'import':
+        eval_path = args.eval_path or find_data_file(EVAL_PATHS)
+        if eval_path is None:
+            parser.error('evaluation data file not found; pass --eval')
+        orig_path = args.orig_path or find_data_file(APPLICATION_PATHS)
+        # A throwaway cache: load_compact() prunes other versions from its cache directory
+        with tempfile.TemporaryDirectory() as cache_dir:
+            frame, texts = load_compact(eval_path, orig_path, Path(cache_dir))
+            count = store.import_round(args.round, frame, texts)
+        print(f'Imported {count} applicants as round {args.round} into {args.db}', file=sys.stderr)
+    elif args.command == 'delete':
+        store.delete_round(args.round)
+    elif store.exists():
+        print(store.rounds().to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+TCCF Bold Ideas - batch scoring engine
+
+Recomputes WEIGHTED_SCORE and RECOMMENDATION for every applicant with
+configurable weights and thresholds. The weighted score is one matrix-vector
+product over the sub-score columns and the tiers are assigned with
+vectorized conditions, so re-ranking 100k applicants takes milliseconds.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from data_loading import as_float64
+
+# Sub-score columns carry their default weight in the name
+SCORE_COLUMN_RE = re.compile(r'^Score_(\w+?)_(\d+)%$')
+SCORE_COLUMNS = [
+    'Score_Innovation_30%',
+    'Score_Impact_25%',
+    'Score_Social_20%',
+    'Score_Commercial_15%',
+    'Score_Team_10%',
+]
+
+# The CSV's weighted scores were computed before the sub-scores were rounded to
+# one decimal, so recomputing from the published sub-scores can land on the
+# other side of a two-decimal rounding boundary: one unit in the last place
+CSV_SCORE_TOLERANCE = 0.01
+
+# Score cut-offs behind the committee's recommendation tiers
+DEFAULT_THRESHOLDS = {
+    'not_recommended': 2.5,  # below this: NOT RECOMMENDED
+    'maybe': 2.8,            # some science (★☆☆) at or above: MAYBE
+    'consider': 3.0,         # good/strong science (★★) at or above: CONSIDER
+    'shortlist': 3.2,        # ... plus innovation >= shortlist_innovation: SHORTLIST
+    'recommend': 3.3,        # strong science (★★★) plus recommend_innovation: RECOMMEND
+    'strongly': 3.5,         # ... at or above: STRONGLY RECOMMEND
+    'shortlist_innovation': 3.0,
+    'recommend_innovation': 3.8,
+}
+
+TIERS = [
+    '★ STRONGLY RECOMMEND',
+    '★ RECOMMEND',
+    'SHORTLIST',
+    'CONSIDER',
+    'MAYBE - Limited science',
+    'LOW PRIORITY',
+    'NOT RECOMMENDED',
+]
+
+
+def parse_weights(columns):
+    """Read the default weights from the sub-score column names."""
+    weights = {}
+    for column in columns:
+        match = SCORE_COLUMN_RE.match(column)
+        if match:
+            weights[column] = int(match.group(2)) / 100
+    return weights
+
+
+DEFAULT_WEIGHTS = parse_weights(SCORE_COLUMNS)
+
+
+def weighted_scores(df, weights=DEFAULT_WEIGHTS):
+    """Weighted score per applicant, rounded to two decimals like the CSV.
+
+    Weights are normalized to sum to one, so sliders don't need to.
+    """
+    columns = list(weights)
+    vector = np.array([weights[column] for column in columns], dtype=np.float64)
+    total = vector.sum()
+    if total <= 0:
+        return np.zeros(len(df))
+    matrix = as_float64(df[columns].to_numpy())
+    return np.round(matrix @ (vector / total), 2)
+
+
+def _science_flags(levels, mark):
+    """Boolean array: science level starts with the given stars."""
+    if isinstance(levels.dtype, pd.CategoricalDtype):
+        per_category = np.array([str(c).startswith(mark) for c in levels.cat.categories] + [False])
+        return per_category[levels.cat.codes.to_numpy()]
+    return levels.astype(str).str.startswith(mark).to_numpy()
+
+
+def recommendations(scores, innovation, levels, thresholds=DEFAULT_THRESHOLDS):
+    """Map weighted scores to recommendation tiers (vectorized)."""
+    t = {**DEFAULT_THRESHOLDS, **thresholds}
+    strong = _science_flags(levels, '★★★')
+    good = strong | _science_flags(levels, '★★☆')
+    some = _science_flags(levels, '★☆☆')
+    recommend_innovation = innovation >= t['recommend_innovation']
+
+    conditions = [
+        scores < t['not_recommended'],
+        strong & recommend_innovation & (scores >= t['strongly']),
+        strong & recommend_innovation & (scores >= t['recommend']),
+        good & (innovation >= t['shortlist_innovation']) & (scores >= t['shortlist']),
+        good & (scores >= t['consider']),
+        some & (scores >= t['maybe']),
+    ]
+    choices = [6, 0, 1, 2, 3, 4]
+    codes = np.select(conditions, choices, default=5)
+    return pd.Categorical.from_codes(codes, categories=TIERS)
+
+
+def rescore(df, weights=DEFAULT_WEIGHTS, thresholds=DEFAULT_THRESHOLDS):
+    """Return df with WEIGHTED_SCORE and RECOMMENDATION recomputed."""
+    scores = weighted_scores(df, weights)
+    innovation = as_float64(df['Score_Innovation_30%'])
+    tiers = recommendations(scores, innovation, df['SCIENCE_LEVEL'], thresholds)
+    return df.assign(WEIGHTED_SCORE=scores.astype(df['WEIGHTED_SCORE'].dtype), RECOMMENDATION=tiers)
@@ -0,0 +1,306 @@
+"""
+TCCF Bold Ideas - full-text search index
+
+An in-process inverted index over the venture fields and the merged
+application text. Tokens are accent-folded and case-folded, the last query
+term matches as a prefix (search-as-you-type), and hits are ranked with
+BM25.
+"""
+
+import bisect
+import os
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+SEARCH_FIELDS = [
+    'Venture_Name', 'WHAT_THEY_DO', 'Location',
+    'Science_Inputs', 'Bold_Characteristics', 'Problem_Addressed', 'Team_Info',
+]
+TOKEN_RE = re.compile(r'\w+')
+# ASCII fast path: blank out every non-word character, then split
+ASCII_SEPARATORS = str.maketrans({
+    chr(i): ' ' for i in range(128) if not (chr(i).isalnum() or chr(i) == '_')
+})
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Prefix expansion limits, so a two-letter query can't touch the whole vocabulary
+PREFIX_MIN_LENGTH = 3
+MAX_EXPANSIONS = 64
+SNIPPET_WIDTH = 80
+
+# Incremental updates add segments; past this many the index is rebuilt
+MAX_SEGMENTS = 16
+
+
+def fold(text):
+    """Strip accents and case-fold text ("Côte" -> "cote")."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text):
+    """Split text into folded word tokens."""
+    if text.isascii():
+        return text.lower().translate(ASCII_SEPARATORS).split()
+    return TOKEN_RE.findall(fold(text))
+
+
+def _fold_with_offsets(text):
+    """Fold text and map every folded character back to its source index."""
+    if text.isascii():
+        return text.lower(), None
+    folded, offsets = [], []
+    for i, char in enumerate(text):
+        piece = fold(char)
+        folded.append(piece)
+        offsets.extend([i] * len(piece))
+    return ''.join(folded), offsets
+
+
+class _Segment:
+    """Immutable postings for one batch of documents.
+
+    Postings are stored as one CSR structure sorted by term: ``indptr[t]``
+    to ``indptr[t + 1]`` slices ``doc_ids``/``term_freqs`` for term ``t``.
+    """
+
+    @classmethod
+    def from_arrays(cls, terms, indptr, doc_ids, term_freqs):
+        segment = object.__new__(cls)
+        segment.terms, segment.indptr, segment.doc_ids, segment.term_freqs = terms, indptr, doc_ids, term_freqs
+        return segment
+
+    def __init__(self, positions, rows, doc_lengths):
+        vocab = {}
+        doc_ids, term_ids, term_freqs = [], [], []
+        for doc, texts in zip(positions, rows):
+            tokens = tokenize('\n'.join(str(text) for text in texts if isinstance(text, str)))
+            doc_lengths[doc] = len(tokens)
+            for token, count in Counter(tokens).items():
+                term_ids.append(vocab.setdefault(token, len(vocab)))
+                term_freqs.append(count)
+            doc_ids.extend([doc] * (len(term_ids) - len(doc_ids)))
+
+        # Renumber terms alphabetically so prefixes are contiguous ranges
+        self.terms = sorted(vocab)
+        remap = np.empty(len(vocab), dtype=np.int64)
+        remap[[vocab[term] for term in self.terms]] = np.arange(len(self.terms))
+        term_ids = remap[np.asarray(term_ids, dtype=np.int64)]
+
+        order = np.argsort(term_ids, kind='stable')
+        self.doc_ids = np.asarray(doc_ids, dtype=np.int32)[order]
+        self.term_freqs = np.asarray(term_freqs, dtype=np.float32)[order]
+        self.indptr = np.zeros(len(self.terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_ids, minlength=len(self.terms)), out=self.indptr[1:])
+
+    def expand(self, term, prefix):
+        """Term ids matching a query term, optionally as a prefix."""
+        start = bisect.bisect_left(self.terms, term)
+        if not prefix:
+            return [start] if start < len(self.terms) and self.terms[start] == term else []
+        end = bisect.bisect_left(self.terms, term + '\uffff', lo=start)
+        return range(start, end)
+
+    def postings(self, term_id):
+        lo, hi = self.indptr[term_id], self.indptr[term_id + 1]
+        return self.doc_ids[lo:hi], self.term_freqs[lo:hi]
+
+
+class SearchIndex:
+    """BM25-ranked inverted index over one dataset version.
+
+    Documents are identified by their row position in the indexed frame.
+    The index is a list of immutable segments; ``updated()`` indexes only
+    new or changed rows into a fresh segment and returns a new index, so
+    earlier versions stay valid for readers that still hold them.
+    """
+
+    def __init__(self, df, fields=SEARCH_FIELDS, texts=None, segment=None):
+        # Fields missing from df are read from texts (a TextStore) when it has them;
+        # segment is (postings, doc_lengths) of an index saved over the same rows
+        self.texts = texts
+        long_fields = set(texts.fields) if texts is not None else set()
+        self.fields = [field for field in fields if field in df.columns or field in long_fields]
+        self._columns = {field: df[field].to_numpy(dtype=object) for field in self.fields if field in df.columns}
+        self.n_docs = len(df)
+        if segment is None:
+            self.doc_lengths = np.zeros(self.n_docs, dtype=np.float32)
+            positions = range(self.n_docs)
+            segment = _Segment(positions, self._documents(positions), self.doc_lengths)
+        else:
+            segment, self.doc_lengths = segment
+        self.segments = [segment]
+        self._owner = np.zeros(self.n_docs, dtype=np.int32)
+        self._update_norms()
+
+    @classmethod
+    def cached(cls, df, texts, path, fields=SEARCH_FIELDS):
+        """Index for df, read from path (.npz) when it was saved over the same rows, else built and saved.
+
+        path must be specific to the dataset version, like the columnar
+        cache files. A cache that can't be read or written is rebuilt.
+        """
+        path = Path(path)
+        long_fields = set(texts.fields) if texts is not None else set()
+        indexed = [field for field in fields if field in df.columns or field in long_fields]
+        index = None
+        try:
+            with np.load(path) as saved:
+                if saved['fields'].tolist() == indexed and len(saved['doc_lengths']) == len(df):
+                    segment = _Segment.from_arrays(saved['terms'].tolist(), saved['indptr'], saved['doc_ids'],
+                                                   saved['term_freqs'])
+                    index = cls(df, fields, texts, segment=(segment, saved['doc_lengths']))
+        except (OSError, ValueError, KeyError):
+            pass
+        if index is None:
+            index = cls(df, fields, texts)
+            try:
+                index.save(path)
+            except OSError:
+                pass
+        return index
+
+    def save(self, path):
+        """Write the postings of a freshly built (single-segment) index to path (.npz)."""
+        if len(self.segments) != 1:
+            raise ValueError('only a single-segment index can be saved')
+        segment = self.segments[0]
+        path = Path(path)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        try:
+            with open(tmp, 'wb') as f:
+                np.savez(f, fields=np.array(self.fields, dtype=str), terms=np.array(segment.terms, dtype=str),
+                         indptr=segment.indptr, doc_ids=segment.doc_ids, term_freqs=segment.term_freqs,
+                         doc_lengths=self.doc_lengths)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def _text(self, position, field):
+        column = self._columns.get(field)
+        if column is not None:
+            return column[position]
+        return self.texts.get(position, field)
+
+    def _documents(self, positions):
+        """The searchable field values of each row at positions."""
+        for position in positions:
+            yield [self._text(position, field) for field in self.fields]
+
+    def _update_norms(self):
+        self.avg_length = float(self.doc_lengths.mean()) if self.n_docs else 0.0
+        self._norm = K1 * (1 - B + B * self.doc_lengths / max(self.avg_length, 1.0))
+
+    def updated(self, df, positions, texts=None):
+        """Return a new index over df where only the rows at positions changed.
+
+        Positions past the previous end of the frame are appended rows; texts
+        is the matching TextStore version. The index is rebuilt from scratch
+        once it accumulates MAX_SEGMENTS.
+        """
+        texts = texts if texts is not None else self.texts
+        if len(self.segments) >= MAX_SEGMENTS:
+            return SearchIndex(df, self.fields, texts)
+
+        index = object.__new__(SearchIndex)
+        index.fields = self.fields
+        index.texts = texts
+        index.n_docs = len(df)
+        positions = np.asarray(positions, dtype=np.int64)
+        index._columns = {}
+        for field, old in self._columns.items():
+            column = np.empty(index.n_docs, dtype=object)
+            column[:self.n_docs] = old
+            column[positions] = df[field].iloc[positions].to_numpy(dtype=object)
+            index._columns[field] = column
+        index.doc_lengths = np.zeros(index.n_docs, dtype=np.float32)
+        index.doc_lengths[:self.n_docs] = self.doc_lengths
+        index._owner = np.zeros(index.n_docs, dtype=np.int32)
+        index._owner[:self.n_docs] = self._owner
+
+        index.segments = self.segments + [_Segment(positions, index._documents(positions), index.doc_lengths)]
+        index._owner[positions] = len(index.segments) - 1
+        index._update_norms()
+        return index
+
+    def _expand(self, term, prefix):
+        """Map each vocabulary term matching a query term to its postings."""
+        prefix = prefix and len(term) >= PREFIX_MIN_LENGTH
+        matches = {}
+        for segment_no, segment in enumerate(self.segments):
+            for term_id in segment.expand(term, prefix):
+                matches.setdefault(segment.terms[term_id], []).append((segment_no, term_id))
+        if len(matches) > MAX_EXPANSIONS:
+            by_freq = sorted(matches, key=lambda t: -sum(
+                self.segments[s].indptr[i + 1] - self.segments[s].indptr[i] for s, i in matches[t]))
+            matches = {term: matches[term] for term in by_freq[:MAX_EXPANSIONS]}
+        return matches.values()
+
+    def search(self, query):
+        """Return (positions, scores) of documents matching every query term.
+
+        Results are ordered by descending BM25 score. The last term is
+        matched as a prefix unless the query ends with whitespace.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return np.arange(0), np.zeros(0, dtype=np.float32)
+
+        scores = np.zeros(self.n_docs, dtype=np.float32)
+        matched = np.ones(self.n_docs, dtype=bool)
+        for i, term in enumerate(terms):
+            prefix = i == len(terms) - 1 and not query[-1:].isspace()
+            term_hit = np.zeros(self.n_docs, dtype=bool)
+            for postings in self._expand(term, prefix):
+                found = [self.segments[s].postings(t) + (s,) for s, t in postings]
+                # Document frequency counts superseded postings too, as Lucene does
+                doc_freq = sum(len(docs) for docs, _, _ in found)
+                idf = np.log1p((self.n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+                for docs, tf, segment_no in found:
+                    if len(self.segments) > 1:
+                        live = self._owner[docs] == segment_no
+                        docs, tf = docs[live], tf[live]
+                    scores[docs] += idf * tf * (K1 + 1) / (tf + self._norm[docs])
+                    term_hit[docs] = True
+            matched &= term_hit
+
+        positions = np.flatnonzero(matched)
+        order = np.argsort(-scores[positions], kind='stable')
+        return positions[order], scores[positions][order]
+
+    def snippet(self, position, query, width=SNIPPET_WIDTH):
+        """Return a short "Field: ...**match**..." excerpt for a search hit."""
+        terms = tokenize(query)
+        if not terms:
+            return ''
+        pattern = re.compile(r'\b(' + '|'.join(re.escape(term) for term in terms) + r')\w*')
+        for field in self.fields:
+            text = self._text(position, field)
+            if not isinstance(text, str):
+                continue
+            folded, offsets = _fold_with_offsets(text)
+            match = pattern.search(folded)
+            if not match:
+                continue
+            start, end = match.span()
+            if offsets is not None:
+                start, end = offsets[start], offsets[end - 1] + 1
+            left = max(0, start - width // 2)
+            right = min(len(text), end + width // 2)
+            excerpt = (
+                ('…' if left > 0 else '') + text[left:start] + '**' + text[start:end] + '**'
+                + text[end:right] + ('…' if right < len(text) else '')
+            )
+            label = field.replace('_', ' ')
+            return f"{label}: {' '.join(excerpt.split())}"
+        return ''
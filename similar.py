@@ -0,0 +1,195 @@
+"""
+TCCF Bold Ideas - similar ventures
+
+TF-IDF vectors over what each venture does and its application text, with
+an inverted (term -> documents) copy of the sparse matrix so that the
+cosine top-k for a row only touches the postings of that row's own terms:
+a lookup costs milliseconds instead of a pass over every applicant.
+Everything is plain numpy; no model download or network access.
+"""
+
+import functools
+import threading
+
+import numpy as np
+
+from search_index import tokenize
+
+# Team and beneficiary descriptions say little about the venture itself
+SIMILAR_FIELDS = ['WHAT_THEY_DO', 'Science_Inputs', 'Bold_Characteristics', 'Problem_Addressed']
+STOP_WORDS = frozenset("""
+    about also and are based been being but can could for from has have into its more most
+    our such than that the their them then there these they this those through using very
+    was were what when which while who will with within without would your
+""".split())
+TOP_K = 5
+# Score matrix cells per top_k() batch (rows x applicants, float64)
+BATCH_CELLS = 4_000_000
+# Rows whose long text fields are read from the text store at once
+READ_BATCH = 4096
+CACHE_SIZE = 256
+
+
+def _terms(text_values, vocab):
+    """Term ids and counts (sorted by id) for one document."""
+    counts = {}
+    for text in text_values:
+        if isinstance(text, str):
+            for token in tokenize(text):
+                if len(token) > 2 and token not in STOP_WORDS and not token.isdigit():
+                    term = vocab.setdefault(token, len(vocab))
+                    counts[term] = counts.get(term, 0) + 1
+    ids = np.fromiter(counts, dtype=np.int32, count=len(counts))
+    tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    order = np.argsort(ids)
+    return ids[order], tf[order]
+
+
+def _ranges(starts, lengths):
+    """Concatenated np.arange(start, start + length) for every pair."""
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(lengths.sum())
+
+
+class SimilarityIndex:
+    """Cosine nearest neighbours over TF-IDF vectors for one dataset version.
+
+    Documents are row positions. Term counts and the matrix are built once,
+    under a lock, on first use (``prepare()`` does it ahead of time, e.g. in
+    a background thread); after that, ``updated()`` only re-reads the new or
+    changed rows and returns a new index.
+    """
+
+    def __init__(self, df, texts=None, fields=SIMILAR_FIELDS):
+        long_fields = set(texts.fields) if texts is not None else set()
+        self.fields = [field for field in fields if field in df.columns or field in long_fields]
+        self.n_docs = len(df)
+        self._source = (df, texts)
+        # Append-only and shared by later versions, which only add terms
+        self._vocab = {}
+        self._init_cache(rows=None)
+
+    def _init_cache(self, rows):
+        self._lock = threading.RLock()
+        self._collected = rows
+        self._built = None
+        self.similar = functools.lru_cache(maxsize=CACHE_SIZE)(self._similar)
+
+    def _read(self, df, texts, positions):
+        """Term ids and counts of the rows at positions, reading long fields a batch at a time."""
+        positions = np.asarray(positions, dtype=np.int64)
+        columns = {field: df[field].to_numpy(dtype=object) for field in self.fields if field in df.columns}
+        long_fields = [field for field in self.fields if field not in columns]
+        for start in range(0, len(positions), READ_BATCH):
+            batch = positions[start:start + READ_BATCH]
+            # One sequential pass per batch: a lazy store reads its export in file order
+            long = texts.frame(batch) if long_fields else None
+            values = [columns[field][batch] if field in columns else long[field].to_numpy(dtype=object)
+                      for field in self.fields]
+            for row in zip(*values):
+                yield _terms(row, self._vocab)
+
+    @property
+    def _rows(self):
+        """Term ids and counts of every row, collected once."""
+        with self._lock:
+            if self._collected is None:
+                df, texts = self._source
+                self._collected = list(self._read(df, texts, np.arange(self.n_docs)))
+                self._source = None
+            return self._collected
+
+    def prepare(self):
+        """Build the vectors and postings now rather than on the first lookup."""
+        return self._matrix
+
+    def updated(self, df, positions, texts=None):
+        """Return a new index over df where only the rows at positions changed."""
+        collected = self._collected
+        if collected is None:
+            # Nothing collected yet: the new version starts from scratch just as cheaply
+            return SimilarityIndex(df, texts, self.fields)
+        index = object.__new__(SimilarityIndex)
+        index.fields = self.fields
+        index.n_docs = len(df)
+        index._source = None
+        index._vocab = self._vocab
+        rows = collected + [None] * (index.n_docs - self.n_docs)
+        positions = np.asarray(positions, dtype=np.int64)
+        for position, row in zip(positions.tolist(), self._read(df, texts, positions)):
+            rows[position] = row
+        index._init_cache(rows=rows)
+        return index
+
+    @property
+    def _matrix(self):
+        """L2-normalized TF-IDF rows (CSR) and the same weights by term (CSC), built once."""
+        with self._lock:
+            if self._built is None:
+                self._built = self._build_matrix(self._rows)
+            return self._built
+
+    def _build_matrix(self, rows):
+        lengths = np.fromiter((len(ids) for ids, _ in rows), dtype=np.int64, count=len(rows))
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        empty_ids, empty_tf = np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        indices = np.concatenate([ids for ids, _ in rows] or [empty_ids])
+        tf = np.concatenate([tf for _, tf in rows] or [empty_tf])
+
+        n_terms = int(indices.max()) + 1 if len(indices) else 0
+        doc_freq = np.bincount(indices, minlength=n_terms)
+        idf = np.log((1 + self.n_docs) / (1 + doc_freq)) + 1
+        weights = ((1 + np.log(tf)) * idf[indices]).astype(np.float32)
+        doc_of = np.repeat(np.arange(len(rows)), lengths)
+        norms = np.sqrt(np.bincount(doc_of, weights=weights.astype(np.float64) ** 2, minlength=len(rows)))
+        weights /= norms[doc_of]
+
+        order = np.argsort(indices, kind='stable')
+        col_ptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(doc_freq, out=col_ptr[1:])
+        return indptr, indices, weights, col_ptr, doc_of[order].astype(np.int32), weights[order]
+
+    def top_k(self, positions, k=TOP_K):
+        """Nearest rows by cosine similarity for every row at positions.
+
+        Returns (neighbours, scores), both shaped (len(positions), k), best
+        first; slots beyond a row's matches hold -1 and 0. A row never
+        matches itself.
+        """
+        indptr, indices, weights, col_ptr, col_docs, col_weights = self._matrix
+        positions = np.asarray(positions, dtype=np.int64)
+        k = min(k, max(self.n_docs - 1, 0))
+        neighbours = np.full((len(positions), k), -1, dtype=np.int64)
+        scores = np.zeros((len(positions), k))
+        batch_rows = max(1, BATCH_CELLS // max(self.n_docs, 1))
+        for start in range(0, len(positions), batch_rows):
+            batch = positions[start:start + batch_rows]
+            # Query terms of the batch, then every posting of those terms
+            lengths = indptr[batch + 1] - indptr[batch]
+            entries = _ranges(indptr[batch], lengths)
+            query = np.repeat(np.arange(len(batch)), lengths)
+            terms = indices[entries]
+            hits = col_ptr[terms + 1] - col_ptr[terms]
+            postings = _ranges(col_ptr[terms], hits)
+            cells = np.repeat(query, hits) * self.n_docs + col_docs[postings]
+            contributions = np.repeat(weights[entries], hits) * col_weights[postings]
+            similarity = np.bincount(cells, weights=contributions, minlength=len(batch) * self.n_docs)
+            similarity = similarity.reshape(len(batch), self.n_docs)
+            similarity[np.arange(len(batch)), batch] = 0
+            if k == 0:
+                continue
+            best = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+            best_scores = np.take_along_axis(similarity, best, axis=1)
+            order = np.argsort(-best_scores, axis=1, kind='stable')
+            best = np.take_along_axis(best, order, axis=1)
+            best_scores = np.take_along_axis(best_scores, order, axis=1)
+            found = best_scores > 0
+            neighbours[start:start + len(batch)] = np.where(found, best, -1)
+            scores[start:start + len(batch)] = np.where(found, best_scores, 0)
+        return neighbours, scores
+
+    def _similar(self, position, k=TOP_K):
+        neighbours, scores = self.top_k([position], k)
+        found = neighbours[0] >= 0
+        return tuple(zip(neighbours[0][found].tolist(), scores[0][found].tolist()))
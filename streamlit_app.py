@@ -8,22 +8,26 @@ Requirements:
     pip install streamlit pandas plotly openpyxl
 """
 
+import functools
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
 
-# Page config
-st.set_page_config(
-    page_title="TCCF Bold Ideas | Science Innovation Dashboard",
-    page_icon="🌊",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+from data_loading import APPLICATION_PATHS, EVAL_PATHS, find_data_file
+from export import EXPORT_FORMATS, export_file
+from filters import SORT_COLUMNS, FilterIndex, sort_rows
+from ingest import LiveDataset, StaticDataset
+from metrics import METRICS, METRICS_FILE, METRICS_PORT
+from rendering import long_text_blocks
+from rounds import FILTER_COLUMNS as ROUND_FILTER_COLUMNS, ROUNDS_DB, RoundStore, round_cache_dir
+from scoring import DEFAULT_THRESHOLDS, DEFAULT_WEIGHTS, rescore
 
 # Custom CSS
-st.markdown("""
+PAGE_CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&display=swap');
     
@@ -138,61 +142,223 @@ st.markdown("""
         color: #ffffff !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Main content header
+PAGE_HEADER = """
+    <div style="text-align: center; padding: 1rem 0 2rem;">
+        <span style="background: rgba(0, 212, 170, 0.2); border: 1px solid rgba(0, 212, 170, 0.3); 
+              padding: 0.5rem 1.5rem; border-radius: 100px; color: #00d4aa; font-size: 0.85rem;
+              text-transform: uppercase; letter-spacing: 0.1em;">
+            🔬 Science-Based Innovation Evaluation
+        </span>
+        <h1 style="font-size: 2.5rem; margin: 1rem 0 0.5rem; background: linear-gradient(135deg, #ff6b4a, #00d4aa);
+            -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 700;">
+            Africa's Boldest Plastic Solutions
+        </h1>
+        <p style="color: #8ba3c7; font-size: 1rem; max-width: 700px; margin: 0 auto;">
+            Identifying scientists, innovators, and startups for $120K in funding
+        </p>
+    </div>
+    """
+
+# Round selector entries besides the stored rounds
+LIVE_ROUND = "Current files"
+ALL_ROUNDS = "All rounds (compare)"
+# Columns and length of the cross-round applicant listing
+OVERVIEW_COLUMNS = ['Venture_Name', 'RECOMMENDATION', 'SCIENCE_LEVEL', 'Stage', 'Target_Countries', 'WEIGHTED_SCORE']
+OVERVIEW_ROWS = 100
 
 
-@st.cache_data
+def configure_page():
+    """Page config and custom CSS (the first Streamlit calls of a run)."""
+    st.set_page_config(
+        page_title="TCCF Bold Ideas | Science Innovation Dashboard",
+        page_icon="🌊",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+
+@METRICS.counted('load_data', st.cache_resource)
 def load_data():
-    """Load evaluation data and merge with original application data."""
+    """Load evaluation data merged with original application data.
+    
+    Returns a process-wide LiveDataset, shared read-only by every session,
+    that picks up new applications incrementally via refresh().
+    """
     # Try multiple paths for the evaluation file
-    eval_paths = [
-        'TCCF_Bold_Ideas_FINAL.csv',
-        '/mnt/user-data/outputs/TCCF_Bold_Ideas_FINAL.csv',
-        './TCCF_Bold_Ideas_FINAL.csv'
-    ]
-    
-    eval_df = None
-    for path in eval_paths:
-        try:
-            eval_df = pd.read_csv(path)
-            break
-        except FileNotFoundError:
-            continue
-    
-    if eval_df is None:
+    eval_path = find_data_file(EVAL_PATHS)
+    if eval_path is None:
         st.error("Evaluation data file not found. Please ensure TCCF_Bold_Ideas_FINAL.csv is in the same directory.")
         return None
     
-    # Try to load original application data for extended fields
-    orig_paths = [
-        'Bold_Ideas_Database_2e27323557b980b0bd23d3d58431f8c5_all.csv',
-        '/mnt/user-data/uploads/Bold_Ideas_Database_2e27323557b980b0bd23d3d58431f8c5_all.csv'
-    ]
-    
-    orig_df = None
-    for path in orig_paths:
-        try:
-            orig_df = pd.read_csv(path, encoding='utf-8-sig')
-            break
-        except FileNotFoundError:
-            continue
-    
-    # Merge if original data is available
-    if orig_df is not None:
-        for idx, row in eval_df.iterrows():
-            email = row['Email']
-            orig_match = orig_df[orig_df['Email'] == email]
-            if len(orig_match) > 0:
-                orig = orig_match.iloc[0]
-                eval_df.loc[idx, 'Science_Inputs'] = str(orig.get('Science Inputs', ''))[:1000] if pd.notna(orig.get('Science Inputs', '')) else ''
-                eval_df.loc[idx, 'Bold_Characteristics'] = str(orig.get('Bold Characteristics', ''))[:600] if pd.notna(orig.get('Bold Characteristics', '')) else ''
-                eval_df.loc[idx, 'Problem_Addressed'] = str(orig.get('Problem Addressed', ''))[:500] if pd.notna(orig.get('Problem Addressed', '')) else ''
-                eval_df.loc[idx, 'Beneficiaries'] = str(orig.get('Beneficiaries', ''))[:400] if pd.notna(orig.get('Beneficiaries', '')) else ''
-                eval_df.loc[idx, 'Team_Info'] = str(orig.get('Team', ''))[:600] if pd.notna(orig.get('Team', '')) else ''
-                eval_df.loc[idx, 'LinkedIn'] = str(orig.get('LinkedIn', '')) if pd.notna(orig.get('LinkedIn', '')) else ''
-                eval_df.loc[idx, 'Website'] = str(orig.get('Website / app link', '')) if pd.notna(orig.get('Website / app link', '')) else ''
-    
-    return eval_df
+    # Original application data is optional (extended fields only)
+    orig_path = find_data_file(APPLICATION_PATHS)
+    
+    # Served from the on-disk columnar cache unless a source file changed
+    return LiveDataset(eval_path, orig_path)
+
+
+@METRICS.counted('rescored_data', st.cache_resource(max_entries=8))
+def rescored_data(version, weights, thresholds, _df, _filter_index, _renders):
+    """Re-rank one dataset version with custom weights and thresholds.
+
+    Only the score and recommendation columns change, so the search and
+    country indexes of the original version are shared and only re-ranked
+    rows are re-rendered.
+    """
+    df = rescore(_df, dict(weights), dict(thresholds))
+    changed = np.flatnonzero(
+        (df['WEIGHTED_SCORE'].to_numpy() != _df['WEIGHTED_SCORE'].to_numpy())
+        | (df['RECOMMENDATION'].astype(str).to_numpy() != _df['RECOMMENDATION'].astype(str).to_numpy())
+    )
+    filter_index = FilterIndex(df, search_index=_filter_index.search_index, geo_index=_filter_index.geo)
+    return df, filter_index, _renders.updated(df, changed)
+
+
+@METRICS.counted('round_options', st.cache_resource(max_entries=4))
+def round_options(store_version, _store):
+    """Stored round names, filter options and score range for one store version."""
+    names = _store.rounds()['round'].tolist()
+    options = {column: _store.options(column) for column in ROUND_FILTER_COLUMNS}
+    return names, options, _store.score_range()
+
+
+@METRICS.counted('round_data', st.cache_resource(max_entries=4))
+def round_data(name, store_version, _store):
+    """One stored round as a StaticDataset, indexed like the live files."""
+    frame, texts = _store.load_round(name)
+    return StaticDataset(frame, texts, round_cache_dir(name))
+
+
+@METRICS.counted('round_overview', st.cache_resource(max_entries=64))
+def round_overview(store_version, filters, _store):
+    """Per-round counts and the best applicants for one filter state, queried from the store."""
+    rounds, recommendation, science_level, stage, score_range = filters
+    filters = dict(rounds=list(rounds), recommendation=recommendation, science_level=science_level, stage=stage,
+                   score_range=score_range)
+    return _store.counts(**filters), _store.query(OVERVIEW_COLUMNS, limit=OVERVIEW_ROWS, **filters)
+
+
+def scoring_controls():
+    """Sidebar sliders for the score weights and recommendation thresholds."""
+    with st.expander("⚖️ Scoring weights"):
+        weights = {}
+        for column, weight in DEFAULT_WEIGHTS.items():
+            label = column.split('_')[1]
+            weights[column] = st.slider(label, 0, 100, int(weight * 100), step=5, key=f"weight_{column}") / 100
+        st.caption("Weights are normalized to sum to 100%.")
+        thresholds = {}
+        for name in ['not_recommended', 'maybe', 'consider', 'shortlist', 'recommend', 'strongly']:
+            label = f"{name.replace('_', ' ').capitalize()} from"
+            thresholds[name] = st.slider(label, 1.0, 5.0, DEFAULT_THRESHOLDS[name], step=0.05, key=f"threshold_{name}")
+    return weights, {**DEFAULT_THRESHOLDS, **thresholds}
+
+
+@METRICS.counted('science_pie', st.cache_resource(max_entries=64))
+def science_pie(science_counts):
+    """Science level pie from (level, count) pairs."""
+    names, values = zip(*science_counts)
+    fig = px.pie(
+        values=values,
+        names=names,
+        color_discrete_sequence=['#00d4aa', '#4fffdb', '#fbbf24', '#f87171', '#94a3b8'],
+        hole=0.4
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white', size=10),
+        showlegend=True,
+        legend=dict(bgcolor='rgba(0,0,0,0)', font=dict(size=9)),
+        margin=dict(t=20, b=20, l=20, r=20),
+        height=300
+    )
+    return fig
+
+
+@METRICS.counted('score_histogram', st.cache_resource(max_entries=64))
+def score_histogram(counts, edges):
+    """Score histogram drawn as bars from pre-binned counts."""
+    fig = go.Figure(go.Bar(
+        x=[(lo + hi) / 2 for lo, hi in zip(edges, edges[1:])],
+        y=counts,
+        width=[hi - lo for lo, hi in zip(edges, edges[1:])],
+        marker_color='#00d4aa',
+        hovertemplate='%{x:.2f}: %{y}<extra></extra>'
+    ))
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        xaxis=dict(gridcolor='rgba(255,255,255,0.1)', title='Weighted Score'),
+        yaxis=dict(gridcolor='rgba(255,255,255,0.1)', title='Count'),
+        margin=dict(t=20, b=40, l=40, r=20),
+        height=300,
+        bargap=0
+    )
+    return fig
+
+
+# Map metric -> field of a GeoIndex.totals() row
+MAP_METRICS = {'Applicants': 2, 'Plastic tonnes': 3, 'Livelihoods': 4, 'Avg score': 5}
+
+
+@METRICS.counted('country_map', st.cache_resource(max_entries=64))
+def country_map(country_totals, metric):
+    """Choropleth of one per-country total over Africa."""
+    mapped = [row for row in country_totals if row[1]]
+    fig = go.Figure(go.Choropleth(
+        locations=[row[1] for row in mapped],
+        z=[row[MAP_METRICS[metric]] for row in mapped],
+        text=[row[0] for row in mapped],
+        customdata=[row[2:] for row in mapped],
+        colorscale=[[0, '#134e4a'], [1, '#00d4aa']],
+        marker_line_color='rgba(255,255,255,0.3)',
+        colorbar=dict(title=metric),
+        hovertemplate=(
+            '<b>%{text}</b><br>Applicants: %{customdata[0]}<br>Plastic: %{customdata[1]:,.0f} t'
+            '<br>Livelihoods: %{customdata[2]:,.0f}<br>Avg score: %{customdata[3]:.2f}<extra></extra>'
+        )
+    ))
+    fig.update_geos(scope='africa', bgcolor='rgba(0,0,0,0)', showframe=False, landcolor='#1e293b')
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        margin=dict(t=20, b=20, l=20, r=20),
+        height=420
+    )
+    return fig
+
+
+@METRICS.counted('round_chart', st.cache_resource(max_entries=64))
+def round_chart(round_counts):
+    """Stacked bars of applicants per round by recommendation, from (round, recommendation, count) rows."""
+    fig = go.Figure()
+    recommendations = sorted({row[1] for row in round_counts})
+    for rec in recommendations:
+        rows = [row for row in round_counts if row[1] == rec]
+        fig.add_trace(go.Bar(
+            x=[row[0] for row in rows],
+            y=[row[2] for row in rows],
+            name=rec,
+            marker_color=get_recommendation_color(rec),
+            hovertemplate='%{x}: %{y}<extra>' + rec + '</extra>'
+        ))
+    fig.update_layout(
+        barmode='stack',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        xaxis=dict(type='category', title='Round'),
+        yaxis=dict(gridcolor='rgba(255,255,255,0.1)', title='Applicants'),
+        legend=dict(bgcolor='rgba(0,0,0,0)', font=dict(size=9)),
+        margin=dict(t=20, b=40, l=40, r=20),
+        height=360
+    )
+    return fig
 
 
 def get_recommendation_color(rec):
@@ -212,63 +378,230 @@ def get_recommendation_color(rec):
     return '#ef4444'
 
 
-def get_science_emoji(level):
-    """Get emoji for science level."""
-    if '★★★' in str(level):
-        return '🔬'
-    elif '★★☆' in str(level):
-        return '⚗️'
-    elif '★☆☆' in str(level):
-        return '🔧'
-    elif '☆☆☆' in str(level):
-        return '📦'
-    return '❓'
-
-
-def generate_eval_summary(row):
-    """Generate evaluation summary text for an applicant."""
-    rec = row['RECOMMENDATION']
-    name = row['Venture_Name']
-    what = row['WHAT_THEY_DO']
-    score = row['WEIGHTED_SCORE']
-    innovation = row['Score_Innovation_30%']
-    plastic = row.get('Plastic_Tonnes', 0)
-    
-    if 'STRONGLY' in rec or rec == '★ RECOMMEND':
-        summary = f"**{name}** demonstrates **strong scientific innovation** in their approach to plastic waste management. "
-        summary += f"Their solution involves *{what}*. "
-        summary += f"With a weighted score of **{score}/5.0**, this applicant shows excellent potential for the TCCF Bold Ideas program. "
-        summary += f"Their innovation score of **{innovation}/5** reflects genuine science-based differentiation. "
-        try:
-            if plastic and float(plastic) > 100:
-                summary += f"Projected plastic impact of **{plastic} tonnes** aligns well with program targets."
-        except:
-            pass
-    elif rec == 'SHORTLIST':
-        summary = f"**{name}** presents a **promising science-enabled solution**. "
-        summary += f"Core offering: *{what}*. "
-        summary += f"Weighted score: **{score}/5.0**. Worth interviewing to assess technical depth and scalability. "
-        summary += f"Innovation score ({innovation}/5) suggests meaningful technical differentiation."
-    elif rec == 'CONSIDER':
-        summary = f"**{name}** shows **some scientific elements** in their approach. "
-        summary += f"Service: *{what}*. "
-        summary += f"Weighted score: **{score}/5.0**. "
-        summary += f"May warrant further review if stronger candidates don't fill cohort. Innovation score: {innovation}/5."
-    elif 'MAYBE' in rec:
-        summary = f"**{name}** has **limited scientific differentiation**. "
-        summary += f"Offering: *{what}*. "
-        summary += f"Weighted score: **{score}/5.0**. "
-        summary += f"Innovation score ({innovation}/5) indicates conventional approach. Consider only if science capacity can be demonstrated."
-    else:
-        summary = f"**{name}** does not meet the **science-based innovation threshold** for this program. "
-        summary += f"Approach: *{what}*. "
-        summary += f"Weighted score: **{score}/5.0**. "
-        summary += f"Innovation score ({innovation}/5) reflects generic or conventional methodology. Not recommended for TCCF Bold Ideas."
-    
-    return summary
+def render_applicant_details(rendered, long_text, similar):
+    """Render the full detail view for one applicant.
+
+    rendered is its prebuilt markup; long_text is the (beneficiaries,
+    content) pair built from the text store when the view opens, and
+    similar lists (venture, recommendation, score, similarity) of the
+    closest other applicants.
+    """
+    # Evaluation Summary Box
+    st.markdown("""
+    <div class="eval-box">
+        <div class="eval-title">📋 Evaluation Summary</div>
+    </div>
+    """, unsafe_allow_html=True)
+    st.markdown(rendered.summary)
+    
+    # Score Breakdown
+    st.markdown('<p class="section-title">Score Breakdown</p>', unsafe_allow_html=True)
+    st.markdown(rendered.scores, unsafe_allow_html=True)
+    
+    # Contact & Basic Info
+    st.markdown('<p class="section-title">Contact & Basic Information</p>', unsafe_allow_html=True)
+    st.markdown(rendered.contact, unsafe_allow_html=True)
+    
+    # Impact Metrics
+    st.markdown('<p class="section-title">Impact Metrics</p>', unsafe_allow_html=True)
+    
+    plastic, livelihoods = rendered.impact
+    beneficiaries, content = long_text
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Plastic Impact", plastic)
+    with col2:
+        st.metric("Livelihoods", livelihoods)
+    with col3:
+        if beneficiaries:
+            st.markdown(beneficiaries)
+    
+    # Application Content
+    if content:
+        st.markdown('<p class="section-title">Application Content</p>', unsafe_allow_html=True)
+        for heading, text in content:
+            st.markdown(heading)
+            st.info(text)
+    
+    # Nearest applicants by application text, for comparison
+    if similar:
+        st.markdown('<p class="section-title">Similar Ventures</p>', unsafe_allow_html=True)
+        st.markdown('\n'.join(
+            f"- **{name}** — {rec} | Score: {score:.2f} · {similarity:.0%} similar"
+            for name, rec, score, similarity in similar
+        ))
+
+
+# Likely duplicate submissions
+DUPLICATE_COLUMNS = {
+    'ID': 'ID',
+    'Venture_Name': 'Venture',
+    'Email': 'Email',
+    'WEIGHTED_SCORE': 'Score',
+    'RECOMMENDATION': 'Recommendation',
+}
+DUPLICATE_ROWS_SHOWN = 500
+
+
+def render_duplicates(df, duplicates):
+    """Table of likely duplicate applications, grouped by cluster."""
+    members = duplicates.members[:DUPLICATE_ROWS_SHOWN]
+    table = df.iloc[members][list(DUPLICATE_COLUMNS)].rename(columns=DUPLICATE_COLUMNS)
+    table.insert(0, 'Cluster', df['ID'].to_numpy()[duplicates.cluster[members]])
+    table['Similarity'] = np.round(duplicates.similarity[members] * 100)
+    st.dataframe(
+        table,
+        hide_index=True,
+        width='stretch',
+        column_config={'Similarity': st.column_config.NumberColumn(format="%d%%")},
+    )
+    if len(duplicates.members) > len(members):
+        st.caption(f"Showing the first {len(members)} of {len(duplicates.members)} applications.")
+
+
+# Applicant list pagination
+PAGE_SIZES = [10, 25, 50, 100]
+SUMMARY_COLUMNS = {
+    'Venture_Name': 'Venture',
+    'RECOMMENDATION': 'Recommendation',
+    'SCIENCE_LEVEL': 'Science Level',
+    'WEIGHTED_SCORE': 'Score',
+    'Stage': 'Stage',
+    'Location': 'Location',
+}
 
 
+def shift_page(step, n_pages):
+    """Move the applicant list by one page (button callback)."""
+    page = st.session_state.get('applicant_page', 1) + step
+    st.session_state['applicant_page'] = min(max(page, 1), n_pages)
+
+
+def render_applicant_list(sorted_df, list_key, rendered, long_text, similar, snippet=None):
+    """Render one page of applicants as a compact table with on-demand details.
+    
+    rendered maps a row label to its prebuilt markup, long_text to its
+    application text blocks and similar to its nearest ventures (the last
+    two only looked up for opened rows); snippet, when given, maps a row
+    label to a search excerpt shown under it.
+    """
+    state = st.session_state
+    
+    # Back to the first page whenever filters or sort order change
+    if state.get('applicant_list_key') != list_key:
+        state['applicant_list_key'] = list_key
+        state['applicant_page'] = 1
+    
+    page_size = state.get('applicant_page_size', PAGE_SIZES[1])
+    n_pages = max(1, -(-len(sorted_df) // page_size))
+    state['applicant_page'] = min(state.get('applicant_page', 1), n_pages)
+    page = state['applicant_page']
+    
+    nav = st.columns([1, 2, 1, 2])
+    with nav[0]:
+        st.button("◀ Prev", on_click=shift_page, args=(-1, n_pages), disabled=page <= 1)
+    with nav[1]:
+        st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, key='applicant_page')
+    with nav[2]:
+        st.button("Next ▶", on_click=shift_page, args=(1, n_pages), disabled=page >= n_pages)
+    with nav[3]:
+        st.selectbox("Per page", PAGE_SIZES, index=1, key='applicant_page_size')
+    
+    start = (page - 1) * page_size
+    page_df = sorted_df.iloc[start:start + page_size]
+    
+    st.dataframe(
+        page_df[list(SUMMARY_COLUMNS)].rename(columns=SUMMARY_COLUMNS),
+        hide_index=True,
+        width='stretch'
+    )
+    
+    # Labels and details are prebuilt per dataset version; only opened rows are drawn
+    for idx, row_id in zip(page_df.index, page_df['ID']):
+        markup = rendered(idx)
+        opened = st.toggle(markup.label, key=f"open_{row_id}")
+        if snippet is not None:
+            excerpt = snippet(idx)
+            if excerpt:
+                st.caption(excerpt)
+        if opened:
+            with st.container():
+                render_applicant_details(markup, long_text(idx), similar(idx))
+
+
+def performance_panel(session_reruns):
+    """Sidebar panel with stage timings and cache hit rates (when metrics are enabled)."""
+    with st.expander("⏱️ Performance"):
+        st.caption(f"Reruns: {METRICS.reruns} in this process, {session_reruns} in this session")
+        stages = pd.DataFrame(
+            [(name, last * 1000, total / runs * 1000, peak * 1000, runs)
+             for name, (runs, total, last, peak) in list(METRICS.stages.items())],
+            columns=['Stage', 'Last ms', 'Mean ms', 'Max ms', 'Runs'],
+        )
+        st.dataframe(stages, hide_index=True, width='stretch',
+                     column_config={column: st.column_config.NumberColumn(format="%.1f")
+                                    for column in ['Last ms', 'Mean ms', 'Max ms']})
+        caches = [(name, lookups - misses, misses) for name, (lookups, misses) in list(METRICS.caches.items())]
+        caches += [(name, info.hits, info.misses) for name, info in list(METRICS.lru.items())]
+        caches = pd.DataFrame(caches, columns=['Cache', 'Hits', 'Misses'])
+        caches['Hit rate'] = (100 * caches['Hits'] / (caches['Hits'] + caches['Misses']).clip(lower=1)).round()
+        st.dataframe(caches, hide_index=True, width='stretch',
+                     column_config={'Hit rate': st.column_config.NumberColumn(format="%d%%")})
+        st.download_button("⬇️ Prometheus metrics", METRICS.prometheus_text(), file_name="tccf_metrics.prom",
+                           mime='text/plain', on_click='ignore')
+
+
+def round_filters(names, options, score_range):
+    """Sidebar filters of the cross-round view; returns them as one hashable tuple."""
+    rounds = st.multiselect("Rounds", names, default=names)
+    recommendation = st.selectbox("Recommendation", ['All'] + options['RECOMMENDATION'])
+    science_level = st.selectbox("Science Level", ['All'] + options['SCIENCE_LEVEL'])
+    stage = st.selectbox("Stage", ['All'] + options['Stage'])
+    if score_range is not None and score_range[0] < score_range[1]:
+        score_range = st.slider("Weighted score", score_range[0], score_range[1], score_range, step=0.01)
+    return tuple(rounds), recommendation, science_level, stage, score_range
+
+
+def render_round_overview(store, filters):
+    """Compare rounds: counts and scores per round and the best applicants, all computed in the store."""
+    counts, top = round_overview(store.version(), filters, store)
+    applicants = int(counts['applicants'].sum())
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Applicants", applicants)
+    with col2:
+        st.metric("Rounds", counts['round'].nunique())
+    with col3:
+        avg_score = (counts['applicants'] * counts['mean_score']).sum() / applicants if applicants else 0
+        st.metric("Avg Score", f"{avg_score:.2f}")
+
+    if not applicants:
+        st.info("No applicants match these filters.")
+        return
+
+    st.markdown("#### Recommendations by Round")
+    st.plotly_chart(round_chart(tuple(counts[['round', 'RECOMMENDATION', 'applicants']].itertuples(index=False))),
+                    width='stretch')
+
+    by_round = counts.pivot_table(index='round', columns='RECOMMENDATION', values='applicants', aggfunc='sum',
+                                  fill_value=0).rename_axis(columns=None)
+    totals = counts.groupby('round')['applicants'].sum()
+    by_round['Total'] = totals
+    by_round['Avg score'] = (counts['applicants'] * counts['mean_score']).groupby(counts['round']).sum() / totals
+    st.dataframe(by_round.reset_index().rename(columns={'round': 'Round'}), hide_index=True,
+                 width='stretch', column_config={'Avg score': st.column_config.NumberColumn(format="%.2f")})
+
+    st.markdown(f"### 🏆 Top {len(top)} Applicants Across Rounds")
+    st.dataframe(top.rename(columns={'round': 'Round'}), hide_index=True, width='stretch',
+                 column_config={'WEIGHTED_SCORE': st.column_config.NumberColumn(format="%.2f")})
+
+
+@METRICS.timed('rerun')
 def main():
+    configure_page()
+    METRICS.rerun()
+    
     # Sidebar
     with st.sidebar:
         # Logos
@@ -281,23 +614,68 @@ def main():
         st.markdown("---")
         st.markdown("### 🎯 Filters")
         
+        # Past rounds imported into the round store (python rounds.py import ...)
+        store = RoundStore(ROUNDS_DB)
+        selected_round = LIVE_ROUND
+        if store.exists():
+            names, options, score_range = round_options(store.version(), store)
+            if names:
+                selected_round = st.selectbox("Round", [LIVE_ROUND] + names + [ALL_ROUNDS])
+        if selected_round == ALL_ROUNDS:
+            overview_filters = round_filters(names, options, score_range)
+    
+    # Cross-round comparison, queried from the store without loading the rounds
+    if selected_round == ALL_ROUNDS:
+        st.markdown(PAGE_HEADER, unsafe_allow_html=True)
+        with METRICS.stage('round_overview'):
+            render_round_overview(store, overview_filters)
+        return
+    
+    with st.sidebar:
         # Load data
-        df = load_data()
-        if df is None:
+        with METRICS.stage('load_data'):
+            if selected_round == LIVE_ROUND:
+                dataset = load_data()
+            else:
+                dataset = round_data(selected_round, store.version(), store)
+        if dataset is None:
             return
         
+        # Pick up applications added since the last rerun (a stat call when unchanged)
+        with METRICS.stage('refresh'):
+            refreshed = dataset.refresh()
+        if refreshed.added or refreshed.updated or refreshed.removed:
+            removed = f", {refreshed.removed} removed" if refreshed.removed else ""
+            st.toast(f"Loaded {refreshed.added} new and {refreshed.updated} updated applications{removed}")
+        # One shared dataset; this session only gets a read-only view of it
+        df, filter_index, version, renders, texts, duplicates, similarity = dataset.snapshot()
+        
+        # Re-rank with the committee's weights (the CSV scores are the defaults)
+        weights, thresholds = scoring_controls()
+        if weights != DEFAULT_WEIGHTS or thresholds != DEFAULT_THRESHOLDS:
+            with METRICS.stage('rescore'):
+                df, filter_index, renders = rescored_data(
+                    version, tuple(weights.items()), tuple(thresholds.items()), df, filter_index, renders)
+        
         # Recommendation filter
-        recommendations = ['All'] + sorted(df['RECOMMENDATION'].unique().tolist())
+        recommendations = ['All'] + filter_index.options('RECOMMENDATION')
         selected_rec = st.selectbox("Recommendation", recommendations)
         
         # Science level filter
-        science_levels = ['All'] + sorted(df['SCIENCE_LEVEL'].unique().tolist())
+        science_levels = ['All'] + filter_index.options('SCIENCE_LEVEL')
         selected_science = st.selectbox("Science Level", science_levels)
         
         # Stage filter
-        stages = ['All'] + sorted(df['Stage'].dropna().unique().tolist())
+        stages = ['All'] + filter_index.options('Stage')
         selected_stage = st.selectbox("Stage", stages)
         
+        # Target country filter (applicant counts from the country bridge)
+        country_counts = filter_index.geo.counts
+        selected_country = st.selectbox(
+            "Target country", ['All'] + list(country_counts),
+            format_func=lambda country: country if country == 'All' else f"{country} ({country_counts[country]})"
+        )
+        
         # Search
         search = st.text_input("🔍 Search ventures", "")
         
@@ -308,49 +686,21 @@ def main():
         st.markdown("### 📊 Quick Stats")
         
         st.metric("Total Applicants", len(df))
-        st.metric("Science Innovations", len(df[df['SCIENCE_LEVEL'].str.contains('★★', na=False)]))
-        st.metric("Top Recommendations", len(df[df['RECOMMENDATION'].str.contains('RECOMMEND', na=False)]))
+        st.metric("Science Innovations", int(filter_index.science_only.sum()))
+        st.metric("Top Recommendations", filter_index.count_containing('RECOMMENDATION', 'RECOMMEND'))
+        
+        # Full reload for edits the incremental refresh can't follow (affects every session)
+        st.caption(f"Data version: {version}")
+        st.button("🔄 Reload data", on_click=dataset.invalidate)
     
     # Main content header
-    st.markdown("""
-    <div style="text-align: center; padding: 1rem 0 2rem;">
-        <span style="background: rgba(0, 212, 170, 0.2); border: 1px solid rgba(0, 212, 170, 0.3); 
-              padding: 0.5rem 1.5rem; border-radius: 100px; color: #00d4aa; font-size: 0.85rem;
-              text-transform: uppercase; letter-spacing: 0.1em;">
-            🔬 Science-Based Innovation Evaluation
-        </span>
-        <h1 style="font-size: 2.5rem; margin: 1rem 0 0.5rem; background: linear-gradient(135deg, #ff6b4a, #00d4aa);
-            -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 700;">
-            Africa's Boldest Plastic Solutions
-        </h1>
-        <p style="color: #8ba3c7; font-size: 1rem; max-width: 700px; margin: 0 auto;">
-            Identifying scientists, innovators, and startups for $120K in funding
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Apply filters
-    filtered_df = df.copy()
-    
-    if selected_rec != 'All':
-        filtered_df = filtered_df[filtered_df['RECOMMENDATION'] == selected_rec]
-    
-    if selected_science != 'All':
-        filtered_df = filtered_df[filtered_df['SCIENCE_LEVEL'] == selected_science]
+    st.markdown(PAGE_HEADER, unsafe_allow_html=True)
     
-    if selected_stage != 'All':
-        filtered_df = filtered_df[filtered_df['Stage'] == selected_stage]
-    
-    if search:
-        mask = (
-            filtered_df['Venture_Name'].str.contains(search, case=False, na=False) |
-            filtered_df['WHAT_THEY_DO'].str.contains(search, case=False, na=False) |
-            filtered_df['Location'].str.contains(search, case=False, na=False)
-        )
-        filtered_df = filtered_df[mask]
-    
-    if science_only:
-        filtered_df = filtered_df[filtered_df['SCIENCE_LEVEL'].str.contains('★★', na=False)]
+    # Apply filters (memoized row positions, no frame copy)
+    filters = (selected_rec, selected_science, selected_stage, search, science_only, selected_country)
+    with METRICS.stage('filter'):
+        positions = filter_index.filter(*filters)
+        filtered_df = df.iloc[positions]
     
     # Summary metrics row
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -380,158 +730,82 @@ def main():
     # Charts row
     col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown("#### Science Level Distribution")
-        if len(filtered_df) > 0:
-            science_counts = filtered_df['SCIENCE_LEVEL'].value_counts()
-            fig = px.pie(
-                values=science_counts.values,
-                names=science_counts.index,
-                color_discrete_sequence=['#00d4aa', '#4fffdb', '#fbbf24', '#f87171', '#94a3b8'],
-                hole=0.4
-            )
-            fig.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white', size=10),
-                showlegend=True,
-                legend=dict(bgcolor='rgba(0,0,0,0)', font=dict(size=9)),
-                margin=dict(t=20, b=20, l=20, r=20),
-                height=300
-            )
-            st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        st.markdown("#### Score Distribution")
-        if len(filtered_df) > 0:
-            fig = px.histogram(
-                filtered_df,
-                x='WEIGHTED_SCORE',
-                nbins=20,
-                color_discrete_sequence=['#00d4aa']
-            )
-            fig.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
-                xaxis=dict(gridcolor='rgba(255,255,255,0.1)', title='Weighted Score'),
-                yaxis=dict(gridcolor='rgba(255,255,255,0.1)', title='Count'),
-                margin=dict(t=20, b=40, l=40, r=20),
-                height=300
-            )
-            st.plotly_chart(fig, use_container_width=True)
+    with METRICS.stage('charts'):
+        # Pre-aggregated per filter state; figures are cached on the binned data
+        science_counts, score_counts, score_edges = filter_index.distributions(*filters)
+        
+        with col1:
+            st.markdown("#### Science Level Distribution")
+            if science_counts:
+                st.plotly_chart(science_pie(science_counts), width='stretch')
+        
+        with col2:
+            st.markdown("#### Score Distribution")
+            if score_counts:
+                st.plotly_chart(score_histogram(score_counts, score_edges), width='stretch')
+    
+    # Per-country totals of the filtered rows, from the country bridge
+    with METRICS.stage('country_map'):
+        country_totals = filter_index.country_totals(*filters)
+        if any(row[1] for row in country_totals):
+            st.markdown("#### Target Countries")
+            metric = st.radio("Map metric", list(MAP_METRICS), horizontal=True, label_visibility='collapsed')
+            st.plotly_chart(country_map(country_totals, metric), width='stretch')
+    
+    # Same venture submitted more than once (clustered once per dataset version)
+    if len(duplicates.members):
+        with st.expander(f"🧬 Possible duplicates: {duplicates.n_clusters} ventures, "
+                         f"{len(duplicates.members)} applications"), METRICS.stage('duplicates'):
+            render_duplicates(df, duplicates)
     
     st.markdown("---")
     
     # Applicants section
     st.markdown(f"### 🏆 Applicants ({len(filtered_df)} shown)")
     
-    # Sort options
-    sort_col = st.selectbox(
-        "Sort by",
-        ['WEIGHTED_SCORE', 'Score_Innovation_30%', 'Score_Impact_25%', 'Venture_Name'],
-        index=0
-    )
+    # Sort options (search results can keep their relevance ranking)
+    sort_options = SORT_COLUMNS
+    if search.strip():
+        sort_options = ['Relevance'] + sort_options
+    sort_col = st.selectbox("Sort by", sort_options, index=0)
+    with METRICS.stage('sort'):
+        sorted_df = sort_rows(filtered_df, sort_col)
+    
+    # Export exactly what is listed; files are written on click, in row batches
+    col1, col2, _ = st.columns([1, 1, 4])
+    for column, fmt in zip((col1, col2), ('csv', 'xlsx')):
+        with column:
+            st.download_button(
+                f"⬇️ Export {fmt.upper()}",
+                data=functools.partial(export_file, sorted_df, fmt, texts),
+                file_name=f"tccf_shortlist.{fmt}",
+                mime=EXPORT_FORMATS[fmt],
+                on_click='ignore',
+            )
     
-    sorted_df = filtered_df.sort_values(sort_col, ascending=(sort_col == 'Venture_Name'))
+    # Matched excerpts for the visible rows when searching
+    snippet = None
+    if search.strip():
+        def snippet(label):
+            return filter_index.search_index.snippet(df.index.get_loc(label), search)
     
-    # Display each applicant
-    for idx, row in sorted_df.iterrows():
-        science_emoji = get_science_emoji(row['SCIENCE_LEVEL'])
-        
-        with st.expander(
-            f"{science_emoji} **{row['Venture_Name']}** — Score: {row['WEIGHTED_SCORE']:.2f} | {row['RECOMMENDATION']}"
-        ):
-            # Evaluation Summary Box
-            st.markdown("""
-            <div class="eval-box">
-                <div class="eval-title">📋 Evaluation Summary</div>
-            </div>
-            """, unsafe_allow_html=True)
-            st.markdown(generate_eval_summary(row))
-            
-            # Score Breakdown
-            st.markdown('<p class="section-title">Score Breakdown</p>', unsafe_allow_html=True)
-            
-            score_cols = st.columns(5)
-            scores = [
-                ('Innovation', '30%', row['Score_Innovation_30%']),
-                ('Impact', '25%', row['Score_Impact_25%']),
-                ('Social', '20%', row['Score_Social_20%']),
-                ('Commercial', '15%', row['Score_Commercial_15%']),
-                ('Team', '10%', row['Score_Team_10%'])
-            ]
-            
-            for i, (label, weight, score) in enumerate(scores):
-                with score_cols[i]:
-                    pct = float(score) * 20
-                    st.markdown(f"""
-                    <div class="score-box">
-                        <div class="score-value">{score}</div>
-                        <div class="score-label">{label} ({weight})</div>
-                        <div style="background: rgba(255,255,255,0.1); height: 4px; border-radius: 2px; margin-top: 0.5rem;">
-                            <div style="width: {pct}%; height: 100%; background: #00d4aa; border-radius: 2px;"></div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            # Contact & Basic Info
-            st.markdown('<p class="section-title">Contact & Basic Information</p>', unsafe_allow_html=True)
-            
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.markdown(f"**Contact:** {row['Contact']}")
-                st.markdown(f"**Email:** {row['Email']}")
-            with col2:
-                st.markdown(f"**Location:** {row['Location']}")
-                st.markdown(f"**Stage:** {row['Stage']}")
-            with col3:
-                st.markdown(f"**Legal Status:** {row['Legal_Status']}")
-                if 'LinkedIn' in row and pd.notna(row.get('LinkedIn')) and row.get('LinkedIn'):
-                    st.markdown(f"[LinkedIn Profile]({row['LinkedIn']})")
-            with col4:
-                st.markdown(f"**Target Countries:** {row['Target_Countries']}")
-                if 'Website' in row and pd.notna(row.get('Website')) and row.get('Website'):
-                    st.markdown(f"[Website]({row['Website']})")
-            
-            # Impact Metrics
-            st.markdown('<p class="section-title">Impact Metrics</p>', unsafe_allow_html=True)
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Plastic Impact", f"{row['Plastic_Tonnes']} tonnes")
-            with col2:
-                st.metric("Livelihoods", f"{row['Livelihoods']} people")
-            with col3:
-                if 'Beneficiaries' in row and pd.notna(row.get('Beneficiaries')) and row.get('Beneficiaries'):
-                    ben = str(row['Beneficiaries'])[:200]
-                    st.markdown(f"**Beneficiaries:** {ben}...")
-            
-            # Application Content
-            has_content = False
-            for field in ['Science_Inputs', 'Bold_Characteristics', 'Problem_Addressed', 'Team_Info']:
-                if field in row and pd.notna(row.get(field)) and row.get(field):
-                    has_content = True
-                    break
-            
-            if has_content:
-                st.markdown('<p class="section-title">Application Content</p>', unsafe_allow_html=True)
-                
-                if 'Science_Inputs' in row and pd.notna(row.get('Science_Inputs')) and row.get('Science_Inputs'):
-                    st.markdown("**🔬 Science & Technical Inputs:**")
-                    st.info(str(row['Science_Inputs'])[:800])
-                
-                if 'Bold_Characteristics' in row and pd.notna(row.get('Bold_Characteristics')) and row.get('Bold_Characteristics'):
-                    st.markdown("**💡 Bold Characteristics:**")
-                    st.info(str(row['Bold_Characteristics'])[:500])
-                
-                if 'Problem_Addressed' in row and pd.notna(row.get('Problem_Addressed')) and row.get('Problem_Addressed'):
-                    st.markdown("**🎯 Problem Addressed:**")
-                    st.info(str(row['Problem_Addressed'])[:400])
-                
-                if 'Team_Info' in row and pd.notna(row.get('Team_Info')) and row.get('Team_Info'):
-                    st.markdown("**👥 Team Information:**")
-                    st.info(str(row['Team_Info'])[:500])
+    # Display the current page; details are only built for opened rows
+    list_key = filters + (sort_col,)
+    def rendered(label):
+        return renders[df.index.get_loc(label)]
+    
+    def long_text(label):
+        return long_text_blocks(texts.row(df.index.get_loc(label)))
+    
+    def similar(label):
+        return [
+            (df['Venture_Name'].iat[position], df['RECOMMENDATION'].iat[position],
+             df['WEIGHTED_SCORE'].iat[position], score)
+            for position, score in similarity.similar(df.index.get_loc(label))
+        ]
+    
+    with METRICS.stage('applicant_list'):
+        render_applicant_list(sorted_df, list_key, rendered, long_text, similar, snippet)
     
     # Footer
     st.markdown("---")
@@ -542,6 +816,19 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
+    # Timings and cache hit rates, only when TCCF_METRICS* is set
+    if METRICS.enabled:
+        for name in ['filter', 'distributions', 'country_totals']:
+            METRICS.lru_info(name, getattr(filter_index, name).cache_info())
+        METRICS.lru_info('similar', similarity.similar.cache_info())
+        st.session_state['reruns'] = st.session_state.get('reruns', 0) + 1
+        with st.sidebar:
+            performance_panel(st.session_state['reruns'])
+        if METRICS_FILE:
+            METRICS.write(METRICS_FILE)
+        if METRICS_PORT:
+            METRICS.serve(METRICS_PORT)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+import data_loading
+
+ROOT = Path(__file__).resolve().parent.parent
+EVAL_CSV = ROOT / 'TCCF_Bold_Ideas_FINAL.csv'
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """The dashboard over the sample evaluations only, with its data cache in tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_loading, 'EVAL_PATHS', [str(EVAL_CSV)])
+    monkeypatch.setattr(data_loading, 'APPLICATION_PATHS', [])
+    st.cache_resource.clear()
+    at = AppTest.from_file(str(ROOT / 'streamlit_app.py'), default_timeout=120).run()
+    assert not at.exception
+    yield at
+    st.cache_resource.clear()
+
+
+def widget(elements, label):
+    return next(element for element in elements if element.label == label)
+
+
+def page_ids(at):
+    """IDs of the applicants on the current page, from their detail toggles."""
+    return [int(toggle.key.removeprefix('open_')) for toggle in at.toggle]
+
+
+def test_applicant_list_pages_through_every_applicant(app):
+    evaluations = pd.read_csv(EVAL_CSV)
+    n_applicants = len(evaluations)
+    assert widget(app.selectbox, 'Per page').value == 25
+    page = widget(app.number_input, f'Page (of {-(-n_applicants // 25)})')
+    assert page.value == 1 and widget(app.button, '◀ Prev').disabled
+
+    seen = []
+    while True:
+        ids = page_ids(app)
+        seen.extend(ids)
+        next_button = widget(app.button, 'Next ▶')
+        if next_button.disabled:
+            break
+        assert len(ids) == 25
+        next_button.click().run()
+        assert not app.exception
+    # Best score first, every applicant exactly once
+    assert seen == evaluations.sort_values('WEIGHTED_SCORE', ascending=False)['ID'].tolist()
+
+
+def test_page_resets_when_the_filters_change(app):
+    widget(app.button, 'Next ▶').click().run()
+    assert app.number_input[0].value == 2
+    widget(app.selectbox, 'Stage').set_value('Lab or pilot testing').run()
+    assert app.number_input[0].value == 1
+    assert widget(app.button, '◀ Prev').disabled
+
+
+def test_page_size_and_on_demand_details(app):
+    widget(app.selectbox, 'Per page').set_value(10).run()
+    assert len(page_ids(app)) == 10
+    # Details are only drawn for an opened applicant
+    assert not any('class="score-box"' in element.value for element in app.markdown)
+    app.toggle[0].set_value(True).run()
+    assert not app.exception
+    assert sum('class="score-box"' in element.value for element in app.markdown) == 1
@@ -0,0 +1,34 @@
+import base64
+import gzip
+import json
+
+import pandas as pd
+
+from build_dashboard import build_payload, search_index
+
+
+def unpack(encoded):
+    return json.loads(gzip.decompress(base64.b64decode(encoded)))
+
+
+def test_payload_round_trips_columns_and_text_chunks():
+    df = pd.DataFrame({
+        'Venture_Name': ['A', 'B', 'C'],
+        'RECOMMENDATION': ['SHORTLIST', 'SHORTLIST', 'CONSIDER'],
+        'WEIGHTED_SCORE': [3.5, None, 2.25],
+        'Science_Inputs': ['Pyrolysis of plastic', None, 'Seaweed film'],
+    })
+    payload = build_payload(df, chunk_rows=2)
+    main = unpack(payload['main'])
+    assert main['length'] == 3
+    assert main['columns']['WEIGHTED_SCORE'] == [3.5, None, 2.25]
+    assert 'Science_Inputs' not in main['columns']
+    assert [unpack(chunk)['Science_Inputs'] for chunk in payload['text']] == [['Pyrolysis of plastic', ''],
+                                                                              ['Seaweed film']]
+
+
+def test_search_index_lists_the_chunks_of_every_word():
+    df = pd.DataFrame({'Science_Inputs': ['Plastic pyrolysis.', 'plastic bags', None, 'Seaweed film']})
+    index = search_index(df, ['Science_Inputs'], chunk_rows=2)
+    chunks = dict(zip(index['words'], index['chunks']))
+    assert chunks == {'plastic': [0], 'pyrolysis.': [0], 'bags': [0], 'seaweed': [1], 'film': [1]}
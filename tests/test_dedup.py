@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dedup import SIGNATURE_CACHE, SIMILARITY_THRESHOLD, DuplicateIndex, document_keys
+
+EVAL_CSV = Path(__file__).resolve().parent.parent / 'TCCF_Bold_Ideas_FINAL.csv'
+
+
+@pytest.fixture(scope='module')
+def evaluations():
+    return pd.read_csv(EVAL_CSV)
+
+
+def clusters(df, index):
+    ids = df['ID'].to_numpy()
+    return {frozenset(ids[index.cluster == head].tolist()) for head in np.unique(index.cluster[index.members])}
+
+
+def test_sample_finds_only_the_resubmissions(evaluations):
+    index = DuplicateIndex(evaluations)
+    assert clusters(evaluations, index) == {frozenset({99, 7}), frozenset({53, 3})}
+
+
+def test_renamed_resubmission_is_found_and_members_match_their_head(evaluations):
+    original = evaluations.iloc[[0]]
+    df = pd.concat([evaluations, original.assign(ID=1001, Venture_Name=original['Venture_Name'].str.strip() + ' Ltd')],
+                   ignore_index=True)
+    index = DuplicateIndex(df)
+    assert frozenset({evaluations['ID'].iat[0], 1001}) in clusters(df, index)
+    members = index.members
+    head_signatures = index.signatures[index.cluster[members]]
+    estimated = (index.signatures[members] == head_signatures).mean(axis=1)
+    assert (estimated >= SIMILARITY_THRESHOLD).all()
+    np.testing.assert_allclose(index.similarity[members], estimated)
+
+
+def test_updated_matches_a_full_rebuild(evaluations):
+    index = DuplicateIndex(evaluations.iloc[:100].reset_index(drop=True))
+    updated = index.updated(evaluations, np.arange(100, len(evaluations)))
+    np.testing.assert_array_equal(updated.cluster, DuplicateIndex(evaluations).cluster)
+
+
+def test_signature_cache_holds_only_the_current_rows(tmp_path, evaluations):
+    first = evaluations.iloc[:60].reset_index(drop=True)
+    DuplicateIndex.cached(first, None, tmp_path)
+    DuplicateIndex.cached(evaluations, None, tmp_path)
+    index = DuplicateIndex.cached(first, None, tmp_path)
+    with np.load(tmp_path / SIGNATURE_CACHE) as cache:
+        assert np.array_equal(np.sort(cache['keys']), np.unique(document_keys(first)))
+    np.testing.assert_array_equal(index.signatures, DuplicateIndex(first).signatures)
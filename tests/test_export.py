@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from export import export_file, main, write_csv, write_xlsx
+from text_store import TextStore
+
+EVAL_CSV = Path(__file__).resolve().parent.parent / 'TCCF_Bold_Ideas_FINAL.csv'
+
+
+@pytest.fixture
+def shortlist():
+    """(rows, texts): three applicants with float32 scores and their long text in a TextStore."""
+    rows = pd.DataFrame({
+        'ID': [1, 2, 3],
+        'Venture_Name': ['Côte Recyclers', 'Bioplastic Labs', 'Pyrolysis Fuel'],
+        'WEIGHTED_SCORE': np.array([3.71, np.nan, 2.05], dtype=np.float32),
+        'LinkedIn': ['https://linkedin.com/in/a', '', None],
+    })
+    texts = TextStore.from_frame(pd.DataFrame({
+        'Science_Inputs': ['Cassava starch\nfilm, "enzymatic"', None, 'Pyrolysis\x0b oil'],
+        'Team_Info': ['Two chemists', 'A founder', None],
+    }), ['Science_Inputs', 'Team_Info'])
+    return rows, texts
+
+
+EXPECTED_COLUMNS = ['ID', 'Venture_Name', 'WEIGHTED_SCORE', 'Science_Inputs', 'Team_Info', 'LinkedIn']
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 5000])
+def test_csv_has_every_row_with_long_text_before_linkedin(shortlist, tmp_path, batch_size):
+    rows, texts = shortlist
+    path = tmp_path / 'shortlist.csv'
+    write_csv(rows, path, batch_size, texts)
+    exported = pd.read_csv(path)
+    assert exported.columns.tolist() == EXPECTED_COLUMNS
+    assert exported['Venture_Name'].tolist() == rows['Venture_Name'].tolist()
+    assert exported['Science_Inputs'].tolist()[::2] == ['Cassava starch\nfilm, "enzymatic"', 'Pyrolysis\x0b oil']
+    assert exported['Team_Info'].isna().tolist() == [False, False, True]
+    np.testing.assert_allclose(exported['WEIGHTED_SCORE'], [3.71, np.nan, 2.05], rtol=1e-6)
+
+
+def test_csv_of_reordered_rows_keeps_each_rows_text(shortlist, tmp_path):
+    rows, texts = shortlist
+    path = tmp_path / 'shortlist.csv'
+    write_csv(rows.iloc[[2, 0]], path, texts=texts)
+    exported = pd.read_csv(path)
+    assert exported['ID'].tolist() == [3, 1]
+    assert exported['Team_Info'].fillna('').tolist() == ['', 'Two chemists']
+
+
+def test_empty_csv_has_the_header(shortlist, tmp_path):
+    rows, texts = shortlist
+    path = tmp_path / 'empty.csv'
+    write_csv(rows.iloc[:0], path, texts=texts)
+    assert path.read_text().strip() == ','.join(EXPECTED_COLUMNS)
+
+
+def test_xlsx_holds_the_same_values(shortlist, tmp_path):
+    rows, texts = shortlist
+    path = tmp_path / 'shortlist.xlsx'
+    write_xlsx(rows, path, 2, texts)
+    sheet = load_workbook(path)['Applicants']
+    values = list(sheet.values)
+    assert list(values[0]) == EXPECTED_COLUMNS
+    assert [list(row) for row in values[1:]] == [
+        [1, 'Côte Recyclers', 3.71, 'Cassava starch\nfilm, "enzymatic"', 'Two chemists', 'https://linkedin.com/in/a'],
+        # Empty strings are written as empty cells; characters Excel rejects are dropped
+        [2, 'Bioplastic Labs', None, None, 'A founder', None],
+        [3, 'Pyrolysis Fuel', 2.05, 'Pyrolysis oil', None, None],
+    ]
+
+
+def test_export_file_is_rewound(shortlist):
+    rows, texts = shortlist
+    f = export_file(rows, 'csv', texts)
+    assert f.read().decode('utf-8').startswith(','.join(EXPECTED_COLUMNS))
+
+
+def test_cli_exports_the_filtered_rows(tmp_path, monkeypatch, capsys):
+    # The data cache goes to the working directory
+    monkeypatch.chdir(tmp_path)
+    evaluations = pd.read_csv(EVAL_CSV)
+    output = tmp_path / 'shortlist.csv'
+    main([str(output), '--eval', str(EVAL_CSV), '--recommendation', 'LOW PRIORITY'])
+    exported = pd.read_csv(output)
+    low_priority = evaluations[evaluations['RECOMMENDATION'] == 'LOW PRIORITY']
+    assert sorted(exported['ID']) == sorted(low_priority['ID'])
+    assert exported['WEIGHTED_SCORE'].is_monotonic_decreasing
+    assert f'Exported {len(low_priority)} applicants' in capsys.readouterr().err
+
+    main([str(output), '--eval', str(EVAL_CSV), '--search', 'plastic'])
+    exported = pd.read_csv(output)
+    assert 0 < len(exported) < len(evaluations)
+    assert set(exported['ID']) <= set(evaluations['ID'])
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from filters import HISTOGRAM_BINS, FilterIndex
+from geo import split_countries
+
+EVAL_CSV = Path(__file__).resolve().parent.parent / 'TCCF_Bold_Ideas_FINAL.csv'
+# (recommendation, science level, stage, search, science only, country)
+STATES = [
+    ('All', 'All', 'All', '', False, 'All'),
+    ('LOW PRIORITY', 'All', 'All', '', False, 'All'),
+    ('All', '? UNCLEAR - Review needed', 'Early-Market Entry', '', False, 'All'),
+    ('All', 'All', 'All', '', True, 'All'),
+    ('All', 'All', 'Lab or pilot testing', '', False, 'Kenya'),
+    ('CONSIDER', 'All', 'All', '', True, 'Tanzania'),
+    ('No such tier', 'All', 'All', '', False, 'All'),
+]
+
+
+@pytest.fixture(scope='module')
+def evaluations():
+    return pd.read_csv(EVAL_CSV)
+
+
+def expected_positions(df, recommendation, science_level, stage, search, science_only, country):
+    """The rows a plain pandas mask selects for a filter state without a search."""
+    mask = pd.Series(True, index=df.index)
+    for column, value in (('RECOMMENDATION', recommendation), ('SCIENCE_LEVEL', science_level), ('Stage', stage)):
+        if value != 'All':
+            mask &= df[column] == value
+    if science_only:
+        mask &= df['SCIENCE_LEVEL'].str.contains('★★', regex=False).fillna(False)
+    if country != 'All':
+        mask &= df['Target_Countries'].map(lambda value: country in split_countries(value))
+    return np.flatnonzero(mask.to_numpy())
+
+
+@pytest.mark.parametrize('state', STATES)
+def test_filter_matches_a_pandas_mask(evaluations, state):
+    index = FilterIndex(evaluations)
+    np.testing.assert_array_equal(index.filter(*state), expected_positions(evaluations, *state))
+
+
+def test_search_keeps_only_filtered_hits_in_relevance_order(evaluations):
+    index = FilterIndex(evaluations)
+    hits, _ = index.search_index.search('plastic')
+    low_priority = set(np.flatnonzero(evaluations['RECOMMENDATION'] == 'LOW PRIORITY'))
+    positions = index.filter('LOW PRIORITY', 'All', 'All', 'plastic', False, 'All')
+    assert len(positions) > 0
+    assert positions.tolist() == [hit for hit in hits.tolist() if hit in low_priority]
+
+
+def test_updated_matches_a_rebuild(evaluations):
+    index = FilterIndex(evaluations)
+    changed = pd.concat([evaluations, evaluations.iloc[:5].assign(ID=range(1001, 1006))], ignore_index=True)
+    changed.loc[0, 'RECOMMENDATION'] = 'CONSIDER'
+    changed.loc[1, 'SCIENCE_LEVEL'] = '★★★ STRONG SCIENCE - Process Innovation'
+    changed.loc[2, 'Target_Countries'] = 'Kenya'
+    # The only Other-stage rows move to another stage, so that value disappears
+    changed.loc[changed['Stage'] == 'Other', 'Stage'] = 'Early-Market Entry'
+    positions = np.concatenate([[0, 1, 2], np.flatnonzero(evaluations['Stage'] == 'Other'),
+                                np.arange(len(evaluations), len(changed))])
+
+    patched = index.updated(changed, positions)
+    rebuilt = FilterIndex(changed)
+    assert patched.options('Stage') == rebuilt.options('Stage')
+    assert patched.counts == rebuilt.counts
+    for state in STATES + [('All', 'All', 'Other', '', False, 'All')]:
+        np.testing.assert_array_equal(patched.filter(*state), expected_positions(changed, *state))
+    # The earlier version still answers for the rows it was built over
+    np.testing.assert_array_equal(index.filter(*STATES[1]), expected_positions(evaluations, *STATES[1]))
+
+
+@pytest.mark.parametrize('state', STATES)
+def test_distributions_match_the_filtered_rows(evaluations, state):
+    science_counts, score_counts, score_edges = FilterIndex(evaluations).distributions(*state)
+    rows = evaluations.iloc[expected_positions(evaluations, *state)]
+    assert dict(science_counts) == rows['SCIENCE_LEVEL'].value_counts().to_dict()
+    assert [count for _, count in science_counts] == sorted(rows['SCIENCE_LEVEL'].value_counts(), reverse=True)
+    if rows.empty:
+        assert score_counts == score_edges == ()
+    else:
+        counts, edges = np.histogram(rows['WEIGHTED_SCORE'].dropna(), bins=HISTOGRAM_BINS)
+        assert score_counts == tuple(counts.tolist())
+        np.testing.assert_allclose(score_edges, edges, atol=1e-6)
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from geo import COUNTRY_CODES, GeoIndex, normalize_country, split_countries
+
+
+@pytest.mark.parametrize('name, country', [
+    ('Kenya', 'Kenya'),
+    ('  kenya ', 'Kenya'),
+    ('Rwande', 'Rwanda'),
+    ('DRC', 'Democratic Republic of the Congo'),
+    ('Congo (DRC)', 'Democratic Republic of the Congo'),
+    ('Congo-Kinshasa', 'Democratic Republic of the Congo'),
+    ('Congo', 'Republic of the Congo'),
+    ('Ivory Coast', "Cote d'Ivoire"),
+    ("Côte d'Ivoire", "Cote d'Ivoire"),
+    ('Swaziland', 'Eswatini'),
+    ('Cape Verde', 'Cabo Verde'),
+    ('The Gambia', 'Gambia'),
+    ('United Republic of Tanzania', 'Tanzania'),
+    ('guinea bissau', 'Guinea-Bissau'),
+])
+def test_aliases_and_spellings_map_to_the_canonical_name(name, country):
+    assert normalize_country(name) == country
+    assert country in COUNTRY_CODES
+
+
+def test_unknown_names_are_kept_whitespace_normalized():
+    assert normalize_country('  Pan   Africa ') == 'Pan Africa'
+
+
+def test_split_drops_blanks_and_repeats():
+    assert split_countries('Kenya, Tanzania , Uganda ') == ['Kenya', 'Tanzania', 'Uganda']
+    assert split_countries('DRC, Democratic Republic of the Congo,, Swaziland') == [
+        'Democratic Republic of the Congo', 'Eswatini']
+    assert split_countries(np.nan) == []
+
+
+@pytest.fixture
+def applicants():
+    return pd.DataFrame({
+        'Target_Countries': ['Kenya, Tanzania ', 'kenya', None, 'Ivory Coast, Ghana', 'Kenya, Tanzania '],
+        'Plastic_Tonnes': [10.0, 5.0, 1.0, 'n/a', 2.0],
+        'Livelihoods': [100, 50, 10, 20, None],
+    })
+
+
+def test_positions_and_totals(applicants):
+    index = GeoIndex(applicants)
+    assert index.positions('Kenya').tolist() == [0, 1, 4]
+    assert index.positions("Cote d'Ivoire").tolist() == [3]
+    assert index.positions('Mars').tolist() == []
+    assert index.counts == {"Cote d'Ivoire": 1, 'Ghana': 1, 'Kenya': 3, 'Tanzania': 2}
+
+    scores = np.array([4.0, 2.0, 3.0, np.nan, 3.0])
+    totals = index.totals(np.array([True, True, True, True, False]), scores)
+    assert [total[:5] for total in totals] == [
+        ('Kenya', 'KEN', 2, 15.0, 150.0),
+        ("Cote d'Ivoire", 'CIV', 1, 0.0, 20.0),
+        ('Ghana', 'GHA', 1, 0.0, 20.0),
+        ('Tanzania', 'TZA', 1, 10.0, 100.0),
+    ]
+    # Mean score over the scored rows only
+    np.testing.assert_array_equal([total[5] for total in totals], [3.0, np.nan, np.nan, 4.0])
+
+
+def test_updated_matches_a_rebuild(applicants):
+    index = GeoIndex(applicants)
+    changed = pd.concat([applicants, pd.DataFrame({'Target_Countries': ['Rwande'], 'Plastic_Tonnes': [3.0],
+                                                   'Livelihoods': [30]})], ignore_index=True)
+    changed.loc[3, 'Target_Countries'] = 'Kenya'
+    patched = index.updated(changed, [3, 5])
+    rebuilt = GeoIndex(changed)
+    assert patched.counts == rebuilt.counts
+    for country in rebuilt.counts:
+        assert patched.positions(country).tolist() == rebuilt.positions(country).tolist()
+    mask, scores = np.ones(len(changed), dtype=bool), np.arange(len(changed), dtype=float)
+    assert patched.totals(mask, scores) == rebuilt.totals(mask, scores)
+    # Ghana and Cote d'Ivoire are no longer targeted; the old version still has them
+    assert 'Ghana' not in patched.counts and 'Ghana' in index.counts
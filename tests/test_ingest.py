@@ -0,0 +1,97 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'benchmarks'))
+
+from data_loading import load_compact  # noqa: E402
+from ingest import LiveDataset, RefreshResult  # noqa: E402
+from synthetic import make_applications, make_evaluations  # noqa: E402
+
+APPLICANTS = 300
+# Rows held back from the files the dataset is loaded from, then appended
+HELD_BACK = 40
+
+
+def append_csv(path, rows):
+    with open(path, 'a', encoding='utf-8') as f:
+        rows.to_csv(f, header=False, index=False)
+
+
+@pytest.fixture(params=[False, True], ids=['eager', 'lazy'])
+def live(request, tmp_path):
+    """(dataset, evaluations, applications, eval_path, app_path) loaded without the held-back rows."""
+    evaluations = make_evaluations(APPLICANTS)
+    applications = make_applications(evaluations)
+    eval_path, app_path = tmp_path / 'eval.csv', tmp_path / 'apps.csv'
+    evaluations.iloc[:-HELD_BACK].to_csv(eval_path, index=False)
+    applications.iloc[:-HELD_BACK].to_csv(app_path, index=False)
+    dataset = LiveDataset(str(eval_path), str(app_path), cache_dir=tmp_path / 'cache', lazy=request.param)
+    return dataset, evaluations, applications, eval_path, app_path
+
+
+def assert_matches_fresh_load(dataset, eval_path, app_path, cache_dir):
+    """The snapshot holds the same rows, values and long text as loading the files from scratch."""
+    snapshot = dataset.snapshot()
+    fresh, fresh_texts = load_compact(str(eval_path), str(app_path), cache_dir, lazy=dataset._lazy)
+    frame = snapshot.frame.reset_index(drop=True)
+    order = pd.Index(frame['ID']).get_indexer(fresh['ID'])
+    assert len(frame) == len(fresh) and (order >= 0).all()
+    pd.testing.assert_frame_equal(frame.iloc[order].reset_index(drop=True), fresh.reset_index(drop=True),
+                                  check_dtype=False, check_categorical=False)
+    pd.testing.assert_frame_equal(snapshot.texts.frame(order).reset_index(drop=True),
+                                  fresh_texts.frame(np.arange(len(fresh))).reset_index(drop=True))
+
+
+def test_append_evaluations(live, tmp_path):
+    dataset, evaluations, _, eval_path, app_path = live
+    append_csv(eval_path, evaluations.iloc[-HELD_BACK:])
+    assert dataset.refresh() == RefreshResult(HELD_BACK, 0)
+    assert_matches_fresh_load(dataset, eval_path, app_path, tmp_path / 'fresh')
+
+
+def test_append_applications(live, tmp_path):
+    dataset, _, applications, eval_path, app_path = live
+    append_csv(app_path, applications.iloc[-HELD_BACK:])
+    assert dataset.refresh().added == 0
+    assert_matches_fresh_load(dataset, eval_path, app_path, tmp_path / 'fresh')
+
+
+def test_rewrite_evaluations(live, tmp_path):
+    dataset, evaluations, _, eval_path, app_path = live
+    changed = evaluations.copy()
+    changed.loc[5, 'Venture_Name'] = 'Renamed Venture'
+    changed.loc[7, 'WEIGHTED_SCORE'] = 1.23
+    changed.to_csv(eval_path, index=False)
+    assert dataset.refresh() == RefreshResult(HELD_BACK, 2)
+    assert_matches_fresh_load(dataset, eval_path, app_path, tmp_path / 'fresh')
+
+
+def test_rewrite_applications(live, tmp_path):
+    dataset, _, applications, eval_path, app_path = live
+    changed = applications.iloc[:-HELD_BACK].copy()
+    changed.loc[3, 'Science Inputs'] = 'A rewritten science statement.'
+    changed.to_csv(app_path, index=False)
+    dataset.refresh()
+    assert_matches_fresh_load(dataset, eval_path, app_path, tmp_path / 'fresh')
+
+
+def test_remove_evaluation(live, tmp_path):
+    dataset, evaluations, _, eval_path, app_path = live
+    kept = evaluations.iloc[:-HELD_BACK].drop(index=10)
+    kept.to_csv(eval_path, index=False)
+    assert dataset.refresh() == RefreshResult(0, len(kept), 1)
+    assert evaluations['ID'].iat[10] not in set(dataset.snapshot().frame['ID'])
+    assert_matches_fresh_load(dataset, eval_path, app_path, tmp_path / 'fresh')
+
+
+def test_remove_application(live, tmp_path):
+    dataset, evaluations, applications, eval_path, app_path = live
+    loaded = pd.Index(evaluations['Email'].iloc[:-HELD_BACK].str.lower())
+    merged = np.flatnonzero(loaded.get_indexer(applications['Email'].iloc[:-HELD_BACK].str.strip().str.lower()) >= 0)
+    applications.iloc[:-HELD_BACK].drop(index=merged[0]).to_csv(app_path, index=False)
+    dataset.refresh()
+    assert_matches_fresh_load(dataset, eval_path, app_path, tmp_path / 'fresh')
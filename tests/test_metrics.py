@@ -0,0 +1,40 @@
+import socket
+import threading
+
+from metrics import Metrics
+
+
+def test_concurrent_writes_leave_one_complete_file(tmp_path):
+    metrics = Metrics(enabled=True)
+    with metrics.stage('load_data'):
+        pass
+    path = tmp_path / 'tccf.prom'
+    errors = []
+
+    def write():
+        try:
+            for _ in range(50):
+                metrics.write(path)
+        except OSError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert path.read_text(encoding='utf-8') == metrics.prometheus_text()
+    assert [p.name for p in tmp_path.iterdir()] == ['tccf.prom']
+
+
+def test_serve_reports_a_busy_port_once(capsys):
+    with socket.socket() as busy:
+        busy.bind(('127.0.0.1', 0))
+        busy.listen()
+        port = busy.getsockname()[1]
+        metrics = Metrics(enabled=True)
+        assert metrics.serve(port) is None
+        assert metrics.serve(port) is None
+    assert capsys.readouterr().err.count('Metrics endpoint disabled') == 1
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rendering import BENEFICIARIES_CHARS, PLASTIC_SENTENCE, RenderCache, long_text_blocks, render_rows
+
+EVAL_CSV = Path(__file__).resolve().parent.parent / 'TCCF_Bold_Ideas_FINAL.csv'
+
+
+@pytest.fixture(scope='module')
+def evaluations():
+    return pd.read_csv(EVAL_CSV)
+
+
+def applicant(**values):
+    row = {
+        'ID': 1, 'Venture_Name': 'Côte Recyclers', 'Contact': 'Ama <Mensah>', 'Email': 'ama@example.org',
+        'Location': 'Accra', 'Stage': 'Early-Market Entry', 'Legal_Status': 'Registered',
+        'WHAT_THEY_DO': 'Plastic to pavers', 'SCIENCE_LEVEL': '★★★ STRONG SCIENCE - Process Innovation',
+        'Target_Countries': 'Ghana, Togo', 'Plastic_Tonnes': 250.0, 'Livelihoods': 40,
+        'Score_Innovation_30%': 4.5, 'Score_Impact_25%': 4.0, 'Score_Social_20%': 3.5,
+        'Score_Commercial_15%': 3.0, 'Score_Team_10%': 4.0,
+        'WEIGHTED_SCORE': np.float32(3.71), 'RECOMMENDATION': '★ STRONGLY RECOMMEND',
+        'LinkedIn': 'https://linkedin.com/in/ama', 'Website': '',
+    }
+    row.update(values)
+    return pd.DataFrame([row])
+
+
+def test_markup_of_one_applicant():
+    [rendered] = render_rows(applicant())
+    assert rendered.label == '🔬 **Côte Recyclers** — Score: 3.71 | ★ STRONGLY RECOMMEND'
+    assert '**strong scientific innovation**' in rendered.summary
+    assert '*Plastic to pavers*' in rendered.summary and '**3.71/5.0**' in rendered.summary
+    assert rendered.summary.endswith(PLASTIC_SENTENCE.format(plastic=250.0))
+    assert rendered.scores.count('class="score-box"') == 5
+    assert 'width: 90.0%' in rendered.scores
+    assert 'Ama &lt;Mensah&gt;' in rendered.contact
+    assert 'LinkedIn Profile' in rendered.contact and 'Website</a>' not in rendered.contact
+    assert rendered.impact == ('250.0 tonnes', '40 people')
+
+
+@pytest.mark.parametrize('recommendation, phrase', [
+    ('SHORTLIST', 'promising science-enabled solution'),
+    ('CONSIDER', 'some scientific elements'),
+    ('MAYBE - Limited science', 'limited scientific differentiation'),
+    ('LOW PRIORITY', 'science-based innovation threshold'),
+])
+def test_summary_follows_the_recommendation(recommendation, phrase):
+    [rendered] = render_rows(applicant(RECOMMENDATION=recommendation))
+    assert phrase in rendered.summary
+    # Only recommended applicants get the plastic impact sentence
+    assert 'Projected plastic impact' not in rendered.summary
+
+
+def test_long_text_blocks_skip_missing_fields_and_truncate():
+    beneficiaries, content = long_text_blocks({
+        'Science_Inputs': 'x' * 1000, 'Bold_Characteristics': None, 'Problem_Addressed': '',
+        'Team_Info': 'Two chemists', 'Beneficiaries': 'y' * 500,
+    })
+    assert beneficiaries == f"**Beneficiaries:** {'y' * BENEFICIARIES_CHARS}..."
+    assert [heading for heading, _ in content] == ['**🔬 Science & Technical Inputs:**', '**👥 Team Information:**']
+    assert content[0][1] == 'x' * 800
+    assert long_text_blocks({'Beneficiaries': None}) == ('', ())
+
+
+def test_cache_matches_render_rows(evaluations):
+    cache = RenderCache(evaluations)
+    assert len(cache) == len(evaluations)
+    assert [cache[i] for i in range(len(cache))] == render_rows(evaluations)
+
+
+def test_updated_re_renders_only_changed_rows(evaluations):
+    cache = RenderCache(evaluations)
+    changed = pd.concat([evaluations, evaluations.iloc[[0]].assign(ID=1001)], ignore_index=True)
+    changed.loc[3, 'WEIGHTED_SCORE'] = 1.0
+    positions = [3, 5, len(evaluations)]
+    patched = cache.updated(changed, positions)
+
+    assert [patched[i] for i in range(len(patched))] == render_rows(changed)
+    assert 'Score: 1.00' in patched[3].label
+    # Rows outside positions keep their markup objects; the old version is unaffected
+    assert patched[10] is cache[10] and patched[5] == cache[5]
+    assert cache[3] == render_rows(evaluations.iloc[[3]])[0]
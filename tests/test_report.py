@@ -0,0 +1,72 @@
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from report import build_report, main, parse_threshold, parse_weight, tier_slug
+from scoring import TIERS
+
+ROOT = Path(__file__).resolve().parent.parent
+EVAL_CSV = ROOT / 'TCCF_Bold_Ideas_FINAL.csv'
+
+
+@pytest.fixture(scope='module')
+def evaluations():
+    return pd.read_csv(EVAL_CSV)
+
+
+def test_tier_slugs():
+    assert tier_slug('★ STRONGLY RECOMMEND') == 'strongly-recommend'
+    assert tier_slug('MAYBE - Limited science') == 'maybe-limited-science'
+    assert len({tier_slug(tier) for tier in TIERS}) == len(TIERS)
+
+
+def test_weight_and_threshold_arguments():
+    assert parse_weight('innovation=40') == ('Score_Innovation_30%', 40.0)
+    assert parse_threshold('shortlist=3.1') == ('shortlist', 3.1)
+    for parse, text in [(parse_weight, 'Luck=5'), (parse_weight, 'Team=high'), (parse_threshold, 'best=4')]:
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse(text)
+
+
+def test_report_has_every_applicant_of_each_tier(evaluations, tmp_path):
+    written = build_report(evaluations, None, tmp_path, TIERS)
+    counts = evaluations['RECOMMENDATION'].value_counts()
+    assert {tier: count for tier, count, *_ in written} == counts.to_dict()
+    for tier, count, mean, csv_name, md_name in written:
+        shortlist = pd.read_csv(tmp_path / csv_name)
+        assert len(shortlist) == count
+        assert shortlist['WEIGHTED_SCORE'].is_monotonic_decreasing
+        assert mean == pytest.approx(shortlist['WEIGHTED_SCORE'].mean())
+        assert (tmp_path / md_name).read_text(encoding='utf-8').count('\n### ') == count
+    overview = (tmp_path / 'report.md').read_text(encoding='utf-8')
+    assert f'{len(evaluations)} applicants evaluated' in overview
+
+
+def test_worker_processes_write_the_same_summaries(evaluations, tmp_path):
+    tiers = ['LOW PRIORITY', 'SHORTLIST']
+    build_report(evaluations, None, tmp_path / 'serial', tiers, top=50)
+    build_report(evaluations, None, tmp_path / 'pool', tiers, top=50, workers=2)
+    for name in ['low-priority.md', 'shortlist.md', 'low-priority.csv']:
+        assert (tmp_path / 'pool' / name).read_bytes() == (tmp_path / 'serial' / name).read_bytes()
+    assert len(pd.read_csv(tmp_path / 'serial' / 'low-priority.csv')) == 50
+
+
+def test_cli_filters_and_rescores(tmp_path, monkeypatch):
+    # The data cache goes to the working directory
+    monkeypatch.chdir(tmp_path)
+    main([str(tmp_path / 'out'), '--eval', str(EVAL_CSV), '--recommendation', 'SHORTLIST',
+          '--recommendation', 'CONSIDER', '--threshold', 'shortlist=2.5', '--search', 'plastic', '--workers', '1'])
+    # The lower threshold moves every plastic match out of CONSIDER
+    assert sorted(path.name for path in (tmp_path / 'out').iterdir()) == ['report.md', 'shortlist.csv', 'shortlist.md']
+    shortlist = pd.read_csv(tmp_path / 'out' / 'shortlist.csv')
+    assert len(shortlist) > 0 and (shortlist['RECOMMENDATION'] == 'SHORTLIST').all()
+
+
+def test_import_does_not_load_streamlit():
+    code = 'import sys, report; print("streamlit" in sys.modules, "plotly" in sys.modules)'
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ['False', 'False']
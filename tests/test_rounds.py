@@ -0,0 +1,28 @@
+from pathlib import Path
+
+import rounds
+from rounds import RoundStore, main, round_cache_dir
+
+EVAL_CSV = Path(__file__).resolve().parent.parent / 'TCCF_Bold_Ideas_FINAL.csv'
+
+
+def test_import_leaves_the_live_cache_alone(tmp_path, monkeypatch):
+    live = tmp_path / 'live-cache'
+    live.mkdir()
+    (live / 'manifest.json').write_text('{"live": true}')
+    (live / 'merged-live.parquet').write_bytes(b'live')
+    (live / 'text-live.npz').write_bytes(b'live')
+    monkeypatch.setattr(rounds, 'CACHE_DIR', live)
+    monkeypatch.chdir(tmp_path)
+
+    main(['--db', str(tmp_path / 'rounds.sqlite'), 'import', '2025', '--eval', str(EVAL_CSV)])
+
+    assert sorted(path.name for path in live.iterdir()) == ['manifest.json', 'merged-live.parquet', 'text-live.npz']
+    assert (live / 'manifest.json').read_text() == '{"live": true}'
+    assert RoundStore(tmp_path / 'rounds.sqlite').rounds()['applicants'].tolist() == [138]
+
+
+def test_round_cache_dirs_are_separate(tmp_path):
+    first, second = round_cache_dir('2024', tmp_path), round_cache_dir('2025', tmp_path)
+    assert first.is_dir() and second.is_dir() and first != second
+    assert round_cache_dir('2024', tmp_path) == first
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scoring import (CSV_SCORE_TOLERANCE, DEFAULT_THRESHOLDS, DEFAULT_WEIGHTS, SCORE_COLUMNS, recommendations,
+                     rescore, weighted_scores)
+
+EVAL_CSV = Path(__file__).resolve().parent.parent / 'TCCF_Bold_Ideas_FINAL.csv'
+
+
+@pytest.fixture(scope='module')
+def evaluations():
+    return pd.read_csv(EVAL_CSV)
+
+
+def test_default_weights_come_from_column_names():
+    assert DEFAULT_WEIGHTS == {
+        'Score_Innovation_30%': 0.30, 'Score_Impact_25%': 0.25, 'Score_Social_20%': 0.20,
+        'Score_Commercial_15%': 0.15, 'Score_Team_10%': 0.10,
+    }
+    assert list(DEFAULT_WEIGHTS) == SCORE_COLUMNS
+
+
+# The tolerance is in decimal units; 1e-9 absorbs binary floating-point error
+def test_default_weights_reproduce_weighted_score(evaluations):
+    scores = weighted_scores(evaluations)
+    np.testing.assert_allclose(scores, evaluations['WEIGHTED_SCORE'], rtol=0, atol=CSV_SCORE_TOLERANCE + 1e-9)
+
+
+def test_default_thresholds_reproduce_tiers(evaluations):
+    tiers = recommendations(evaluations['WEIGHTED_SCORE'].to_numpy(),
+                            evaluations['Score_Innovation_30%'].to_numpy(), evaluations['SCIENCE_LEVEL'])
+    assert list(np.asarray(tiers, dtype=object)) == list(evaluations['RECOMMENDATION'])
+
+
+def test_rescore_with_defaults_keeps_tiers(evaluations):
+    rescored = rescore(evaluations)
+    assert list(rescored['RECOMMENDATION'].astype(object)) == list(evaluations['RECOMMENDATION'])
+    np.testing.assert_allclose(rescored['WEIGHTED_SCORE'], evaluations['WEIGHTED_SCORE'], rtol=0,
+                               atol=CSV_SCORE_TOLERANCE + 1e-9)
+
+
+def test_weights_are_normalized(evaluations):
+    doubled = {column: 2 * weight for column, weight in DEFAULT_WEIGHTS.items()}
+    np.testing.assert_array_equal(weighted_scores(evaluations, doubled), weighted_scores(evaluations))
+
+
+def test_thresholds_move_tiers(evaluations):
+    strict = rescore(evaluations, thresholds={**DEFAULT_THRESHOLDS, 'not_recommended': 5.0})
+    assert set(strict['RECOMMENDATION'].astype(object)) == {'NOT RECOMMENDED'}
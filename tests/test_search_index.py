@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from search_index import MAX_SEGMENTS, SearchIndex, fold, tokenize
+from text_store import TextStore
+
+
+@pytest.fixture
+def ventures():
+    return pd.DataFrame({
+        'Venture_Name': ['Côte Recyclers', 'Bioplastic Labs', 'Pyrolysis Fuel', 'Seaweed Wraps'],
+        'WHAT_THEY_DO': ['Plastic collection', 'Cassava starch bioplastic film', 'Plastic to fuel', None],
+        'Location': ['Abidjan', 'Lagos', 'Nairobi', 'Dar es Salaam'],
+    })
+
+
+def hits(index, query):
+    return index.search(query)[0].tolist()
+
+
+def test_tokens_are_accent_and_case_folded():
+    assert fold('Côte d’Ivoire') == 'cote d’ivoire'
+    assert tokenize('Bio-Plastic, CÔTE!') == ['bio', 'plastic', 'cote']
+
+
+def test_every_query_term_must_match(ventures):
+    index = SearchIndex(ventures)
+    assert sorted(hits(index, 'plastic ')) == [0, 2]
+    assert hits(index, 'plastic fuel ') == [2]
+    assert hits(index, 'plastic seaweed ') == []
+    assert hits(index, '   ') == []
+
+
+def test_last_term_matches_as_a_prefix(ventures):
+    index = SearchIndex(ventures)
+    assert sorted(hits(index, 'bioplas')) == [1]
+    assert sorted(hits(index, 'plas')) == [0, 2]
+    # Not while typing a new word, and not for very short prefixes
+    assert hits(index, 'plas ') == []
+    assert hits(index, 'pl') == []
+
+
+def test_accents_fold_both_ways(ventures):
+    index = SearchIndex(ventures)
+    assert hits(index, 'cote') == [0]
+    assert hits(index, 'CÔTE') == [0]
+    assert 'Venture Name: **Côte**' in index.snippet(0, 'cote')
+
+
+def test_more_frequent_terms_rank_higher():
+    df = pd.DataFrame({'Venture_Name': ['Plastic', 'Plastic plastic plastic', 'Other']})
+    positions, scores = SearchIndex(df).search('plastic ')
+    assert positions.tolist() == [1, 0]
+    assert scores[0] > scores[1] > 0
+
+
+def test_long_fields_are_read_from_the_text_store(ventures):
+    texts = TextStore.from_frame(pd.DataFrame({'Science_Inputs': [None, 'Enzymatic depolymerisation', None, None]}),
+                                 ['Science_Inputs'])
+    index = SearchIndex(ventures, texts=texts)
+    assert hits(index, 'enzymatic') == [1]
+    assert index.snippet(1, 'enzymatic').startswith('Science Inputs: **Enzymatic**')
+
+
+def test_updated_matches_a_rebuild(ventures):
+    index = SearchIndex(ventures)
+    changed = pd.concat([ventures, pd.DataFrame({'Venture_Name': ['Fuel Bricks'], 'WHAT_THEY_DO': ['Plastic bricks'],
+                                                 'Location': ['Kumasi']})], ignore_index=True)
+    changed.loc[0, 'WHAT_THEY_DO'] = 'Glass collection'
+    patched = index.updated(changed, [0, len(ventures)])
+    rebuilt = SearchIndex(changed)
+    for query in ['plastic ', 'glass', 'fuel', 'brick', 'plastic fuel', 'cote']:
+        # Scores may differ slightly: document frequencies count superseded postings
+        assert sorted(hits(patched, query)) == sorted(hits(rebuilt, query)), query
+    # Row 0 no longer matches what it said before; the old version still does
+    assert 0 not in hits(patched, 'plastic ')
+    assert 0 in hits(index, 'plastic ')
+
+
+def test_updates_past_max_segments_rebuild(ventures):
+    index = SearchIndex(ventures)
+    for i in range(MAX_SEGMENTS + 1):
+        ventures.loc[1, 'Venture_Name'] = f'Version{i}'
+        index = index.updated(ventures, [1])
+    assert len(index.segments) < MAX_SEGMENTS
+    assert hits(index, f'version{MAX_SEGMENTS}') == [1]
+    assert hits(index, 'version0 ') == []
+
+
+def test_cached_index_is_reused_for_the_same_rows(ventures, tmp_path):
+    path = tmp_path / 'search.npz'
+    built = SearchIndex.cached(ventures, None, path)
+    loaded = SearchIndex.cached(ventures, None, path)
+    assert path.exists()
+    for query in ['plastic', 'cote', 'lagos']:
+        np.testing.assert_array_equal(loaded.search(query)[0], built.search(query)[0])
+        np.testing.assert_allclose(loaded.search(query)[1], built.search(query)[1])
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parent.parent / 'benchmarks'
+sys.path.insert(0, str(BENCH_DIR))
+
+from bench_sessions import MAX_MB_PER_SESSION, check_session_memory  # noqa: E402
+
+# Small enough to run in about half a minute; the per-session bound doesn't depend on the size
+APPLICANTS = 1_000
+
+
+def test_check_session_memory_bounds_growth_per_session():
+    assert check_session_memory([(1, 200.0), (10, 200.0), (40, 239.0)]) == pytest.approx(1.0)
+    with pytest.raises(AssertionError):
+        check_session_memory([(1, 200.0), (40, 200.0 + 39 * (MAX_MB_PER_SESSION + 0.5))])
+
+
+def test_sessions_share_one_dataset():
+    # A fresh process: the app reads its data paths from the environment at import, and
+    # RSS must not include what other tests allocated
+    result = subprocess.run([sys.executable, str(BENCH_DIR / 'bench_sessions.py'), str(APPLICANTS)],
+                            capture_output=True, text=True, timeout=600)
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert 'MB per additional session' in result.stdout
@@ -0,0 +1,102 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from text_store import LazyTextStore, TextStore, csv_records
+
+FIELDS = ['Science_Inputs', 'Team_Info']
+
+
+@pytest.fixture
+def texts():
+    return pd.DataFrame({
+        'Science_Inputs': ['Cassava starch film', None, 'Côte d’Ivoire: 10 t/yr\nof PET', ''],
+        'Team_Info': ['Two chemists', 'A founder 🌱', None, 'Three engineers'],
+    })
+
+
+def assert_holds(store, texts):
+    assert len(store) == len(texts)
+    for position, row in enumerate(texts.to_dict('records')):
+        expected = {field: value if isinstance(value, str) else None for field, value in row.items()}
+        assert store.row(position) == expected
+    order = np.array([2, 0, 3, 0])
+    pd.testing.assert_frame_equal(store.frame(order), texts.iloc[order].reset_index(drop=True), check_dtype=False)
+
+
+def test_built_store_round_trips(texts, tmp_path):
+    store = TextStore.build(texts, FIELDS, tmp_path / 'text')
+    assert_holds(store, texts)
+    assert_holds(TextStore.open(tmp_path / 'text'), texts)
+    assert_holds(TextStore.from_frame(texts, FIELDS), texts)
+    assert store.get(0, 'Unknown_Field') is None
+
+
+def test_missing_store_raises(tmp_path):
+    with pytest.raises(OSError):
+        TextStore.open(tmp_path / 'absent')
+
+
+def test_updated_overrides_and_appends(texts, tmp_path):
+    store = TextStore.build(texts, FIELDS, tmp_path / 'text')
+    changed = pd.concat([texts, pd.DataFrame({'Science_Inputs': ['Seaweed wraps'], 'Team_Info': [None]})],
+                        ignore_index=True)
+    changed.loc[1, 'Science_Inputs'] = 'Pyrolysis'
+    updated = store.updated(changed.iloc[[1, 4]], [1, 4], len(changed))
+    assert_holds(updated, changed)
+    # The original store still reads the rows it was built from
+    assert_holds(store, texts)
+
+
+def test_csv_records_start_at_each_record():
+    data = '\ufeffEmail,Science Inputs\na@x.org,"two\nlines"\nb@x.org,one line\n'.encode('utf-8')
+    records = list(csv_records(io.BytesIO(data)))
+    assert [fields for _, fields in records] == [['Email', 'Science Inputs'], ['a@x.org', 'two\nlines'],
+                                                 ['b@x.org', 'one line']]
+    for offset, fields in records[1:]:
+        assert next(csv_records(io.BytesIO(data[offset:])))[1] == fields
+
+
+def lazy_store(path, emails):
+    """A LazyTextStore over the export at path for applicants with the given emails."""
+    with open(path, 'rb') as f:
+        records = list(csv_records(f))[1:]
+    offsets = {fields[0].strip().casefold(): offset for offset, fields in reversed(records)}
+    keys = np.array([email.casefold() for email in emails], dtype=object)
+    sources = {'Science_Inputs': ('Science Inputs', 12), 'Team_Info': ('Team', None)}
+    return LazyTextStore(str(path), np.array([offsets.get(key, -1) for key in keys]), keys, sources)
+
+
+@pytest.fixture
+def export(tmp_path):
+    path = tmp_path / 'apps.csv'
+    pd.DataFrame({
+        'Email': [' B@X.org', 'a@x.org', 'c@x.org', 'a@x.org'],
+        'Science Inputs': ['Cassava starch film', 'Pyrolysis\nof PET', 'NA', 'A later duplicate'],
+        'Other': ['', '', '', ''],
+        'Team': ['Two chemists', None, 'Three engineers', 'Nobody'],
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_lazy_store_reads_records_like_the_merge(export):
+    store = lazy_store(export, ['a@x.org', 'b@x.org', 'c@x.org', 'nobody@x.org'])
+    # Truncated to the field's limit, missing cells as '' (as the merge stores them), no record as None
+    expected = pd.DataFrame({'Science_Inputs': ['Pyrolysis\nof', 'Cassava star', '', None],
+                             'Team_Info': ['', 'Two chemists', 'Three engineers', None]})
+    assert_holds(store, expected)
+
+    updated = store.updated(pd.DataFrame({'Science_Inputs': ['Seaweed'], 'Team_Info': [None]}), [1], 5)
+    assert updated.row(1) == {'Science_Inputs': 'Seaweed', 'Team_Info': None}
+    assert updated.row(4) == {'Science_Inputs': None, 'Team_Info': None}
+    assert store.get(1, 'Science_Inputs') == 'Cassava star'
+
+
+def test_lazy_store_ignores_a_record_that_changed_hands(export):
+    store = lazy_store(export, ['a@x.org', 'b@x.org'])
+    # Rewritten with other applicants at the same offsets
+    export.write_text(export.read_text().replace('a@x.org', 'z@x.org'))
+    assert store.row(0) == {'Science_Inputs': None, 'Team_Info': None}
+    assert store.get(1, 'Team_Info') == 'Two chemists'
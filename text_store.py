@@ -0,0 +1,263 @@
+"""
+TCCF Bold Ideas - long text store
+
+Keeps the long application fields out of the in-memory frame. The text of
+every row lives in one UTF-8 blob file that is memory-mapped and decoded
+only when a field is read (a detail view opening, a search snippet, an
+export batch), with a small offset table per row and field.
+
+LazyTextStore has the same interface but no blob: it keeps the byte offset
+of each row's record in the application export and parses that one record
+when the row is read.
+"""
+
+import csv
+import functools
+import mmap
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+MISSING = -1
+# Cells pandas.read_csv reads as missing by default; the CSV readers here do the same
+NA_TEXT = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+])
+ROW_CACHE_SIZE = 256
+
+
+def csv_records(f):
+    """(byte offset, fields) for every record of a binary CSV file from its current position.
+
+    Records may span lines (quoted newlines): csv.reader pulls exactly one
+    record's lines at a time, so a record starts where its first line did.
+    """
+    starts = []
+    position = f.tell()
+
+    def lines():
+        nonlocal position
+        for line in f:
+            starts.append(position)
+            position += len(line)
+            # A byte order mark can only open the file
+            yield line.decode('utf-8-sig' if starts[-1] == 0 else 'utf-8')
+
+    for fields in csv.reader(lines()):
+        yield starts[0], fields
+        starts.clear()
+
+
+class TextStore:
+    """Read-only text fields by row position, backed by a blob and offsets.
+
+    Missing values (NaN in the frame) come back as None. ``updated()``
+    returns a new store with some rows replaced or appended; the changed
+    rows are kept in memory and the blob stays shared and unmodified.
+    """
+
+    def __init__(self, fields, blob, starts, lengths, n_rows=None, overrides=None):
+        self.fields = list(fields)
+        self._field_no = {field: i for i, field in enumerate(self.fields)}
+        self._blob = blob
+        self._starts = starts
+        self._lengths = lengths
+        self.n_rows = len(starts) if n_rows is None else n_rows
+        self._overrides = overrides or {}
+
+    @staticmethod
+    def _encode(df, fields):
+        """Concatenate the UTF-8 text of df in row-major order; return blob and offsets."""
+        n_rows = len(df)
+        starts = np.zeros((n_rows, len(fields)), dtype=np.int64)
+        lengths = np.full((n_rows, len(fields)), MISSING, dtype=np.int32)
+        chunks, offset = [], 0
+        columns = [df[field].to_numpy(dtype=object) if field in df.columns else [None] * n_rows
+                   for field in fields]
+        for row, values in enumerate(zip(*columns)):
+            for i, value in enumerate(values):
+                if isinstance(value, str):
+                    data = value.encode('utf-8')
+                    starts[row, i], lengths[row, i] = offset, len(data)
+                    chunks.append(data)
+                    offset += len(data)
+        return b''.join(chunks), starts, lengths
+
+    @classmethod
+    def from_frame(cls, df, fields):
+        """An in-memory store for the given columns of df."""
+        blob, starts, lengths = cls._encode(df, fields)
+        return cls(fields, blob, starts, lengths)
+
+    @classmethod
+    def build(cls, df, fields, path):
+        """Write the given columns of df to path.bin / path.npz and open them."""
+        path = Path(path)
+        blob, starts, lengths = cls._encode(df, fields)
+        for suffix, write in (
+            ('.bin', lambda f: f.write(blob)),
+            ('.npz', lambda f: np.savez(f, fields=np.array(fields), starts=starts, lengths=lengths)),
+        ):
+            target = path.with_name(path.name + suffix)
+            tmp = target.with_name(target.name + f'.{os.getpid()}.tmp')
+            try:
+                with open(tmp, 'wb') as f:
+                    write(f)
+                os.replace(tmp, target)
+            finally:
+                if tmp.exists():
+                    tmp.unlink()
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map a store written by build(); raises OSError if absent."""
+        path = Path(path)
+        with np.load(path.with_name(path.name + '.npz')) as index:
+            fields, starts, lengths = index['fields'].tolist(), index['starts'], index['lengths']
+        with open(path.with_name(path.name + '.bin'), 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        return cls(fields, blob, starts, lengths)
+
+    def __len__(self):
+        return self.n_rows
+
+    def _decode(self, position, field_no):
+        if position >= len(self._starts):
+            return None
+        length = self._lengths[position, field_no]
+        if length == MISSING:
+            return None
+        start = self._starts[position, field_no]
+        return self._blob[start:start + length].decode('utf-8')
+
+    def get(self, position, field):
+        """Text of one field of one row, or None when missing."""
+        field_no = self._field_no.get(field)
+        if field_no is None:
+            return None
+        row = self._overrides.get(position)
+        if row is not None:
+            return row[field_no]
+        return self._decode(position, field_no)
+
+    def row(self, position):
+        """All fields of one row as a dict."""
+        return {field: self.get(position, field) for field in self.fields}
+
+    def frame(self, positions):
+        """The fields for the rows at positions, as an object-dtype DataFrame."""
+        positions = np.asarray(positions, dtype=np.int64)
+        columns = {field: np.full(len(positions), np.nan, dtype=object) for field in self.fields}
+        for i, position in enumerate(positions.tolist()):
+            for field in self.fields:
+                value = self.get(position, field)
+                if value is not None:
+                    columns[field][i] = value
+        return pd.DataFrame(columns)
+
+    def updated(self, rows, positions, n_rows):
+        """Return a store of n_rows where rows (a frame) replace those at positions."""
+        overrides = dict(self._overrides)
+        columns = [rows[field].to_numpy(dtype=object) if field in rows.columns else [None] * len(rows)
+                   for field in self.fields]
+        for position, values in zip(np.asarray(positions).tolist(), zip(*columns)):
+            overrides[position] = tuple(value if isinstance(value, str) else None for value in values)
+        return TextStore(self.fields, self._blob, self._starts, self._lengths, n_rows, overrides)
+
+
+class LazyTextStore:
+    """TextStore over the application export itself, for lazy mode.
+
+    ``offsets`` holds the byte offset of each row's record in the export
+    (-1 without an application) and ``sources`` maps each field to its
+    (export column, max characters). A read parses that one record; rows
+    read recently are cached. ``keys`` are the rows' normalized emails: a
+    record whose email no longer matches (the export was rewritten) reads
+    as missing until the dataset is reloaded. ``updated()`` works as in
+    TextStore.
+    """
+
+    def __init__(self, path, offsets, keys, sources, n_rows=None, overrides=None):
+        self.path = path
+        self.fields = list(sources)
+        self._field_no = {field: i for i, field in enumerate(self.fields)}
+        self._offsets = offsets
+        self._keys = keys
+        self._sources = sources
+        self.n_rows = len(offsets) if n_rows is None else n_rows
+        self._overrides = overrides or {}
+        with open(path, 'rb') as f:
+            _, header = next(csv_records(f), (0, []))
+        self._email_column = header.index('Email') if 'Email' in header else None
+        self._columns = [(header.index(source) if source in header else None, max_len)
+                         for source, max_len in sources.values()]
+        self._cached_values = functools.lru_cache(maxsize=ROW_CACHE_SIZE)(self._values)
+
+    def __len__(self):
+        return self.n_rows
+
+    def _parse(self, position, record):
+        """Field values of a row from its export record (as the eager merge stores them)."""
+        email = record[self._email_column] if self._email_column is not None and self._email_column < len(record) else ''
+        if email.strip().casefold() != self._keys[position]:
+            return (None,) * len(self.fields)
+        values = []
+        for column, max_len in self._columns:
+            value = record[column] if column is not None and column < len(record) else ''
+            value = '' if value in NA_TEXT else value
+            values.append(value[:max_len] if max_len is not None else value)
+        return tuple(values)
+
+    def _read(self, positions):
+        """Yield (position, values) for rows with an export record, reading in file order."""
+        positions = [p for p in positions if p < len(self._offsets) and self._offsets[p] >= 0]
+        with open(self.path, 'rb') as f:
+            for position in sorted(positions, key=lambda p: self._offsets[p]):
+                f.seek(self._offsets[position])
+                _, record = next(csv_records(f), (0, []))
+                yield position, self._parse(position, record)
+
+    def _values(self, position):
+        return next((values for _, values in self._read([position])), (None,) * len(self.fields))
+
+    def get(self, position, field):
+        """Text of one field of one row, or None when missing."""
+        field_no = self._field_no.get(field)
+        if field_no is None:
+            return None
+        row = self._overrides.get(position)
+        if row is None:
+            row = self._cached_values(position)
+        return row[field_no]
+
+    def row(self, position):
+        """All fields of one row as a dict."""
+        return {field: self.get(position, field) for field in self.fields}
+
+    def frame(self, positions):
+        """The fields for the rows at positions, as an object-dtype DataFrame."""
+        positions = np.asarray(positions, dtype=np.int64)
+        columns = {field: np.full(len(positions), np.nan, dtype=object) for field in self.fields}
+        rows = dict(self._read([p for p in set(positions.tolist()) if p not in self._overrides]))
+        rows.update(self._overrides)
+        for i, position in enumerate(positions.tolist()):
+            values = rows.get(position)
+            if values is not None:
+                for field, value in zip(self.fields, values):
+                    if value is not None:
+                        columns[field][i] = value
+        return pd.DataFrame(columns)
+
+    def updated(self, rows, positions, n_rows):
+        """Return a store of n_rows where rows (a frame) replace those at positions."""
+        overrides = dict(self._overrides)
+        columns = [rows[field].to_numpy(dtype=object) if field in rows.columns else [None] * len(rows)
+                   for field in self.fields]
+        for position, values in zip(np.asarray(positions).tolist(), zip(*columns)):
+            overrides[position] = tuple(value if isinstance(value, str) else None for value in values)
+        return LazyTextStore(self.path, self._offsets, self._keys, self._sources, n_rows, overrides)